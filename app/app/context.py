@@ -22,7 +22,7 @@ import json
 from django.conf import settings
 from django.utils import timezone
 
-from dashboard.models import Tip
+from dashboard.models import OpenWorkTotals, Tip
 
 
 def insert_settings(request):
@@ -51,6 +51,7 @@ def insert_settings(request):
         'env': settings.ENV,
         'email_key': email_key,
         'profile_id': profile.id if profile else '',
+        'amount_open_work': '{:,}'.format(round(OpenWorkTotals.get_cached('mainnet')['amount_usdt'])),
     }
     context['json_context'] = json.dumps(context)
 
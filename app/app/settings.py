@@ -434,6 +434,61 @@ GITHUB_EVENT_HOOK_URL = env('GITHUB_EVENT_HOOK_URL', default='github/payload/')
 # Web3
 WEB3_HTTP_PROVIDER = env('WEB3_HTTP_PROVIDER', default='https://rinkeby.infura.io')
 
+# Conversion rates are served from a process-local index refreshed every TTL seconds
+CONVERSION_RATE_INDEX_ENABLED = env.bool('CONVERSION_RATE_INDEX_ENABLED', default=True)
+CONVERSION_RATE_INDEX_TTL = env.int('CONVERSION_RATE_INDEX_TTL', default=60)
+
+# Bounties API responses are cached until the bounty data changes, for at most TIMEOUT seconds
+BOUNTIES_API_CACHE_ENABLED = env.bool('BOUNTIES_API_CACHE_ENABLED', default=True)
+BOUNTIES_API_CACHE_TIMEOUT = env.int('BOUNTIES_API_CACHE_TIMEOUT', default=300)
+# Per filter set timeouts keyed on the '+' joined filter names, eg: github_url+network=60 (0 disables caching)
+BOUNTIES_API_CACHE_TIMEOUTS = env.dict('BOUNTIES_API_CACHE_TIMEOUTS', cast={'value': int}, default={})
+
+# IPFS payloads are immutable, so they are kept by hash on disk (LRU bounded) and in memory
+IPFS_CACHE_ENABLED = env.bool('IPFS_CACHE_ENABLED', default=True)
+IPFS_CACHE_DIR = env('IPFS_CACHE_DIR', default='/tmp/gitcoin_ipfs_cache')
+IPFS_CACHE_MAX_BYTES = env.int('IPFS_CACHE_MAX_BYTES', default=512 * 1024 * 1024)
+IPFS_CACHE_HOT_ITEMS = env.int('IPFS_CACHE_HOT_ITEMS', default=2048)
+
+# sync/web3 queues a BountySyncJob for the process_sync_jobs worker instead of syncing within the request
+SYNC_WEB3_ASYNC = env.bool('SYNC_WEB3_ASYNC', default=True)
+SYNC_WEB3_JOB_MAX_ATTEMPTS = env.int('SYNC_WEB3_JOB_MAX_ATTEMPTS', default=6)
+SYNC_WEB3_JOB_BACKOFF = env.int('SYNC_WEB3_JOB_BACKOFF', default=3)
+
+# Bounty event notifications are queued in the NotificationOutbox and posted by process_notification_outbox
+NOTIFICATION_OUTBOX_ENABLED = env.bool('NOTIFICATION_OUTBOX_ENABLED', default=True)
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = env.int('NOTIFICATION_OUTBOX_MAX_ATTEMPTS', default=5)
+NOTIFICATION_OUTBOX_BACKOFF = env.int('NOTIFICATION_OUTBOX_BACKOFF', default=30)
+# The number of notifications posted concurrently per channel, eg: twitter=1,github=2
+NOTIFICATION_OUTBOX_CONCURRENCY = env.dict(
+    'NOTIFICATION_OUTBOX_CONCURRENCY', cast={'value': int},
+    default={'twitter': 1, 'slack': 2, 'user_slack': 4, 'github': 2, 'email': 4},
+)
+
+# The open work totals are served from the cache for this many seconds
+OPEN_WORK_TOTALS_CACHE_TIMEOUT = env.int('OPEN_WORK_TOTALS_CACHE_TIMEOUT', default=60)
+
+# The Github issues of new bounty revisions are fetched by process_issue_enrichment after the sync has committed
+ISSUE_ENRICHMENT_MAX_ATTEMPTS = env.int('ISSUE_ENRICHMENT_MAX_ATTEMPTS', default=5)
+ISSUE_ENRICHMENT_BACKOFF = env.int('ISSUE_ENRICHMENT_BACKOFF', default=60)
+
+# Bulk emails are sent to SENDGRID_BATCH_SIZE (at most 1000) recipients per request, at most this many requests a second
+SENDGRID_BATCH_SIZE = env.int('SENDGRID_BATCH_SIZE', default=1000)
+SENDGRID_REQUESTS_PER_SECOND = env.float('SENDGRID_REQUESTS_PER_SECOND', default=5)
+
+# The notification preferences of email subscribers are cached for this many seconds
+EMAIL_PREFERENCES_CACHE_TIMEOUT = env.int('EMAIL_PREFERENCES_CACHE_TIMEOUT', default=300)
+
+# sync_mail reads the MailChimp list PAGE_SIZE members a request, CONCURRENCY requests at a time,
+# and pushes new subscribers in batch operations of BATCH_SIZE.  API_URL overrides the API endpoint.
+MAILCHIMP_API_URL = env('MAILCHIMP_API_URL', default='')
+MAILCHIMP_PAGE_SIZE = env.int('MAILCHIMP_PAGE_SIZE', default=1000)
+MAILCHIMP_CONCURRENCY = env.int('MAILCHIMP_CONCURRENCY', default=4)
+MAILCHIMP_BATCH_SIZE = env.int('MAILCHIMP_BATCH_SIZE', default=500)
+
+# The bulk exports are only served to staff, or to requests bearing one of these keys as `Authorization: Token <key>`
+EXPORT_API_KEYS = env.list('EXPORT_API_KEYS', default=[])
+
 # COLO Coin
 COLO_ACCOUNT_ADDRESS = env('COLO_ACCOUNT_ADDRESS', default='')  # TODO
 COLO_ACCOUNT_PRIVATE_KEY = env('COLO_ACCOUNT_PRIVATE_KEY', default='')  # TODO
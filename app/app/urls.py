@@ -25,6 +25,7 @@ from django.views.i18n import JavaScriptCatalog
 
 import credits.views
 import dashboard.embed
+import dashboard.export
 import dashboard.helpers
 import dashboard.ios
 import dashboard.views
@@ -53,6 +54,7 @@ urlpatterns = [
     url(r'^api/v0.1/profile/(.*)?/keywords', dashboard.views.profile_keywords, name='profile_keywords'),
     url(r'^api/v0.1/funding/save/?', dashboard.ios.save, name='save'),
     url(r'^api/v0.1/faucet/save/?', faucet.views.save_faucet, name='save_faucet'),
+    re_path(r'^api/v0.1/export/(?P<name>\w+)/?$', dashboard.export.export, name='export'),
     url(r'^api/v0.1/', include(dbrouter.urls)),
     url(r'^api/v0.1/', include(ebrouter.urls)),
     url(r'^actions/api/v0.1/', include(dbrouter.urls)),  # same as active, but not cached in cluodfront
@@ -129,6 +131,7 @@ urlpatterns = [
     re_path(r'^static/avatar/(.*)/(.*)?', dashboard.embed.avatar, name='org_avatar'),
 
     # sync methods
+    re_path(r'^sync/web3/job/(?P<job_id>\d+)/?$', dashboard.views.sync_web3_job, name='sync_web3_job'),
     url(r'^sync/web3', dashboard.views.sync_web3, name='sync_web3'),
     url(r'^sync/get_amount?', dashboard.helpers.amount, name='helpers_amount'),
     url(r'^sync/get_issue_details?', dashboard.helpers.issue_details, name='helpers_issue_details'),
@@ -6,8 +6,9 @@ import time
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.gis.geoip2 import GeoIP2
-from django.db.models import Lookup
+from django.db.models import Case, Lookup, Value, When
 from django.db.models.fields import Field
+from django.db.models.functions import Cast
 from django.utils import timezone
 from django.utils.translation import LANGUAGE_SESSION_KEY
 
@@ -38,6 +39,35 @@ class NotEqual(Lookup):
         return f'%s <> %s' % (lhs, rhs), params
 
 
+def bulk_update(model, objs, fields, batch_size=500):
+    """Write the provided fields of many model instances back to the database.
+
+    Each batch is written with a single UPDATE using a CASE expression per
+    field, mirroring `QuerySet.bulk_update` from later Django releases.  No
+    save signals are sent.
+
+    Args:
+        model (django.db.models.Model): The model class of the instances.
+        objs (list): The saved model instances to write.
+        fields (list of str): The names of the fields to write.
+        batch_size (int): The number of instances written per query.
+
+    Returns:
+        int: The number of rows updated.
+
+    """
+    updated = 0
+    model_fields = [model._meta.get_field(name) for name in fields]
+    for start in range(0, len(objs), batch_size):
+        batch = objs[start:start + batch_size]
+        updates = {}
+        for field in model_fields:
+            whens = [When(pk=obj.pk, then=Value(getattr(obj, field.attname), output_field=field)) for obj in batch]
+            updates[field.attname] = Cast(Case(*whens, output_field=field), output_field=field)
+        updated += model.objects.filter(pk__in=[obj.pk for obj in batch]).update(**updates)
+    return updated
+
+
 def get_short_url(url):
     is_short = False
     for shortener in ['Tinyurl', 'Adfly', 'Isgd', 'QrCx']:
@@ -370,17 +370,36 @@ var wait_for_tx_to_mine_and_then_ping_server = function() {
           // refresh upon error
           document.location.href = document.location.href;
         };
+        var done = function(response) {
+          // clear local data
+          localStorage[document.issueURL] = '';
+          if (response['url']) {
+            document.location.href = response['url'];
+          } else {
+            document.location.href = document.location.href;
+          }
+        };
+        var poll = function(job_url) {
+          setTimeout(function() {
+            $.get(job_url, function(job) {
+              if (job.status == 'done') {
+                done(job);
+              } else if (job.status == 'failed') {
+                console.log('error from sync/web job', job);
+                error(job);
+              } else {
+                poll(job_url);
+              }
+            }).fail(error);
+          }, 3000);
+        };
         var success = function(response) {
           if (response.status == '200') {
             console.log('success from sync/web', response);
-
-            // clear local data
-            localStorage[document.issueURL] = '';
-            if (response['url']) {
-              document.location.href = response['url'];
-            } else {
-              document.location.href = document.location.href;
-            }
+            done(response);
+          } else if (response.status == '202') {
+            console.log('queued from sync/web', response);
+            poll(response['job_url']);
           } else {
             console.log('error from sync/web', response);
             error(response);
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Define shared pytest fixtures.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_conversion_rate_index():
+    """Drop rates cached by previous tests, whose rows were rolled back."""
+    from economy.utils import conversion_rate_index
+    conversion_rate_index.reset()
+    yield
@@ -23,8 +23,9 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
 from .models import (
-    Bounty, BountyFulfillment, BountySyncRequest, CoinRedemption, CoinRedemptionRequest, Interest, Profile,
-    Subscription, Tip, Tool, ToolVote, UserAction,
+    Bounty, BountyFulfillment, BountySyncJob, BountySyncRequest, BountyURLIndex, ChainSyncCheckpoint, CoinRedemption,
+    CoinRedemptionRequest, Interest, IssueEnrichmentJob, NotificationOutbox, OpenWorkTotals, Profile, ProfileBountyLink,
+    ProfileStats, Subscription, Tip, Tool, ToolVote, UserAction,
 )
 
 
@@ -42,6 +43,57 @@ class ProfileAdmin(admin.ModelAdmin):
     search_fields = ['email', 'data']
 
 
+class ProfileStatsAdmin(admin.ModelAdmin):
+    raw_id_fields = ['profile']
+    ordering = ['-id']
+    list_display = ['pk', 'profile', 'role', 'num_bounties', 'stale']
+
+
+class ProfileBountyLinkAdmin(admin.ModelAdmin):
+    raw_id_fields = ['bounty', 'profile', 'fulfillment', 'interest']
+    ordering = ['-id']
+    list_display = ['pk', 'handle', 'relation_type', 'bounty']
+    search_fields = ['handle']
+
+
+class BountyURLIndexAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    list_display = ['pk', 'network', 'standard_bounties_id', 'url']
+    search_fields = ['url']
+
+
+class BountySyncJobAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    list_display = ['pk', 'created_on', 'network', 'github_url', 'status', 'attempts', 'next_attempt_on']
+    list_filter = ['status', 'network']
+    search_fields = ['github_url', 'txid']
+
+
+class IssueEnrichmentJobAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    raw_id_fields = ['bounty']
+    list_display = ['pk', 'created_on', 'bounty', 'status', 'attempts', 'next_attempt_on', 'error']
+    list_filter = ['status']
+
+
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    raw_id_fields = ['bounty']
+    list_display = ['pk', 'created_on', 'channel', 'event_name', 'status', 'attempts', 'last_error']
+    list_filter = ['status', 'channel']
+    search_fields = ['dedupe_key']
+
+
+class OpenWorkTotalsAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    list_display = ['pk', 'network', 'amount_usdt', 'num_bounties', 'refreshed_on', 'modified_on']
+
+
+class ChainSyncCheckpointAdmin(admin.ModelAdmin):
+    ordering = ['-id']
+    list_display = ['pk', 'network', 'last_block', 'modified_on']
+
+
 class TipAdmin(admin.ModelAdmin):
     ordering = ['-id']
     readonly_fields = ['resend']
@@ -90,9 +142,17 @@ admin.site.register(Subscription, GeneralAdmin)
 admin.site.register(UserAction, GeneralAdmin)
 admin.site.register(Interest, GeneralAdmin)
 admin.site.register(Profile, ProfileAdmin)
+admin.site.register(ProfileStats, ProfileStatsAdmin)
+admin.site.register(ProfileBountyLink, ProfileBountyLinkAdmin)
 admin.site.register(Bounty, BountyAdmin)
 admin.site.register(BountyFulfillment, BountyFulfillmentAdmin)
+admin.site.register(BountySyncJob, BountySyncJobAdmin)
 admin.site.register(BountySyncRequest, GeneralAdmin)
+admin.site.register(NotificationOutbox, NotificationOutboxAdmin)
+admin.site.register(IssueEnrichmentJob, IssueEnrichmentJobAdmin)
+admin.site.register(OpenWorkTotals, OpenWorkTotalsAdmin)
+admin.site.register(BountyURLIndex, BountyURLIndexAdmin)
+admin.site.register(ChainSyncCheckpoint, ChainSyncCheckpointAdmin)
 admin.site.register(Tip, TipAdmin)
 admin.site.register(CoinRedemption, GeneralAdmin)
 admin.site.register(CoinRedemptionRequest, GeneralAdmin)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Define the streaming bulk exports of bounties, fulfillments and tips.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import csv
+import hmac
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from dashboard.models import Bounty, BountyFulfillment, Tip
+from ratelimit.decorators import ratelimit
+
+# Only public columns are exported; emails, IPs, private comments and raw payloads are left out, as is the tip
+# url, which carries the private key of the tip until it is received.
+EXPORTS = {
+    'bounties': (Bounty, [
+        'id', 'created_on', 'modified_on', 'web3_created', 'web3_type', 'title', 'network', 'standard_bounties_id',
+        'github_url', 'bounty_type', 'project_length', 'experience_level', 'value_in_token', 'token_name',
+        'token_address', 'bounty_owner_address', 'bounty_owner_github_username', 'is_open', 'accepted',
+        'current_bounty', 'expires_date', 'idx_status', 'num_fulfillments', 'value_in_eth', 'value_in_usdt',
+        'value_in_usdt_now', 'token_value_in_usdt', 'token_value_time_peg', 'fulfillment_accepted_on',
+        'fulfillment_submitted_on', 'fulfillment_started_on', 'canceled_on', 'metadata',
+    ]),
+    'fulfillments': (BountyFulfillment, [
+        'id', 'created_on', 'modified_on', 'bounty_id', 'profile_id', 'fulfillment_id', 'fulfiller_address',
+        'fulfiller_github_username', 'fulfiller_github_url', 'accepted', 'accepted_on',
+    ]),
+    'tips': (Tip, [
+        'id', 'created_on', 'modified_on', 'network', 'github_url', 'tokenName', 'tokenAddress', 'amount',
+        'comments_public', 'from_username', 'username', 'expires_date', 'txid', 'receive_txid', 'received_on',
+    ]),
+}
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class Echo(object):
+    """Hand csv rows back to the caller instead of buffering them."""
+
+    def write(self, value):
+        return value
+
+
+def is_authorized(request):
+    """Determine whether the request comes from staff or bears a valid export API key."""
+    if request.user.is_authenticated and request.user.is_staff:
+        return True
+    scheme, _, key = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+    key = key.strip().encode('utf-8')
+    return scheme == 'Token' and any(
+        hmac.compare_digest(key, api_key.encode('utf-8')) for api_key in settings.EXPORT_API_KEYS
+    )
+
+
+def parse_since(value):
+    """Parse the `since` timestamp of an incremental export.
+
+    Args:
+        value (str): An ISO 8601 datetime or date.
+
+    Raises:
+        ValueError: If the value is neither.
+
+    Returns:
+        datetime: The timezone aware timestamp to export changes from.
+
+    """
+    since = parse_datetime(value)
+    if since is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(f'invalid since: {value}')
+        since = datetime(date.year, date.month, date.day)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, timezone.utc)
+    return since
+
+
+def export_rows(name, since=None, chunk_size=2000):
+    """Iterate over the exported rows of a table, in primary key order.
+
+    Rows are read through a server side cursor `chunk_size` at a time, so the
+    memory used stays flat regardless of the size of the table.
+
+    Args:
+        name (str): The export to run, one of `EXPORTS`.
+        since (datetime): Only export rows modified on or after this time.
+            Defaults to: None, exporting every row.
+        chunk_size (int): The number of rows fetched from the database at a time.
+
+    Returns:
+        generator: The rows as dicts of the exported columns.
+
+    """
+    model, fields = EXPORTS[name]
+    queryset = model.objects.order_by('pk')
+    if since:
+        queryset = queryset.filter(modified_on__gte=since)
+    return queryset.values(*fields).iterator(chunk_size=chunk_size)
+
+
+def render_ndjson(rows):
+    """Render each row as one line of JSON."""
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def render_csv(rows, fields):
+    """Render the rows as CSV lines, preceded by a header line."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow([
+            json.dumps(row[field], cls=DjangoJSONEncoder) if isinstance(row[field], (dict, list)) else row[field]
+            for field in fields
+        ])
+
+
+def render_export(name, fmt, since=None, chunk_size=2000):
+    """Render an export in the requested format, one line at a time."""
+    rows = export_rows(name, since=since, chunk_size=chunk_size)
+    if fmt == 'csv':
+        return render_csv(rows, EXPORTS[name][1])
+    return render_ndjson(rows)
+
+
+@ratelimit(key='ip', rate='10/m', block=True)
+def export(request, name):
+    """Stream a full or incremental export of bounties, fulfillments or tips to staff or API key holders.
+
+    Query Args:
+        format (str): ndjson (default) or csv.
+        since (str): Only export rows modified on or after this ISO 8601 datetime or date.
+
+    """
+    if not is_authorized(request):
+        return JsonResponse({'error': 'authentication required'}, status=401)
+    fmt = request.GET.get('format', 'ndjson')
+    if name not in EXPORTS or fmt not in EXPORT_FORMATS:
+        return JsonResponse({'error': 'unknown export'}, status=404)
+    try:
+        since = parse_since(request.GET['since']) if request.GET.get('since') else None
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    response = StreamingHttpResponse(render_export(name, fmt, since=since), content_type=EXPORT_FORMATS[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{name}.{fmt}"'
+    return response
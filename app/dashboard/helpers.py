@@ -19,6 +19,7 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 import pprint
+from decimal import Decimal
 from enum import Enum
 
 from django.conf import settings
@@ -30,12 +31,15 @@ from django.utils import timezone
 
 import requests
 from bs4 import BeautifulSoup
-from dashboard.models import Bounty, BountyFulfillment, BountySyncRequest, UserAction
+from dashboard.models import (
+    Bounty, BountyFulfillment, BountySyncRequest, IssueEnrichmentJob, NotificationOutbox, UserAction, hash_raw_data,
+)
 from dashboard.notifications import (
     maybe_market_to_email, maybe_market_to_github, maybe_market_to_slack, maybe_market_to_twitter,
     maybe_market_to_user_slack,
 )
 from dashboard.tokens import addr_to_token
+from economy.models import get_time
 from economy.utils import convert_amount
 from github.utils import _AUTH
 from jsondiff import diff
@@ -255,10 +259,14 @@ def bounty_did_change(bounty_id, new_bounty_details):
         # refresh_bounties/handle
         old_bounties = Bounty.objects.filter(standard_bounties_id=bounty_id, network=network).order_by('-created_on')
 
-        if old_bounties.exists():
-            did_change = (new_bounty_details != old_bounties.first().raw_data)
-        else:
-            did_change = True
+        # the fingerprint is compared through the index, so the stored raw_data is never loaded
+        raw_data_hash = hash_raw_data(new_bounty_details)
+        did_change = not old_bounties.filter(current_bounty=True, raw_data_hash=raw_data_hash).exists()
+        if did_change:
+            # rows saved before the fingerprint existed, until backfill_raw_data_hashes has run
+            unhashed = old_bounties.filter(current_bounty=True, raw_data_hash='')
+            did_change = not any(
+                raw_data == new_bounty_details for raw_data in unhashed.values_list('raw_data', flat=True))
     except Exception as e:
         did_change = True
         print(f"asserting did change because got the following exception: {e}. args; bounty_id: {bounty_id}, network: {network}")
@@ -270,6 +278,10 @@ def bounty_did_change(bounty_id, new_bounty_details):
 def handle_bounty_fulfillments(fulfillments, new_bounty, old_bounty):
     """Handle BountyFulfillment creation for new bounties.
 
+    The fulfiller profiles and the fulfillments of the old bounty are read with
+    one query each and the new fulfillments are written with a single insert,
+    so the number of queries does not grow with the number of fulfillments.
+
     Args:
         fulfillments (dict): The fulfillments data dictionary.
         new_bounty (dashboard.models.Bounty): The new Bounty object.
@@ -279,59 +291,110 @@ def handle_bounty_fulfillments(fulfillments, new_bounty, old_bounty):
         QuerySet: The BountyFulfillments queryset.
 
     """
+    from dashboard.models import ProfileBountyLink, ProfileStats
+    from dashboard.signals import bump_bounty_data_version
+
+    def fulfiller_data(fulfillment):
+        return fulfillment.get('data', {}).get('payload', {}).get('fulfiller', {})
+
+    handles = set(fulfiller_data(fulfillment).get('githubUsername', '') for fulfillment in fulfillments)
+    profiles = {}
+    for profile in Profile.objects.filter(handle__in=[handle for handle in handles if handle]).order_by('pk'):
+        profiles.setdefault(profile.handle, profile)
+    old_fulfillments = {}
+    if old_bounty:
+        for old_fulfillment in old_bounty.fulfillments.order_by('pk'):
+            old_fulfillments.setdefault(old_fulfillment.fulfillment_id, old_fulfillment)
+
+    new_fulfillments = []
     for fulfillment in fulfillments:
         kwargs = {}
         accepted_on = None
-        github_username = fulfillment.get('data', {}).get(
-            'payload', {}).get('fulfiller', {}).get(
-                'githubUsername', '')
-        if github_username:
-            try:
-                kwargs['profile_id'] = Profile.objects.get(handle=github_username).pk
-            except Profile.DoesNotExist:
-                pass
+        github_username = fulfiller_data(fulfillment).get('githubUsername', '')
+        if github_username in profiles:
+            kwargs['profile'] = profiles[github_username]
         if fulfillment.get('accepted'):
             kwargs['accepted'] = True
             accepted_on = timezone.now()
         try:
             created_on = timezone.now()
-            modified_on = timezone.now()
-            if old_bounty:
-                old_fulfillments = old_bounty.fulfillments.filter(fulfillment_id=fulfillment.get('id'))
-                if old_fulfillments.exists():
-                    old_fulfillment = old_fulfillments.first()
-                    created_on = old_fulfillment.created_on
-                    modified_on = old_fulfillment.modified_on
-                    if old_fulfillment.accepted:
-                        accepted_on = old_fulfillment.accepted_on
-            hours_worked = fulfillment.get('data', {}).get(
-                    'payload', {}).get('fulfiller', {}).get('hoursWorked', None)
+            old_fulfillment = old_fulfillments.get(fulfillment.get('id'))
+            if old_fulfillment:
+                created_on = old_fulfillment.created_on
+                if old_fulfillment.accepted:
+                    accepted_on = old_fulfillment.accepted_on
+            hours_worked = fulfiller_data(fulfillment).get('hoursWorked', None)
             if not hours_worked or not hours_worked.isdigit():
                 hours_worked = None
-            new_bounty.fulfillments.create(
+            new_fulfillments.append(BountyFulfillment(
+                bounty=new_bounty,
                 fulfiller_address=fulfillment.get(
                     'fulfiller',
                     '0x0000000000000000000000000000000000000000'),
-                fulfiller_email=fulfillment.get('data', {}).get(
-                    'payload', {}).get('fulfiller', {}).get('email', ''),
+                fulfiller_email=fulfiller_data(fulfillment).get('email', ''),
                 fulfiller_github_username=github_username,
-                fulfiller_name=fulfillment.get('data', {}).get(
-                    'payload', {}).get('fulfiller', {}).get('name', ''),
+                fulfiller_name=fulfiller_data(fulfillment).get('name', ''),
                 fulfiller_metadata=fulfillment,
                 fulfillment_id=fulfillment.get('id'),
-                fulfiller_github_url=fulfillment.get('data', {}).get(
-                    'payload', {}).get('fulfiller', {}).get('githubPRLink', ''),
+                fulfiller_github_url=fulfiller_data(fulfillment).get('githubPRLink', ''),
                 fulfiller_hours_worked=hours_worked,
                 created_on=created_on,
-                modified_on=modified_on,
+                # stamped like SuperModel.save does, so incremental exports pick the rows up
+                modified_on=get_time(),
                 accepted_on=accepted_on,
-                **kwargs)
+                **kwargs))
         except Exception as e:
             logging.error(f'{e} during new fulfillment creation for {new_bounty}')
             continue
+
+    if new_fulfillments:
+        # bulk_create skips the post_save signals, so do what they would have done once for all rows
+        new_fulfillments = BountyFulfillment.objects.bulk_create(new_fulfillments)
+        links = []
+        for new_fulfillment in new_fulfillments:
+            links += ProfileBountyLink.links_for_fulfillment(new_fulfillment)
+        ProfileBountyLink.objects.bulk_create(links)
+        ProfileStats.mark_stale(
+            handles=[f.fulfiller_github_username for f in new_fulfillments] + [new_bounty.bounty_owner_github_username],
+            profile_ids=[f.profile_id for f in new_fulfillments],
+        )
+        bump_bounty_data_version(sender=BountyFulfillment)
     return new_bounty.fulfillments.all()
 
 
+def retire_bounties(old_bounties):
+    """Mark the provided revisions of a bounty as no longer current with a single UPDATE.
+
+    The per-row save signals are skipped, so the open work totals and the cached
+    API responses are brought up to date here instead.
+
+    Args:
+        old_bounties (list of dashboard.models.Bounty): The revisions to retire.
+
+    Returns:
+        int: The number of revisions updated.
+
+    """
+    from dashboard.models import OpenWorkTotals
+    from dashboard.signals import bump_bounty_data_version
+
+    if not old_bounties:
+        return 0
+    for old_bounty in old_bounties:
+        if old_bounty.current_bounty:
+            amount_usdt, num_bounties = OpenWorkTotals.contribution(
+                True, old_bounty.idx_status, old_bounty.value_in_usdt_now)
+            if num_bounties:
+                OpenWorkTotals.adjust(old_bounty.network, -amount_usdt, -num_bounties)
+        old_bounty.current_bounty = False
+        # a later save of this instance must not subtract its contribution again
+        old_bounty._open_work_before = (old_bounty.network, (Decimal(0), 0))
+    updated = Bounty.objects.filter(pk__in=[old_bounty.pk for old_bounty in old_bounties]).update(
+        current_bounty=False, modified_on=get_time())
+    bump_bounty_data_version(sender=Bounty)
+    return updated
+
+
 def create_new_bounty(old_bounties, bounty_payload, bounty_details, bounty_id):
     """Handle new Bounty creation in the event of bounty changes.
 
@@ -375,13 +438,13 @@ def create_new_bounty(old_bounties, bounty_payload, bounty_details, bounty_id):
             if token:
                 token_name = token['name']
 
+        old_bounties = list(old_bounties)
         for old_bounty in old_bounties:
             if old_bounty.current_bounty:
                 submissions_comment_id = old_bounty.submissions_comment
                 interested_comment_id = old_bounty.interested_comment
-            old_bounty.current_bounty = False
-            old_bounty.save()
             latest_old_bounty = old_bounty
+        retire_bounties(old_bounties)
         try:
             new_bounty = Bounty.objects.create(
                 title=bounty_payload.get('title', ''),
@@ -423,12 +486,12 @@ def create_new_bounty(old_bounties, bounty_payload, bounty_details, bounty_id):
                 last_comment_date=latest_old_bounty.last_comment_date if latest_old_bounty else None,
                 snooze_warnings_for_days=latest_old_bounty.snooze_warnings_for_days if latest_old_bounty else 0,
             )
-            new_bounty.fetch_issue_item()
+            # the Github issue is fetched by the process_issue_enrichment worker once this has committed
+            transaction.on_commit(lambda bounty_id=new_bounty.pk: IssueEnrichmentJob.enqueue([bounty_id]))
 
             # Pull the interested parties off the last old_bounty
             if latest_old_bounty:
-                for interest in latest_old_bounty.interested.all():
-                    new_bounty.interested.add(interest)
+                new_bounty.interested.add(*latest_old_bounty.interested.all())
 
             # set cancel date of this bounty
             canceled_on = latest_old_bounty.canceled_on if latest_old_bounty and latest_old_bounty.canceled_on else None
@@ -445,8 +508,7 @@ def create_new_bounty(old_bounties, bounty_payload, bounty_details, bounty_id):
 
         if fulfillments:
             handle_bounty_fulfillments(fulfillments, new_bounty, latest_old_bounty)
-            for inactive in Bounty.objects.filter(current_bounty=False, github_url=url).order_by('-created_on'):
-                BountyFulfillment.objects.filter(bounty_id=inactive.id).delete()
+            BountyFulfillment.objects.filter(bounty__current_bounty=False, bounty__github_url=url).delete()
     return new_bounty
 
 
@@ -583,7 +645,11 @@ def process_bounty_changes(old_bounty, new_bounty):
         profile_pairs = build_profile_pairs(new_bounty)
 
     # marketing
-    if event_name != 'unknown_event':
+    if event_name != 'unknown_event' and settings.NOTIFICATION_OUTBOX_ENABLED:
+        # posted by the process_notification_outbox worker once this transaction commits
+        notifications = NotificationOutbox.enqueue(new_bounty, event_name, profile_pairs)
+        print(f"- queued {len(notifications)} notifications; did_bsr: {did_bsr}")
+    elif event_name != 'unknown_event':
         print("============ posting ==============")
         did_post_to_twitter = maybe_market_to_twitter(new_bounty, event_name)
         did_post_to_slack = maybe_market_to_slack(new_bounty, event_name)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to backfill materialized profile stats.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.utils import bulk_update
+from dashboard.models import Profile, ProfileStats
+from economy.models import get_time
+
+STATS_FIELDS = [
+    'role', 'total_funded', 'total_fulfilled', 'num_bounties', 'open_count', 'success_rate', 'loyalty_rate', 'stale',
+    'modified_on',
+]
+
+
+class Command(BaseCommand):
+    """Define the management command to backfill ProfileStats."""
+
+    help = 'computes the materialized stats of every profile in bulk'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the backfill command."""
+        parser.add_argument(
+            '--stale-only',
+            action='store_true',
+            dest='stale_only',
+            default=False,
+            help='Only rebuild missing or stale stats'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=500,
+            help='The number of profiles written per query'
+        )
+
+    def handle(self, *args, **options):
+        """Compute and store the stats of every profile."""
+        profiles = Profile.objects.order_by('pk')
+        if options['stale_only']:
+            profiles = profiles.exclude(materialized_stats__stale=False)
+        profile_ids = list(profiles.values_list('pk', flat=True))
+        batch_size = options['batch_size']
+
+        for start in range(0, len(profile_ids), batch_size):
+            batch = Profile.objects.filter(pk__in=profile_ids[start:start + batch_size]).select_related(
+                'materialized_stats')
+            created, updated = [], []
+            for profile in batch:
+                values = dict(ProfileStats.compute(profile), stale=False, modified_on=get_time())
+                stats = getattr(profile, 'materialized_stats', None)
+                if stats is None:
+                    created.append(ProfileStats(profile=profile, **values))
+                else:
+                    for field, value in values.items():
+                        setattr(stats, field, value)
+                    updated.append(stats)
+            with transaction.atomic():
+                ProfileStats.objects.bulk_create(created)
+                bulk_update(ProfileStats, updated, STATS_FIELDS)
+            print(f'- {start + len(created) + len(updated)}/{len(profile_ids)} profiles ({len(created)} new)')
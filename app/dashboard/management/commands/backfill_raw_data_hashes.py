@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to backfill the raw data fingerprint of bounties.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from django.core.management.base import BaseCommand
+
+from app.utils import bulk_update
+from dashboard.models import Bounty, hash_raw_data
+
+
+class Command(BaseCommand):
+    """Define the management command to backfill Bounty.raw_data_hash."""
+
+    help = 'computes the raw data fingerprint of every bounty saved without one'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the backfill command."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=500,
+            help='The number of bounties read and written per query'
+        )
+
+    def handle(self, *args, **options):
+        """Compute and store the fingerprint of every bounty missing one."""
+        bounty_ids = list(Bounty.objects.filter(raw_data_hash='').order_by('pk').values_list('pk', flat=True))
+        batch_size = options['batch_size']
+
+        for start in range(0, len(bounty_ids), batch_size):
+            bounties = list(Bounty.objects.filter(pk__in=bounty_ids[start:start + batch_size]).only('raw_data'))
+            for bounty in bounties:
+                bounty.raw_data_hash = hash_raw_data(bounty.raw_data)
+            bulk_update(Bounty, bounties, ['raw_data_hash'])
+            print(f'- {start + len(bounties)}/{len(bounty_ids)} bounties')
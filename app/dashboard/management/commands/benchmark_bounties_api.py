@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to benchmark serializing the bounties API.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import time
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from dashboard.models import Bounty
+from dashboard.router import BountySerializer
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class Command(BaseCommand):
+    """Define the management command to benchmark the bounty list serializers."""
+
+    help = 'times a page of the bounties API through the per-object and the row based serializers'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the benchmark command."""
+        parser.add_argument(
+            '--limit',
+            type=int,
+            dest='limit',
+            default=100,
+            help='The number of bounties per page'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            dest='repeat',
+            default=5,
+            help='The number of times each serializer is timed'
+        )
+
+    def time(self, label, serialize, repeat):
+        """Time the provided serializer, returning its rendered output."""
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                output = JSONRenderer().render(serialize())
+                timings.append(time.perf_counter() - start)
+        print(f'- {label}: best {min(timings) * 1000:.1f}ms, mean {sum(timings) / repeat * 1000:.1f}ms, '
+              f'{len(queries)} queries')
+        return output
+
+    def handle(self, *args, **options):
+        """Serialize the newest page of bounties both ways and compare the output."""
+        request = Request(APIRequestFactory().get('/api/v0.1/bounties/'))
+        context = {'request': request}
+        queryset = Bounty.objects.current().order_by('-web3_created', '-pk')[:options['limit']]
+        repeat = options['repeat']
+        print(f'serializing {queryset.count()} bounties, {repeat} runs each')
+
+        def per_object():
+            page = queryset.prefetch_related('fulfillments', 'interested', 'interested__profile')
+            return [BountySerializer(bounty, context=context).data for bounty in page]
+
+        def row_based():
+            return BountySerializer(queryset.values(), many=True, context=context).data
+
+        # freeze the `now` field so that both outputs can be compared byte for byte
+        with patch('django.utils.timezone.now', return_value=timezone.now()):
+            before = self.time('BountySerializer', per_object, repeat)
+            after = self.time('BountyListSerializer', row_based, repeat)
+        print('identical output' if before == after else 'OUTPUT DIFFERS')
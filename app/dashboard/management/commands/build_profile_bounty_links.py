@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to rebuild the profile to bounty link index.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from dashboard.models import Bounty, ProfileBountyLink, Tip
+
+
+class Command(BaseCommand):
+    """Define the management command to rebuild ProfileBountyLinks."""
+
+    help = 'rebuilds the index of which bounties relate to which github handles'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the rebuild command."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=500,
+            help='The number of bounties indexed per batch'
+        )
+
+    def handle(self, *args, **options):
+        """Rebuild every ProfileBountyLink."""
+        tip_usernames = defaultdict(list)
+        for github_url, username in Tip.objects.exclude(github_url=None).values_list('github_url', 'username'):
+            tip_usernames[github_url].append(username)
+
+        bounty_ids = list(Bounty.objects.order_by('pk').values_list('pk', flat=True))
+        batch_size = options['batch_size']
+
+        with transaction.atomic():
+            ProfileBountyLink.objects.all().delete()
+            for start in range(0, len(bounty_ids), batch_size):
+                bounties = Bounty.objects.filter(pk__in=bounty_ids[start:start + batch_size]) \
+                    .prefetch_related('fulfillments__profile', 'interested__profile')
+                links = []
+                for bounty in bounties:
+                    links += ProfileBountyLink.links_for_bounty(bounty, tip_usernames.get(bounty.github_url, []))
+                    for fulfillment in bounty.fulfillments.all():
+                        links += ProfileBountyLink.links_for_fulfillment(fulfillment)
+                    links += ProfileBountyLink.links_for_interests(bounty, bounty.interested.all())
+                ProfileBountyLink.objects.bulk_create(links)
+                print(f'- {min(start + batch_size, len(bounty_ids))}/{len(bounty_ids)} bounties; {len(links)} links')
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to export bounties, fulfillments or tips.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.export import EXPORT_FORMATS, EXPORTS, parse_since, render_export
+
+
+class Command(BaseCommand):
+    """Define the management command to stream an export to a file or stdout."""
+
+    help = 'streams every bounty, fulfillment or tip (optionally only those modified since a date) as ndjson or csv'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the export command."""
+        parser.add_argument('name', choices=sorted(EXPORTS), help='What to export')
+        parser.add_argument(
+            '--format',
+            choices=sorted(EXPORT_FORMATS),
+            dest='fmt',
+            default='ndjson',
+            help='The output format'
+        )
+        parser.add_argument(
+            '--since',
+            dest='since',
+            default=None,
+            help='Only export rows modified on or after this ISO 8601 datetime or date'
+        )
+        parser.add_argument(
+            '--output',
+            dest='output',
+            default=None,
+            help='The file to write to, defaults to stdout'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            dest='chunk_size',
+            default=2000,
+            help='The number of rows fetched from the database at a time'
+        )
+
+    def handle(self, *args, **options):
+        """Write the export one line at a time."""
+        try:
+            since = parse_since(options['since']) if options['since'] else None
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        lines = render_export(options['name'], options['fmt'], since=since, chunk_size=options['chunk_size'])
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(options['output'], 'w', newline='') as output:
+            for line in lines:
+                output.write(line)
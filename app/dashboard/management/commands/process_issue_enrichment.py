@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to fetch the Github issues of new bounty revisions.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import time
+import warnings
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from dashboard.models import IssueEnrichmentJob
+from dashboard.utils import run_enrichment_jobs
+from economy.models import get_time
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+logging.getLogger("requests").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+class Command(BaseCommand):
+    """Define the management command to process IssueEnrichmentJobs."""
+
+    help = 'fetches the Github issue bodies of the bounty revisions queued by the chain sync'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the worker command."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            dest='once',
+            default=False,
+            help='Exit once no job is due instead of waiting for more'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            dest='poll_interval',
+            default=5,
+            help='The seconds waited before polling the queue again when no job is due'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=50,
+            help='The number of jobs claimed from the queue at a time'
+        )
+        parser.add_argument(
+            '--stuck-after',
+            type=int,
+            dest='stuck_after',
+            default=600,
+            help='The seconds after which a running job left by a dead worker is queued again'
+        )
+
+    def handle(self, *args, **options):
+        """Claim and run the due jobs until the queue is empty, or forever."""
+        stuck_after = get_time() - timezone.timedelta(seconds=options['stuck_after'])
+        requeued = IssueEnrichmentJob.objects.filter(
+            status='running', modified_on__lt=stuck_after).update(status='pending')
+        if requeued:
+            print(f'- requeued {requeued} stuck jobs')
+
+        while True:
+            jobs = IssueEnrichmentJob.claim(limit=max(options['batch_size'], 1))
+            if jobs:
+                updated = run_enrichment_jobs(
+                    jobs,
+                    max_attempts=settings.ISSUE_ENRICHMENT_MAX_ATTEMPTS,
+                    backoff=settings.ISSUE_ENRICHMENT_BACKOFF,
+                )
+                done = len([job for job in jobs if job.status == 'done'])
+                print(f'- ran {len(jobs)} enrichment jobs: {done} done, {updated} bounty rows written')
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['poll_interval'])
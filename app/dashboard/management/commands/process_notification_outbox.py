@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to post the queued bounty event notifications.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from dashboard.models import NotificationOutbox
+from dashboard.notifications import deliver_notification
+from economy.models import get_time
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+logging.getLogger("requests").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+def deliver(notification):
+    """Post a notification on a worker thread, then release the thread's database connection."""
+    try:
+        deliver_notification(
+            notification,
+            max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+            backoff=settings.NOTIFICATION_OUTBOX_BACKOFF,
+        )
+        print(f'- notification {notification.pk} to {notification.channel} => {notification.status}')
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    """Define the management command to drain the NotificationOutbox."""
+
+    help = 'posts the queued bounty event notifications, each channel with its own pool of workers'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the worker command."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            dest='once',
+            default=False,
+            help='Exit once no notification is due instead of waiting for more'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            dest='poll_interval',
+            default=1,
+            help='The seconds waited before polling the outbox again when no notification is due'
+        )
+        parser.add_argument(
+            '--stuck-after',
+            type=int,
+            dest='stuck_after',
+            default=600,
+            help='The seconds after which a running notification left by a dead worker is queued again'
+        )
+
+    def handle(self, *args, **options):
+        """Claim and post the due notifications of every channel until the outbox is empty, or forever."""
+        stuck_after = get_time() - timezone.timedelta(seconds=options['stuck_after'])
+        requeued = NotificationOutbox.objects.filter(status='running', modified_on__lt=stuck_after) \
+            .update(status='pending')
+        if requeued:
+            print(f'- requeued {requeued} stuck notifications')
+
+        limits = {
+            channel: max(settings.NOTIFICATION_OUTBOX_CONCURRENCY.get(channel, 1), 1)
+            for channel in NotificationOutbox.CHANNELS
+        }
+        executors = {channel: ThreadPoolExecutor(max_workers=limit) for channel, limit in limits.items()}
+        in_flight = {channel: set() for channel in NotificationOutbox.CHANNELS}
+        try:
+            while True:
+                # a slow channel only fills its own pool, the others keep draining
+                claimed = 0
+                for channel, limit in limits.items():
+                    in_flight[channel] = {future for future in in_flight[channel] if not future.done()}
+                    free = limit - len(in_flight[channel])
+                    if free > 0:
+                        for notification in NotificationOutbox.claim(channel, limit=free):
+                            in_flight[channel].add(executors[channel].submit(deliver, notification))
+                            claimed += 1
+
+                futures = set().union(*in_flight.values())
+                if futures:
+                    wait(futures, timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                elif options['once']:
+                    break
+                elif not claimed:
+                    time.sleep(options['poll_interval'])
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to run the queued syncs of bounties with web3.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import logging
+import time
+import warnings
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from dashboard.models import BountySyncJob
+from dashboard.utils import run_sync_job
+from economy.models import get_time
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+logging.getLogger("requests").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+class Command(BaseCommand):
+    """Define the management command to process BountySyncJobs."""
+
+    help = 'runs the bounty syncs queued by the sync/web3 endpoint, retrying them with an exponential backoff'
+
+    def add_arguments(self, parser):
+        """Add argument handling to the worker command."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            dest='once',
+            default=False,
+            help='Exit once no job is due instead of waiting for more'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            dest='poll_interval',
+            default=1,
+            help='The seconds waited before polling the queue again when no job is due'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=10,
+            help='The number of jobs claimed from the queue at a time'
+        )
+        parser.add_argument(
+            '--stuck-after',
+            type=int,
+            dest='stuck_after',
+            default=600,
+            help='The seconds after which a running job left by a dead worker is queued again'
+        )
+
+    def handle(self, *args, **options):
+        """Claim and run the due jobs until the queue is empty, or forever."""
+        stuck_after = get_time() - timezone.timedelta(seconds=options['stuck_after'])
+        requeued = BountySyncJob.objects.filter(status='running', modified_on__lt=stuck_after).update(status='pending')
+        if requeued:
+            print(f'- requeued {requeued} stuck jobs')
+
+        while True:
+            jobs = BountySyncJob.claim(limit=max(options['batch_size'], 1))
+            for job in jobs:
+                print(f'- running sync job {job.pk} (attempt {job.attempts + 1}) for {job.github_url}')
+                run_sync_job(
+                    job, max_attempts=settings.SYNC_WEB3_JOB_MAX_ATTEMPTS, backoff=settings.SYNC_WEB3_JOB_BACKOFF)
+                print(f'  => {job.status} {job.error}')
+            if not jobs:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Define the management command to re-derive the open work totals.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from django.core.management.base import BaseCommand
+
+from dashboard.models import OpenWorkTotals
+
+
+class Command(BaseCommand):
+    """Define the management command to re-derive OpenWorkTotals."""
+
+    help = 're-derives the open work totals of every network from its bounties'
+
+    def handle(self, *args, **options):
+        """Re-derive the totals of every network."""
+        for totals in OpenWorkTotals.refresh_all():
+            print(f'- {totals}')
@@ -19,13 +19,21 @@
 import datetime
 import logging
 import sys
+import time
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
 
 from django.core.management.base import BaseCommand
 
 import rollbar
 from dashboard.helpers import UnsupportedSchemaException
-from dashboard.utils import BountyNotFoundException, get_bounty, web3_process_bounty
+from dashboard.models import ChainSyncCheckpoint
+from dashboard.utils import (
+    BountyNotFoundException, get_block_number, get_bounties, get_bounty_ids_from_events, web3_process_bounty,
+)
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -34,49 +42,193 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+class StageCounter(object):
+    """Count the items handled by a stage of the sync, and the time spent on them."""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.seconds = 0.0
+        self.lock = Lock()
+
+    def add(self, seconds, count=1):
+        with self.lock:
+            self.count += count
+            self.seconds += seconds
+
+    def __str__(self):
+        rate = self.count / self.seconds if self.seconds else 0
+        return f'{self.name}: {self.count} bounties in {self.seconds:.1f}s ({rate:.2f}/s per worker)'
+
+
 class Command(BaseCommand):
 
     help = 'syncs bounties with geth'
 
     def add_arguments(self, parser):
         parser.add_argument('network')
-        parser.add_argument('start_id', default=0, type=int)
-        parser.add_argument('end_id', default=99999999999, type=int)
+        parser.add_argument('start_id', nargs='?', default=0, type=int)
+        parser.add_argument('end_id', nargs='?', default=99999999999, type=int)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            dest='workers',
+            default=8,
+            help='The number of bounties fetched from the chain and IPFS concurrently, 1 to fetch them one by one'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            dest='batch_size',
+            default=10,
+            help='The number of bounties each worker reads from the chain in one batch of requests'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            dest='incremental',
+            default=False,
+            help='Only sync the bounties touched by an event since the last synced block, '
+                 'falling back to a full rescan when the network was never synced incrementally'
+        )
+        parser.add_argument(
+            '--confirmations',
+            type=int,
+            dest='confirmations',
+            default=12,
+            help='The number of blocks an event must be buried under before it is synced incrementally'
+        )
+        parser.add_argument(
+            '--blocks-per-request',
+            type=int,
+            dest='blocks_per_request',
+            default=5000,
+            help='The number of blocks whose event logs are read in one request'
+        )
+
+    def fetch(self, bounty_enums, network):
+        """Fetch a batch of bounties from the chain and IPFS, on a worker thread."""
+        start = time.time()
+        try:
+            return get_bounties(bounty_enums, network)
+        finally:
+            self.fetched.add(time.time() - start, count=len(bounty_enums))
+
+    def sync(self, network, bounty_enums, workers, batch_size, stop_when_not_found=True):
+        """Fetch and process the bounties, in the order of `bounty_enums`.
+
+        Args:
+            network (str): The network to sync.
+            bounty_enums (iterable of int): The standard bounties ids to sync.
+            workers (int): The number of batches fetched concurrently.
+            batch_size (int): The number of bounties fetched in one batch.
+            stop_when_not_found (bool): Whether a missing bounty ends the sync, as it
+                does when walking the ids up to the last bounty. Defaults to: True.
+
+        Returns:
+            list of int: The ids of the bounties that failed to fetch or process.
+
+        """
+        hour = datetime.datetime.now().hour
+        day = datetime.datetime.now().day
+        month = datetime.datetime.now().month
+
+        # bounties are fetched in batches by a bounded pool of workers, at most 2 batches per worker
+        # ahead of the writer, while this thread processes them one at a time and in order
+        bounty_enums = iter(bounty_enums)
+        pending = deque()
+        failed = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            more_bounties = True
+            while more_bounties:
+                while len(pending) < workers * 2 * batch_size:
+                    batch = list(islice(bounty_enums, batch_size))
+                    if not batch:
+                        break
+                    future = executor.submit(self.fetch, batch, network)
+                    pending.extend((batch_enum, future) for batch_enum in batch)
+                if not pending:
+                    break
+
+                bounty_enum, future = pending.popleft()
+                try:
+                    # pull and process each bounty
+                    print(f"[{month}/{day} {hour}:00] Getting bounty {bounty_enum}")
+                    bounty = future.result()[bounty_enum]
+                    if isinstance(bounty, Exception):
+                        raise bounty
+                    print(f"[{month}/{day} {hour}:00] Processing bounty {bounty_enum}")
+                    start = time.time()
+                    web3_process_bounty(bounty)
+                    self.processed.add(time.time() - start)
+
+                except BountyNotFoundException:
+                    if stop_when_not_found:
+                        more_bounties = False
+                    else:
+                        logger.info(f"* Bounty {bounty_enum} not found")
+                except UnsupportedSchemaException as e:
+                    logger.info(f"* Unsupported Schema => {e}")
+                except Exception as e:
+                    extra_data = {
+                        'bounty_enum': bounty_enum,
+                        'more_bounties': more_bounties,
+                        'network': network
+                    }
+                    rollbar.report_exc_info(sys.exc_info(), extra_data=extra_data)
+                    logger.error(f"* Exception in sync_geth => {e}")
+                    failed.append(bounty_enum)
+
+            # bounties past the last one can never be found, so drop whatever is still queued
+            for _, future in pending:
+                future.cancel()
+        return failed
 
     def handle(self, *args, **options):
 
         # config
         network = options['network']
-        hour = datetime.datetime.now().hour
-        day = datetime.datetime.now().day
-        month = datetime.datetime.now().month
-
-        # iterate through all the bounties
-        bounty_enum = int(options['start_id'])
-        more_bounties = True
-        while more_bounties:
-            try:
-                # pull and process each bounty
-                print(f"[{month}/{day} {hour}:00] Getting bounty {bounty_enum}")
-                bounty = get_bounty(bounty_enum, network)
-                print(f"[{month}/{day} {hour}:00] Processing bounty {bounty_enum}")
-                web3_process_bounty(bounty)
-
-            except BountyNotFoundException:
-                more_bounties = False
-            except UnsupportedSchemaException as e:
-                logger.info(f"* Unsupported Schema => {e}")
-            except Exception as e:
-                extra_data = {
-                    'bounty_enum': bounty_enum,
-                    'more_bounties': more_bounties,
-                    'network': network
-                }
-                rollbar.report_exc_info(sys.exc_info(), extra_data=extra_data)
-                logger.error(f"* Exception in sync_geth => {e}")
-            finally:
-                # prepare for next loop
-                bounty_enum += 1
-
-                if bounty_enum > int(options['end_id']):
-                    more_bounties = False
+        workers = max(options['workers'], 1)
+        batch_size = max(options['batch_size'], 1)
+        start_id = int(options['start_id'])
+        end_id = int(options['end_id'])
+        self.fetched = StageCounter('fetch')
+        self.processed = StageCounter('process')
+        started = time.time()
+
+        if not options['incremental']:
+            self.sync(network, range(start_id, end_id + 1), workers, batch_size)
+        else:
+            # only blocks buried under enough confirmations are synced, so a reorg of the
+            # chain tip can never drop an event the checkpoint has already moved past
+            to_block = get_block_number(network) - max(options['confirmations'], 0)
+            last_block = ChainSyncCheckpoint.get_last_block(network)
+            if last_block is None:
+                print(f"- no checkpoint for {network}, falling back to a full rescan up to block {to_block}")
+                failed = self.sync(network, range(start_id, end_id + 1), workers, batch_size)
+            else:
+                bounty_enums = []
+                if last_block < to_block:
+                    bounty_enums = get_bounty_ids_from_events(
+                        network, last_block + 1, to_block, blocks_per_request=max(options['blocks_per_request'], 1))
+                    print(f"- {len(bounty_enums)} bounties touched between blocks {last_block + 1} and {to_block}")
+                else:
+                    print(f"- {network} already synced up to block {last_block}")
+                    to_block = last_block
+                # the bounties that failed on a previous run are synced again, until they succeed
+                retries = [
+                    bounty_enum for bounty_enum in ChainSyncCheckpoint.get_failed_bounty_ids(network)
+                    if bounty_enum not in bounty_enums
+                ]
+                if retries:
+                    print(f"- retrying {len(retries)} bounties that failed to sync")
+                failed = self.sync(
+                    network, list(bounty_enums) + retries, workers, batch_size, stop_when_not_found=False)
+            if failed:
+                print(f"- {len(failed)} bounties failed to sync and will be retried on the next run")
+            ChainSyncCheckpoint.advance(network, to_block, failed)
+
+        elapsed = time.time() - started
+        print(f"- synced {self.processed.count} bounties in {elapsed:.1f}s with {workers} workers")
+        print(f"- {self.fetched}")
+        print(f"- {self.processed}")
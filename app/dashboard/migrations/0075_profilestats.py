@@ -0,0 +1,36 @@
+# Generated by Django 2.0.5 on 2018-05-17 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0074_auto_20180515_1510'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('role', models.CharField(choices=[('newbie', 'newbie'), ('funder', 'funder'), ('coder', 'coder')], default='newbie', max_length=10)),
+                ('total_funded', models.DecimalField(decimal_places=2, default=0, max_digits=50)),
+                ('total_fulfilled', models.DecimalField(decimal_places=2, default=0, max_digits=50)),
+                ('num_bounties', models.IntegerField(default=0)),
+                ('open_count', models.IntegerField(default=0)),
+                ('success_rate', models.IntegerField(blank=True, default=0, help_text='Percentage, or null if no eligible bounty left open status.', null=True)),
+                ('loyalty_rate', models.IntegerField(default=0)),
+                ('stale', models.BooleanField(db_index=True, default=False)),
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='materialized_stats', to='dashboard.Profile')),
+            ],
+            options={
+                'verbose_name_plural': 'Profile Stats',
+            },
+        ),
+    ]
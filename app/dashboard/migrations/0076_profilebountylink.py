@@ -0,0 +1,30 @@
+# Generated by Django 2.0.5 on 2018-05-17 14:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0075_profilestats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileBountyLink',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('handle', models.CharField(max_length=255)),
+                ('relation_type', models.CharField(choices=[('funder', 'funder'), ('org', 'org'), ('fulfiller', 'fulfiller'), ('interested', 'interested'), ('tip', 'tip')], max_length=10)),
+                ('bounty', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='dashboard.Bounty')),
+                ('fulfillment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='dashboard.BountyFulfillment')),
+                ('interest', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='dashboard.Interest')),
+                ('profile', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bounty_links', to='dashboard.Profile')),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='profilebountylink',
+            index_together={('handle', 'relation_type')},
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 2.0.5 on 2018-05-18 09:12
+
+from django.db import migrations, models
+
+import economy.models
+
+
+def index_known_bounties(apps, schema_editor):
+    Bounty = apps.get_model('dashboard', 'Bounty')
+    BountyURLIndex = apps.get_model('dashboard', 'BountyURLIndex')
+    bounties = Bounty.objects.filter(web3_type='bounties_network') \
+        .order_by('network', 'standard_bounties_id', '-created_on') \
+        .distinct('network', 'standard_bounties_id') \
+        .values_list('network', 'standard_bounties_id', 'github_url')
+    BountyURLIndex.objects.bulk_create([
+        BountyURLIndex(network=network, standard_bounties_id=standard_bounties_id, url=url[:500])
+        for network, standard_bounties_id, url in bounties.iterator()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0076_profilebountylink'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BountyURLIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('network', models.CharField(max_length=255)),
+                ('standard_bounties_id', models.IntegerField()),
+                ('url', models.CharField(blank=True, max_length=500)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='bountyurlindex',
+            unique_together={('network', 'standard_bounties_id')},
+        ),
+        migrations.AlterIndexTogether(
+            name='bountyurlindex',
+            index_together={('network', 'url')},
+        ),
+        migrations.RunPython(index_known_bounties, migrations.RunPython.noop),
+    ]
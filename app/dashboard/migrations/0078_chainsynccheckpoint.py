@@ -0,0 +1,24 @@
+# Generated by Django 2.0.5 on 2018-05-19 10:41
+
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0077_bountyurlindex'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChainSyncCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('network', models.CharField(max_length=255, unique=True)),
+                ('last_block', models.BigIntegerField()),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+            ],
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 2.0.5 on 2018-05-20 08:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0078_chainsynccheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bounty',
+            name='raw_data_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AlterIndexTogether(
+            name='bounty',
+            index_together={('network', 'idx_status'), ('standard_bounties_id', 'network', 'raw_data_hash')},
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 2.0.5 on 2018-05-20 15:03
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0079_bounty_raw_data_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BountySyncJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('github_url', models.URLField(max_length=500)),
+                ('txid', models.CharField(max_length=255)),
+                ('network', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('done', 'done'), ('failed', 'failed')], default='pending', max_length=9)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_on', models.DateTimeField(default=economy.models.get_time)),
+                ('result', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default={})),
+                ('error', models.TextField(blank=True, default='')),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='bountysyncjob',
+            index_together={('status', 'next_attempt_on')},
+        ),
+    ]
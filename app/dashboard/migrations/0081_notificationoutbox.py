@@ -0,0 +1,42 @@
+# Generated by Django 2.0.5 on 2018-05-21 11:16
+
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0080_bountysyncjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('channel', models.CharField(choices=[('twitter', 'twitter'), ('slack', 'slack'), ('user_slack', 'user_slack'), ('github', 'github'), ('email', 'email')], max_length=20)),
+                ('event_name', models.CharField(max_length=255)),
+                ('payload', django.contrib.postgres.fields.jsonb.JSONField(blank=True, default={})),
+                ('dedupe_key', models.CharField(max_length=255, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('sent', 'sent'), ('skipped', 'skipped'), ('dead', 'dead')], default='pending', max_length=9)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_on', models.DateTimeField(default=economy.models.get_time)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('sent_on', models.DateTimeField(blank=True, null=True)),
+                ('bounty', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='dashboard.Bounty')),
+            ],
+            options={
+                'verbose_name_plural': 'Notification outbox',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='notificationoutbox',
+            index_together={('status', 'channel', 'next_attempt_on')},
+        ),
+    ]
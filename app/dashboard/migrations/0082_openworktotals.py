@@ -0,0 +1,29 @@
+# Generated by Django 2.0.5 on 2018-05-22 09:48
+
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0081_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OpenWorkTotals',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('network', models.CharField(max_length=255, unique=True)),
+                ('amount_usdt', models.DecimalField(decimal_places=2, default=0, max_digits=50)),
+                ('num_bounties', models.IntegerField(default=0)),
+                ('refreshed_on', models.DateTimeField(default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+            ],
+            options={
+                'verbose_name_plural': 'Open work totals',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 2.0.5 on 2018-05-22 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0082_openworktotals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueEnrichmentJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('done', 'done'), ('failed', 'failed')], default='pending', max_length=9)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_on', models.DateTimeField(default=economy.models.get_time)),
+                ('error', models.TextField(blank=True, default='')),
+                ('bounty', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrichment_jobs', to='dashboard.Bounty')),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='issueenrichmentjob',
+            index_together={('status', 'next_attempt_on')},
+        ),
+    ]
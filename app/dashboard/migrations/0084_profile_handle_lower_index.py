@@ -0,0 +1,18 @@
+# Generated by Django 2.0.5 on 2018-05-24 15:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0083_issueenrichmentjob'),
+    ]
+
+    operations = [
+        # lets ProfileStats.mark_stale look profiles up by their normalized (lowercased) handle
+        migrations.RunSQL(
+            'CREATE INDEX dashboard_profile_handle_lower ON dashboard_profile (LOWER(handle));',
+            reverse_sql='DROP INDEX dashboard_profile_handle_lower;',
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 2.0.5 on 2018-05-24 15:45
+
+from collections import defaultdict
+
+from django.db import migrations
+
+
+def normalize(handle):
+    return (handle or '').strip().lstrip('@').lower()
+
+
+def link_known_bounties(apps, schema_editor):
+    """Build the links of the existing bounties, as build_profile_bounty_links does."""
+    Bounty = apps.get_model('dashboard', 'Bounty')
+    ProfileBountyLink = apps.get_model('dashboard', 'ProfileBountyLink')
+    Tip = apps.get_model('dashboard', 'Tip')
+    if ProfileBountyLink.objects.exists():
+        return
+
+    tip_usernames = defaultdict(list)
+    for github_url, username in Tip.objects.exclude(github_url=None).values_list('github_url', 'username'):
+        tip_usernames[github_url].append(username)
+
+    bounty_ids = list(Bounty.objects.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(bounty_ids), 500):
+        links = []
+        bounties = Bounty.objects.filter(pk__in=bounty_ids[start:start + 500]) \
+            .prefetch_related('fulfillments__profile', 'interested__profile')
+        for bounty in bounties:
+            links.append(ProfileBountyLink(
+                handle=normalize(bounty.bounty_owner_github_username), relation_type='funder', bounty=bounty))
+            if bounty.github_url.lower().startswith('https://github.com/'):
+                org = bounty.github_url.split('/')[3] if len(bounty.github_url.split('/')) > 3 else ''
+                links.append(ProfileBountyLink(handle=normalize(org), relation_type='org', bounty=bounty))
+            for username in tip_usernames.get(bounty.github_url, []):
+                links.append(ProfileBountyLink(handle=normalize(username), relation_type='tip', bounty=bounty))
+            for fulfillment in bounty.fulfillments.all():
+                handles = {normalize(fulfillment.fulfiller_github_username)}
+                if fulfillment.profile_id:
+                    handles.add(normalize(fulfillment.profile.handle))
+                links += [
+                    ProfileBountyLink(handle=handle, relation_type='fulfiller', bounty=bounty,
+                                      profile_id=fulfillment.profile_id, fulfillment=fulfillment)
+                    for handle in handles
+                ]
+            for interest in bounty.interested.all():
+                links.append(ProfileBountyLink(
+                    handle=normalize(interest.profile.handle), relation_type='interested', bounty=bounty,
+                    profile_id=interest.profile_id, interest=interest))
+        ProfileBountyLink.objects.bulk_create([link for link in links if link.handle])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0084_profile_handle_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_known_bounties, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 2.0.5 on 2018-05-24 16:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0085_backfill_profilebountylink'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='bounty',
+            index_together={('network', 'idx_status'), ('standard_bounties_id', 'network', 'raw_data_hash'), ('modified_on',)},
+        ),
+        migrations.AlterIndexTogether(
+            name='bountyfulfillment',
+            index_together={('modified_on',)},
+        ),
+        migrations.AlterIndexTogether(
+            name='tip',
+            index_together={('modified_on',)},
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.0.5 on 2018-05-24 16:40
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0086_modified_on_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chainsynccheckpoint',
+            name='failed_bounty_ids',
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None),
+        ),
+    ]
@@ -18,8 +18,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import hashlib
+import json
 import logging
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
 from urllib.parse import urlsplit
 
 from django.conf import settings
@@ -28,18 +31,22 @@ from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.contrib.humanize.templatetags.humanize import naturalday, naturaltime
 from django.contrib.postgres.fields import ArrayField, JSONField
 from django.contrib.staticfiles.templatetags.staticfiles import static
-from django.db import models
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 import pytz
 import requests
 from dashboard.tokens import addr_to_token
-from economy.models import SuperModel
+from economy.models import SuperModel, get_time
 from economy.utils import ConversionRateNotFoundError, convert_amount, convert_token_to_usdt
 from github.utils import (
     _AUTH, HEADERS, TOKEN_URL, build_auth_dict, get_issue_comments, get_user, issue_number, org_name, repo_name,
@@ -47,7 +54,7 @@ from github.utils import (
 from rest_framework import serializers
 from web3 import Web3
 
-from .signals import m2m_changed_interested
+from .signals import bump_bounty_data_version, m2m_changed_interested
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +141,7 @@ class Bounty(SuperModel):
     is_open = models.BooleanField(help_text=_('Whether the bounty is still open for fulfillments.'))
     expires_date = models.DateTimeField()
     raw_data = JSONField()
+    raw_data_hash = models.CharField(max_length=64, blank=True, default='')
     metadata = JSONField(default={}, blank=True)
     current_bounty = models.BooleanField(
         default=False, help_text=_('Whether this bounty is the most current revision one or not'))
@@ -176,6 +184,8 @@ class Bounty(SuperModel):
         verbose_name_plural = 'Bounties'
         index_together = [
             ["network", "idx_status"],
+            ["standard_bounties_id", "network", "raw_data_hash"],
+            ["modified_on"],
         ]
 
     def __str__(self):
@@ -183,10 +193,30 @@ class Bounty(SuperModel):
         return f"{'(CURRENT) ' if self.current_bounty else ''}{self.title} {self.value_in_token} " \
                f"{self.token_name} {self.web3_created}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember what the loaded row adds to the open work totals, so saving it needs no extra read."""
+        instance = super().from_db(db, field_names, values)
+        instance.capture_open_work()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.capture_open_work()
+
+    def capture_open_work(self):
+        """Record the stored network and open work contribution, if every field it depends on is loaded."""
+        if not self.get_deferred_fields() & {'network', 'current_bounty', 'idx_status', 'value_in_usdt_now'}:
+            self._open_work_before = (
+                self.network, OpenWorkTotals.contribution(self.current_bounty, self.idx_status, self.value_in_usdt_now)
+            )
+
     def save(self, *args, **kwargs):
         """Define custom handling for saving bounties."""
         if self.bounty_owner_github_username:
             self.bounty_owner_github_username = self.bounty_owner_github_username.lstrip('@')
+        if not self.raw_data_hash and self.raw_data is not None:
+            self.raw_data_hash = hash_raw_data(self.raw_data)
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -366,6 +396,19 @@ class Bounty(SuperModel):
     def status(self):
         """Determine the status of the Bounty.
 
+        Returns:
+            str: The status of the Bounty.
+
+        """
+        return self.derive_status()
+
+    def derive_status(self, snapshot=None):
+        """Determine the status of the Bounty from a snapshot of its related rows.
+
+        Args:
+            snapshot (BountySnapshot): The fulfillments and interests to derive from.
+                Defaults to: a snapshot read lazily from the database.
+
         Raises:
             Exception: Catch whether or not any exception is encountered and
                 return unknown for status.
@@ -376,18 +419,18 @@ class Bounty(SuperModel):
         """
         if self.override_status:
             return self.override_status
+        if snapshot is None:
+            snapshot = BountySnapshot(self)
         if self.is_legacy:
             # TODO: Remove following full deprecation of legacy bounties
             try:
-                fulfillments = self.fulfillments \
-                    .exclude(fulfiller_address='0x0000000000000000000000000000000000000000') \
-                    .exists()
+                fulfillments = snapshot.has_submitted_fulfillments
                 if not self.is_open:
                     if timezone.now() > self.expires_date and fulfillments:
                         return 'expired'
                     return 'done'
                 elif not fulfillments:
-                    if self.pk and self.interested.exists():
+                    if self.pk and snapshot.has_interests:
                         return 'started'
                     return 'open'
                 return 'submitted'
@@ -404,7 +447,7 @@ class Bounty(SuperModel):
                     # If its not expired or done, it must be cancelled.
                     return 'cancelled'
                 if self.num_fulfillments == 0:
-                    if self.pk and self.interested.exists():
+                    if self.pk and snapshot.has_interests:
                         return 'started'
                     return 'open'
                 return 'submitted'
@@ -694,6 +737,13 @@ class BountyFulfillment(SuperModel):
     bounty = models.ForeignKey(Bounty, related_name='fulfillments', on_delete=models.CASCADE)
     profile = models.ForeignKey('dashboard.Profile', related_name='fulfilled', on_delete=models.CASCADE, null=True)
 
+    class Meta:
+        """Define metadata associated with BountyFulfillment."""
+
+        index_together = [
+            ["modified_on"],
+        ]
+
     def __str__(self):
         """Define the string representation of BountyFulfillment.
 
@@ -733,6 +783,492 @@ class BountySyncRequest(SuperModel):
     processed = models.BooleanField()
 
 
+class BountySyncJob(SuperModel):
+    """Define a queued sync of a bounty with web3, run by the `process_sync_jobs` worker."""
+
+    STATUS_CHOICES = (
+        ('pending', 'pending'),
+        ('running', 'running'),
+        ('done', 'done'),
+        ('failed', 'failed'),
+    )
+
+    github_url = models.URLField(max_length=500)
+    txid = models.CharField(max_length=255)
+    network = models.CharField(max_length=255)
+    status = models.CharField(max_length=9, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=get_time)
+    result = JSONField(default={}, blank=True)
+    error = models.TextField(default='', blank=True)
+
+    class Meta:
+        """Define metadata associated with BountySyncJob."""
+
+        index_together = [
+            ['status', 'next_attempt_on'],
+        ]
+
+    def __str__(self):
+        return f'{self.pk} {self.status} {self.network} {self.github_url}'
+
+    @classmethod
+    def claim(cls, limit=10):
+        """Mark the due pending jobs as running and return them.
+
+        Rows locked by another worker are skipped, so several workers can
+        claim from the queue at the same time without running a job twice.
+
+        Args:
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list of BountySyncJob: The claimed jobs, oldest first.
+
+        """
+        with transaction.atomic():
+            jobs = list(
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(status='pending', next_attempt_on__lte=get_time()).order_by('next_attempt_on', 'pk')[:limit]
+            )
+            cls.objects.filter(pk__in=[job.pk for job in jobs]).update(status='running', modified_on=get_time())
+        for job in jobs:
+            job.status = 'running'
+        return jobs
+
+    def succeed(self, result):
+        """Record the result of the sync."""
+        self.status = 'done'
+        self.result = result
+        self.error = ''
+        self.save()
+
+    def retry(self, error, max_attempts, backoff):
+        """Schedule another attempt after an exponential backoff, or fail the job once out of attempts.
+
+        Args:
+            error (str): Why the attempt did not succeed.
+            max_attempts (int): The number of attempts after which the job fails.
+            backoff (int): The seconds waited after the first attempt, doubled after each one.
+
+        """
+        self.error = error
+        if self.attempts >= max_attempts:
+            self.status = 'failed'
+        else:
+            self.status = 'pending'
+            self.next_attempt_on = get_time() + timezone.timedelta(seconds=backoff * 2 ** (self.attempts - 1))
+        self.save()
+
+    def to_dict(self):
+        """Get the progress of the job, as exposed by the status endpoint."""
+        return {
+            'job_id': self.pk,
+            'status': self.status,
+            'attempts': self.attempts,
+            'next_attempt_on': self.next_attempt_on.isoformat() if self.status == 'pending' else None,
+            'did_change': self.result.get('did_change'),
+            'url': self.result.get('url'),
+            'error': self.error,
+        }
+
+
+class NotificationOutbox(SuperModel):
+    """Define a bounty event notification waiting to be posted to one channel.
+
+    Rows are written in the same transaction as the bounty revision that
+    raised the event and drained by the `process_notification_outbox` worker,
+    so a notification is never lost to a crash or a slow external service.
+
+    """
+
+    CHANNELS = ['twitter', 'slack', 'user_slack', 'github', 'email']
+    STATUS_CHOICES = (
+        ('pending', 'pending'),
+        ('running', 'running'),
+        ('sent', 'sent'),
+        ('skipped', 'skipped'),
+        ('dead', 'dead'),
+    )
+
+    bounty = models.ForeignKey('dashboard.Bounty', related_name='notifications', on_delete=models.CASCADE)
+    channel = models.CharField(max_length=20, choices=[(channel, channel) for channel in CHANNELS])
+    event_name = models.CharField(max_length=255)
+    payload = JSONField(default={}, blank=True)
+    dedupe_key = models.CharField(max_length=255, unique=True)
+    status = models.CharField(max_length=9, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=get_time)
+    last_error = models.TextField(default='', blank=True)
+    sent_on = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """Define metadata associated with NotificationOutbox."""
+
+        verbose_name_plural = 'Notification outbox'
+        index_together = [
+            ['status', 'channel', 'next_attempt_on'],
+        ]
+
+    def __str__(self):
+        return f'{self.pk} {self.channel} {self.event_name} {self.status}'
+
+    @classmethod
+    def enqueue(cls, bounty, event_name, profile_pairs=None):
+        """Queue the notifications of a bounty event, once per channel.
+
+        The deduplication key ties each notification to the chain state of the
+        bounty, so the same change synced twice is only announced once.
+
+        Args:
+            bounty (dashboard.models.Bounty): The new revision of the bounty.
+            event_name (str): The name of the event.
+            profile_pairs (list of tuples): The username and profile page URL
+                pairs of the fulfillers, for the github comment.
+
+        Returns:
+            list of NotificationOutbox: The notifications queued.
+
+        """
+        state = bounty.raw_data_hash or bounty.pk
+        keys = {
+            channel: f'{channel}:{bounty.network}:{bounty.standard_bounties_id}:{event_name}:{state}'
+            for channel in cls.CHANNELS
+        }
+        queued = set(cls.objects.filter(dedupe_key__in=keys.values()).values_list('dedupe_key', flat=True))
+        payload = {'profile_pairs': profile_pairs} if profile_pairs else {}
+        return cls.objects.bulk_create([
+            cls(bounty=bounty, channel=channel, event_name=event_name, payload=payload, dedupe_key=key)
+            for channel, key in keys.items() if key not in queued
+        ])
+
+    @classmethod
+    def claim(cls, channel, limit=10):
+        """Mark the due pending notifications of a channel as running and return them.
+
+        Args:
+            channel (str): The channel to claim notifications for.
+            limit (int): The maximum number of notifications to claim.
+
+        Returns:
+            list of NotificationOutbox: The claimed notifications, oldest first.
+
+        """
+        with transaction.atomic():
+            notifications = list(
+                cls.objects.select_for_update(skip_locked=True).select_related('bounty')
+                .filter(status='pending', channel=channel, next_attempt_on__lte=get_time())
+                .order_by('next_attempt_on', 'pk')[:limit]
+            )
+            cls.objects.filter(pk__in=[notification.pk for notification in notifications]) \
+                .update(status='running', modified_on=get_time())
+        for notification in notifications:
+            notification.status = 'running'
+        return notifications
+
+    def succeed(self, sent):
+        """Record that the notification was posted, or that the channel did not apply to it."""
+        self.status = 'sent' if sent else 'skipped'
+        self.sent_on = get_time() if sent else None
+        self.last_error = ''
+        self.save()
+
+    def retry(self, error, max_attempts, backoff):
+        """Schedule another attempt after an exponential backoff, or dead-letter the notification.
+
+        Args:
+            error (str): Why the attempt failed.
+            max_attempts (int): The number of attempts after which the notification is dead.
+            backoff (int): The seconds waited after the first attempt, doubled after each one.
+
+        """
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.status = 'dead'
+        else:
+            self.status = 'pending'
+            self.next_attempt_on = get_time() + timezone.timedelta(seconds=backoff * 2 ** (self.attempts - 1))
+        self.save()
+
+
+class IssueEnrichmentJob(SuperModel):
+    """Define a queued fetch of the Github issue of a new bounty revision.
+
+    Jobs are queued once the transaction creating the revision has committed
+    and run by the `process_issue_enrichment` worker, so a slow or unavailable
+    Github API never holds up the ingestion of bounties from the chain.
+
+    """
+
+    STATUS_CHOICES = (
+        ('pending', 'pending'),
+        ('running', 'running'),
+        ('done', 'done'),
+        ('failed', 'failed'),
+    )
+
+    bounty = models.ForeignKey('dashboard.Bounty', related_name='enrichment_jobs', on_delete=models.CASCADE)
+    status = models.CharField(max_length=9, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=get_time)
+    error = models.TextField(default='', blank=True)
+
+    class Meta:
+        """Define metadata associated with IssueEnrichmentJob."""
+
+        index_together = [
+            ['status', 'next_attempt_on'],
+        ]
+
+    def __str__(self):
+        return f'{self.pk} {self.status} {self.bounty_id}'
+
+    @classmethod
+    def enqueue(cls, bounty_ids):
+        """Queue the enrichment of the provided bounties.
+
+        Args:
+            bounty_ids (list of int): The primary keys of the bounties.
+
+        Returns:
+            list of IssueEnrichmentJob: The queued jobs.
+
+        """
+        return cls.objects.bulk_create([cls(bounty_id=bounty_id) for bounty_id in bounty_ids])
+
+    @classmethod
+    def claim(cls, limit=50):
+        """Mark the due pending jobs as running and return them, with their bounties.
+
+        Args:
+            limit (int): The maximum number of jobs to claim.
+
+        Returns:
+            list of IssueEnrichmentJob: The claimed jobs, oldest first.
+
+        """
+        with transaction.atomic():
+            jobs = list(
+                cls.objects.select_for_update(skip_locked=True)
+                .filter(status='pending', next_attempt_on__lte=get_time()).order_by('next_attempt_on', 'pk')[:limit]
+            )
+            cls.objects.filter(pk__in=[job.pk for job in jobs]).update(status='running', modified_on=get_time())
+        bounties = Bounty.objects.only('pk', 'github_url', 'title').in_bulk([job.bounty_id for job in jobs])
+        for job in jobs:
+            job.status = 'running'
+            job.bounty = bounties.get(job.bounty_id)
+        return jobs
+
+    def retry(self, error, max_attempts, backoff):
+        """Schedule another attempt after an exponential backoff, or fail the job once out of attempts.
+
+        Args:
+            error (str): Why the attempt did not succeed.
+            max_attempts (int): The number of attempts after which the job fails.
+            backoff (int): The seconds waited after the first attempt, doubled after each one.
+
+        """
+        self.error = error
+        if self.attempts >= max_attempts:
+            self.status = 'failed'
+        else:
+            self.status = 'pending'
+            self.next_attempt_on = get_time() + timezone.timedelta(seconds=backoff * 2 ** (self.attempts - 1))
+        self.save()
+
+
+class BountyURLIndex(models.Model):
+    """Index the webReferenceURL of every bounty seen on chain by its standard bounties id.
+
+    Every bounty fetched from the chain is recorded, including those whose
+    schema is not supported and which never become a Bounty, so that the
+    highest indexed id marks how far the chain has been read.
+
+    """
+
+    network = models.CharField(max_length=255)
+    standard_bounties_id = models.IntegerField()
+    url = models.CharField(max_length=500, blank=True)
+    modified_on = models.DateTimeField(default=get_time)
+
+    class Meta:
+        """Define metadata associated with BountyURLIndex."""
+
+        unique_together = ('network', 'standard_bounties_id')
+        index_together = [
+            ['network', 'url'],
+        ]
+
+    def __str__(self):
+        return f'{self.network}:{self.standard_bounties_id} {self.url}'
+
+    @classmethod
+    def record(cls, bounty_details):
+        """Record the URL of a bounty as returned by `dashboard.utils.get_bounty`."""
+        from dashboard.helpers import normalize_url
+        payload = (bounty_details.get('data') or {}).get('payload') or {}
+        url = payload.get('webReferenceURL') or ''
+        if url and isinstance(url, str):
+            url = normalize_url(url)[:500]
+        else:
+            url = ''
+        cls.objects.update_or_create(
+            network=bounty_details['network'],
+            standard_bounties_id=bounty_details['id'],
+            defaults={'url': url, 'modified_on': get_time()},
+        )
+
+    @classmethod
+    def lookup(cls, url, network):
+        """Get the highest standard bounties id indexed for the URL, or None."""
+        from dashboard.helpers import normalize_url
+        return cls.objects.filter(network=network, url=normalize_url(url)) \
+            .order_by('-standard_bounties_id').values_list('standard_bounties_id', flat=True).first()
+
+    @classmethod
+    def high_water_mark(cls, network):
+        """Get the highest standard bounties id indexed on the network, or None."""
+        return cls.objects.filter(network=network).aggregate(
+            high_water_mark=models.Max('standard_bounties_id'))['high_water_mark']
+
+
+class ChainSyncCheckpoint(models.Model):
+    """Track the last block whose StandardBounties events have been synced, per network.
+
+    The bounties that failed to sync up to that block are kept alongside, and
+    retried by the next incremental sync.
+
+    """
+
+    network = models.CharField(max_length=255, unique=True)
+    last_block = models.BigIntegerField()
+    failed_bounty_ids = ArrayField(models.BigIntegerField(), blank=True, default=list)
+    modified_on = models.DateTimeField(default=get_time)
+
+    def __str__(self):
+        return f'{self.network} @ {self.last_block}'
+
+    @classmethod
+    def get_last_block(cls, network):
+        """Get the last synced block of the network, or None if it was never synced incrementally."""
+        return cls.objects.filter(network=network).values_list('last_block', flat=True).first()
+
+    @classmethod
+    def get_failed_bounty_ids(cls, network):
+        """Get the standard bounties ids that failed to sync up to the last synced block of the network."""
+        return cls.objects.filter(network=network).values_list('failed_bounty_ids', flat=True).first() or []
+
+    @classmethod
+    def advance(cls, network, last_block, failed_bounty_ids=None):
+        """Record that every event of the network up to and including `last_block` has been synced.
+
+        Args:
+            network (str): The network synced.
+            last_block (int): The last block whose events have been synced.
+            failed_bounty_ids (iterable of int): The bounties touched by those events that failed
+                to sync, to retry on the next run. Defaults to: None.
+
+        """
+        cls.objects.update_or_create(
+            network=network,
+            defaults={
+                'last_block': last_block,
+                'failed_bounty_ids': sorted(set(failed_bounty_ids or [])),
+                'modified_on': get_time(),
+            },
+        )
+
+
+class OpenWorkTotals(models.Model):
+    """Maintain the USD value of the open and submitted bounties of a network.
+
+    The totals are adjusted by every saved or deleted Bounty, and re-derived
+    from scratch by `get_prices` and the hourly `refresh_open_work_totals`
+    command, which bounds the drift from bulk updates that bypass the save
+    signals.
+
+    """
+
+    STATUSES = ['open', 'submitted']
+
+    network = models.CharField(max_length=255, unique=True)
+    amount_usdt = models.DecimalField(default=0, decimal_places=2, max_digits=50)
+    num_bounties = models.IntegerField(default=0)
+    refreshed_on = models.DateTimeField(default=get_time)
+    modified_on = models.DateTimeField(default=get_time)
+
+    class Meta:
+        """Define metadata associated with OpenWorkTotals."""
+
+        verbose_name_plural = 'Open work totals'
+
+    def __str__(self):
+        return f'{self.network}: {self.amount_usdt} USD in {self.num_bounties} bounties'
+
+    @staticmethod
+    def cache_key(network):
+        return f'open_work_totals:{network}'
+
+    @classmethod
+    def contribution(cls, current_bounty, idx_status, value_in_usdt_now):
+        """Get what a bounty adds to the totals of its network, as a tuple of its USD value and count."""
+        if not current_bounty or idx_status not in cls.STATUSES:
+            return Decimal(0), 0
+        # rounded like the decimal column, since a freshly derived value may still be a float
+        return Decimal(str(value_in_usdt_now or 0)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP), 1
+
+    @classmethod
+    def refresh(cls, network):
+        """Re-derive the totals of the network from its bounties."""
+        totals = Bounty.objects.filter(network=network, current_bounty=True, idx_status__in=cls.STATUSES).aggregate(
+            amount_usdt=models.Sum('value_in_usdt_now'), num_bounties=models.Count('pk'))
+        now = get_time()
+        row, _ = cls.objects.update_or_create(network=network, defaults={
+            'amount_usdt': totals['amount_usdt'] or 0,
+            'num_bounties': totals['num_bounties'],
+            'refreshed_on': now,
+            'modified_on': now,
+        })
+        cache.delete(cls.cache_key(network))
+        return row
+
+    @classmethod
+    def refresh_all(cls):
+        """Re-derive the totals of every network, eg: after the conversion rates changed."""
+        networks = set(Bounty.objects.filter(current_bounty=True).values_list('network', flat=True).distinct())
+        networks |= set(cls.objects.values_list('network', flat=True))
+        return [cls.refresh(network) for network in sorted(networks)]
+
+    @classmethod
+    def adjust(cls, network, amount_usdt, num_bounties):
+        """Add the change of a bounty to the totals of its network, in place."""
+        updated = cls.objects.filter(network=network).update(
+            amount_usdt=models.F('amount_usdt') + amount_usdt,
+            num_bounties=models.F('num_bounties') + num_bounties,
+            modified_on=get_time(),
+        )
+        if not updated:
+            cls.refresh(network)
+
+    @classmethod
+    def get_cached(cls, network='mainnet'):
+        """Get the stored totals of the network, at most OPEN_WORK_TOTALS_CACHE_TIMEOUT seconds stale.
+
+        Only the stored row is read, as this is called while rendering pages;
+        totals that were never derived read as zero until the next refresh.
+
+        Returns:
+            dict: The `amount_usdt` and `num_bounties` of the open and submitted bounties.
+
+        """
+        totals = cache.get(cls.cache_key(network))
+        if totals is None:
+            totals = cls.objects.filter(network=network).values('amount_usdt', 'num_bounties').first()
+            totals = totals or {'amount_usdt': Decimal(0), 'num_bounties': 0}
+            cache.set(cls.cache_key(network), totals, settings.OPEN_WORK_TOTALS_CACHE_TIMEOUT)
+        return totals
+
+
 class Subscription(SuperModel):
 
     email = models.EmailField(max_length=255)
@@ -766,6 +1302,13 @@ class Tip(SuperModel):
     from_address = models.CharField(max_length=255, default='', blank=True)
     receive_address = models.CharField(max_length=255, default='', blank=True)
 
+    class Meta:
+        """Define metadata associated with Tip."""
+
+        index_together = [
+            ["modified_on"],
+        ]
+
     def __str__(self):
         """Return the string representation for a tip."""
         return f"({self.network}) - {self.status}{' ORPHAN' if not self.emails else ''} " \
@@ -847,38 +1390,204 @@ class Tip(SuperModel):
 #         instance.bounty_owner_github_username = instance.bounty_owner_github_username.lstrip('@')
 
 
-# method for updating
-@receiver(pre_save, sender=Bounty, dispatch_uid="psave_bounty")
-def psave_bounty(sender, instance, **kwargs):
-    idx_experience_level = {
-        'Unknown': 1,
-        'Beginner': 2,
-        'Intermediate': 3,
-        'Advanced': 4,
-    }
+class BountySnapshot(object):
+    """Capture the related rows a Bounty's derived fields depend on.
+
+    Fulfillments and interests are each read at most once, and only when first
+    needed, so deriving every indexed column of a Bounty costs at most two
+    queries.  Prefetched relations (see `recompute_derived`) are reused as-is,
+    and rows already fetched by the caller (see `BountyListSerializer`) may be
+    handed over directly.
+
+    """
+
+    def __init__(self, bounty, fulfillments=None, interests=None):
+        """Initialize the snapshot for the provided Bounty.
+
+        Args:
+            bounty (Bounty): The Bounty to snapshot.
+            fulfillments (list of BountyFulfillment): The already fetched fulfillments of the Bounty.
+                Defaults to: None, read lazily from the database.
+            interests (list of Interest): The already fetched interests in the Bounty.
+                Defaults to: None, read lazily from the database.
+
+        """
+        self.bounty = bounty
+        if fulfillments is not None:
+            self.__dict__['fulfillments'] = sorted(fulfillments, key=lambda fulfillment: fulfillment.pk)
+        if interests is not None:
+            self.__dict__['interests'] = sorted(interests, key=lambda interest: interest.pk)
+
+    @cached_property
+    def fulfillments(self):
+        """Return the fulfillments of the Bounty ordered by primary key."""
+        if not self.bounty.pk:
+            return []
+        return sorted(self.bounty.fulfillments.all(), key=lambda fulfillment: fulfillment.pk)
+
+    @cached_property
+    def interests(self):
+        """Return the interests in the Bounty ordered by primary key."""
+        if not self.bounty.pk:
+            return []
+        return sorted(self.bounty.interested.all(), key=lambda interest: interest.pk)
+
+    @property
+    def has_submitted_fulfillments(self):
+        return any(
+            fulfillment.fulfiller_address != '0x0000000000000000000000000000000000000000'
+            for fulfillment in self.fulfillments
+        )
+
+    @property
+    def has_interests(self):
+        return bool(self.interests)
+
+    @property
+    def fulfillment_accepted_on(self):
+        accepted = [fulfillment for fulfillment in self.fulfillments if fulfillment.accepted]
+        return accepted[0].accepted_on if accepted else None
+
+    @property
+    def fulfillment_submitted_on(self):
+        return self.fulfillments[0].created_on if self.fulfillments else None
+
+    @property
+    def fulfillment_started_on(self):
+        return self.interests[0].created if self.interests else None
+
+
+BOUNTY_IDX_EXPERIENCE_LEVEL = {
+    'Unknown': 1,
+    'Beginner': 2,
+    'Intermediate': 3,
+    'Advanced': 4,
+}
+
+BOUNTY_IDX_PROJECT_LENGTH = {
+    'Unknown': 1,
+    'Hours': 2,
+    'Days': 3,
+    'Weeks': 4,
+    'Months': 5,
+}
+
+BOUNTY_DERIVED_FIELDS = [
+    'idx_status', 'fulfillment_accepted_on', 'fulfillment_submitted_on', 'fulfillment_started_on', '_val_usd_db',
+    'idx_experience_level', 'idx_project_length', 'token_value_time_peg', 'token_value_in_usdt', 'value_in_usdt_now',
+    'value_in_usdt', 'value_in_eth', 'value_true',
+]
+
+
+def hash_raw_data(raw_data):
+    """Get the fingerprint of the raw data of a bounty.
+
+    Args:
+        raw_data (dict): The bounty details, as returned by `dashboard.utils.get_bounty`.
+
+    Returns:
+        str: The hex SHA-256 digest of the raw data serialized with sorted keys, which
+            is the same for every equal dict regardless of the order of its keys.
+
+    """
+    serialized = json.dumps(raw_data, sort_keys=True, separators=(',', ':'), cls=DjangoJSONEncoder)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def derive_bounty_fields(bounty, snapshot=None):
+    """Compute every derived column of a Bounty in a single pass.
 
-    idx_project_length = {
-        'Unknown': 1,
-        'Hours': 2,
-        'Days': 3,
-        'Weeks': 4,
-        'Months': 5,
+    The status and each conversion are evaluated exactly once, in place of the
+    repeated property reads the individual getters would otherwise perform.
+
+    Args:
+        bounty (Bounty): The Bounty to derive the fields of.
+        snapshot (BountySnapshot): The related rows to derive from.
+            Defaults to: a new snapshot of the provided Bounty.
+
+    Returns:
+        dict: The derived field values keyed by field name.
+
+    """
+    snapshot = snapshot or BountySnapshot(bounty)
+    status = bounty.derive_status(snapshot)
+    is_open_status = status in Bounty.OPEN_STATUSES
+    value_in_usdt_now = bounty.get_value_in_usdt_now
+    value_in_usdt = value_in_usdt_now if is_open_status else bounty.value_in_usdt_then
+
+    return {
+        'idx_status': status,
+        'fulfillment_accepted_on': snapshot.fulfillment_accepted_on,
+        'fulfillment_submitted_on': snapshot.fulfillment_submitted_on,
+        'fulfillment_started_on': snapshot.fulfillment_started_on,
+        '_val_usd_db': value_in_usdt if value_in_usdt else 0,
+        '_val_usd_db_now': value_in_usdt_now if value_in_usdt_now else 0,
+        'idx_experience_level': BOUNTY_IDX_EXPERIENCE_LEVEL.get(bounty.experience_level, 0),
+        'idx_project_length': BOUNTY_IDX_PROJECT_LENGTH.get(bounty.project_length, 0),
+        'token_value_time_peg': timezone.now() if is_open_status else bounty.web3_created,
+        'token_value_in_usdt': bounty.token_value_in_usdt_now if is_open_status else bounty.token_value_in_usdt_then,
+        'value_in_usdt_now': value_in_usdt_now,
+        'value_in_usdt': value_in_usdt,
+        'value_in_eth': bounty.get_value_in_eth,
+        'value_true': bounty.get_value_true,
     }
 
-    instance.idx_status = instance.status
-    instance.fulfillment_accepted_on = instance.get_fulfillment_accepted_on
-    instance.fulfillment_submitted_on = instance.get_fulfillment_submitted_on
-    instance.fulfillment_started_on = instance.get_fulfillment_started_on
-    instance._val_usd_db = instance.get_value_in_usdt if instance.get_value_in_usdt else 0
-    instance._val_usd_db_now = instance.get_value_in_usdt_now if instance.get_value_in_usdt_now else 0
-    instance.idx_experience_level = idx_experience_level.get(instance.experience_level, 0)
-    instance.idx_project_length = idx_project_length.get(instance.project_length, 0)
-    instance.token_value_time_peg = instance.get_token_value_time_peg
-    instance.token_value_in_usdt = instance.get_token_value_in_usdt
-    instance.value_in_usdt_now = instance.get_value_in_usdt_now
-    instance.value_in_usdt = instance.get_value_in_usdt
-    instance.value_in_eth = instance.get_value_in_eth
-    instance.value_true = instance.get_value_true
+
+def recompute_derived(queryset, batch_size=500):
+    """Recompute and store the derived columns of every Bounty in the queryset.
+
+    Fulfillments and interests are prefetched for each batch and the results
+    are written back with one UPDATE per batch, bypassing the per-row save
+    signals entirely; cached API responses are invalidated once at the end.
+    A bounty whose fields can't be derived or written (e.g. a token without a
+    rate) is logged and skipped, and the rest of the batch is still updated.
+
+    Args:
+        queryset (QuerySet of Bounty): The bounties to recompute.
+        batch_size (int): The number of bounties to read and write at a time.
+
+    Returns:
+        int: The number of bounties updated.
+
+    """
+    from app.utils import bulk_update
+
+    fields = BOUNTY_DERIVED_FIELDS + ['modified_on']
+    updated = 0
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(pks), batch_size):
+        bounties = []
+        for bounty in Bounty.objects.filter(pk__in=pks[start:start + batch_size]) \
+                .prefetch_related('fulfillments', 'interested'):
+            try:
+                for field, value in derive_bounty_fields(bounty).items():
+                    setattr(bounty, field, value)
+            except Exception as e:
+                logger.exception('could not recompute bounty %s: %s', bounty.pk, e)
+                continue
+            bounty.modified_on = get_time()
+            bounties.append(bounty)
+        try:
+            updated += bulk_update(Bounty, bounties, fields)
+        except Exception as e:
+            # find the offending rows by writing the batch one bounty at a time
+            logger.warning('could not update bounties %s-%s at once: %s', pks[start], bounties[-1].pk, e)
+            for bounty in bounties:
+                try:
+                    updated += bulk_update(Bounty, [bounty], fields)
+                except Exception as e:
+                    logger.exception('could not update bounty %s: %s', bounty.pk, e)
+    if updated:
+        bump_bounty_data_version(sender=Bounty)
+    return updated
+
+
+# method for updating
+@receiver(pre_save, sender=Bounty, dispatch_uid="psave_bounty")
+def psave_bounty(sender, instance, **kwargs):
+    instance._snapshot = BountySnapshot(instance)
+    for field, value in derive_bounty_fields(instance, instance._snapshot).items():
+        setattr(instance, field, value)
 
 
 class Interest(models.Model):
@@ -939,14 +1648,7 @@ class Profile(SuperModel):
 
     @property
     def bounties(self):
-        fulfilled_bounty_ids = self.fulfilled.all().values_list('bounty_id')
-        bounties = Bounty.objects.filter(github_url__istartswith=self.github_url, current_bounty=True)
-        for interested in self.interested.all():
-            bounties = bounties | Bounty.objects.filter(interested=interested, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(pk__in=fulfilled_bounty_ids, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(bounty_owner_github_username__iexact=self.handle, current_bounty=True) | Bounty.objects.filter(bounty_owner_github_username__iexact="@" + self.handle, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(github_url__in=[url for url in self.tips.values_list('github_url', flat=True)], current_bounty=True)
-        bounties = bounties.distinct()
+        bounties = Bounty.objects.filter(pk__in=ProfileBountyLink.bounty_ids(self.handle), current_bounty=True)
         return bounties.order_by('-web3_created')
 
     @property
@@ -976,25 +1678,21 @@ class Profile(SuperModel):
 
         include_gitcoin_users = len(_return) < limit_to_num
         if include_gitcoin_users:
-            for b in self.bounties:
-                vals = [b.bounty_owner_github_username]
-                for val in vals:
-                    if val:
-                        _return.append(val.lstrip('@'))
-            for t in self.tips:
-                vals = [t.username]
-                for val in vals:
-                    if val:
-                        _return.append(val.lstrip('@'))
+            for val in self.bounties.values_list('bounty_owner_github_username', flat=True):
+                if val:
+                    _return.append(val.lstrip('@'))
+            for val in self.tips.values_list('username', flat=True):
+                if val:
+                    _return.append(val.lstrip('@'))
         _return = list(set(_return))
         _return.sort()
         return _return[:limit_to_num]
 
     @property
     def desc(self):
-        stats = self.stats
-        role = stats[0][0]
-        total_funded_participated = stats[1][0]
+        stats = self.profile_stats
+        role = stats.role
+        total_funded_participated = stats.num_bounties
         plural = 's' if total_funded_participated != 1 else ''
         return f"@{self.handle} is a {role} who has participated in {total_funded_participated} " \
                f"funded issue{plural} on Gitcoin"
@@ -1019,52 +1717,22 @@ class Profile(SuperModel):
         """
         return self.user.is_staff if self.user else False
 
+    @cached_property
+    def profile_stats(self):
+        """Return the materialized ProfileStats, rebuilding them first if stale."""
+        if not self.pk:
+            return ProfileStats(profile=self, **ProfileStats.compute(self))
+        try:
+            stats = self.materialized_stats
+        except ProfileStats.DoesNotExist:
+            stats = None
+        if stats is None or stats.stale:
+            stats = ProfileStats.refresh(self)
+        return stats
+
     @property
     def stats(self):
-        bounties = self.bounties.stats_eligible()
-        loyalty_rate = 0
-        total_funded = sum([bounty.value_in_usdt if bounty.value_in_usdt else 0 for bounty in bounties if bounty.is_funder(self.handle)])
-        total_fulfilled = sum([bounty.value_in_usdt if bounty.value_in_usdt else 0 for bounty in bounties if bounty.is_hunter(self.handle)])
-        print(total_funded, total_fulfilled)
-        role = 'newbie'
-        if total_funded > total_fulfilled:
-            role = 'funder'
-        elif total_funded < total_fulfilled:
-            role = 'coder'
-
-        loyalty_rate = self.fulfilled.filter(accepted=True).count()
-        success_rate = 0
-        if bounties.exists():
-            numer = bounties.filter(idx_status__in=['submitted', 'started', 'done']).count()
-            denom = bounties.exclude(idx_status__in=['open']).count()
-            success_rate = int(round(numer * 1.0 / denom, 2) * 100) if denom != 0 else 'N/A'
-        if success_rate == 0:
-            success_rate = 'N/A'
-            loyalty_rate = 'N/A'
-        else:
-            success_rate = f"{success_rate}%"
-            loyalty_rate = f"{loyalty_rate}x"
-        if role == 'newbie':
-            return [
-                (role, 'Status'),
-                (bounties.count(), 'Total Funded Issues'),
-                (bounties.filter(idx_status='open').count(), 'Open Funded Issues'),
-                (loyalty_rate, 'Loyalty Rate'),
-            ]
-        elif role == 'coder':
-            return [
-                (role, 'Primary Role'),
-                (bounties.count(), 'Total Funded Issues'),
-                (success_rate, 'Success Rate'),
-                (loyalty_rate, 'Loyalty Rate'),
-            ]
-        # funder
-        return [
-            (role, 'Primary Role'),
-            (bounties.count(), 'Total Funded Issues'),
-            (bounties.filter(idx_status='open').count(), 'Open Funded Issues'),
-            (success_rate, 'Success Rate'),
-        ]
+        return self.profile_stats.as_list()
 
     @property
     def github_url(self):
@@ -1198,6 +1866,402 @@ class Profile(SuperModel):
         self.save()
 
 
+class ProfileStats(SuperModel):
+    """Define the materialized statistics shown on a profile.
+
+    Rows are flagged stale by the Bounty, BountyFulfillment, Interest and Tip
+    save signals and rebuilt on the next read, or in bulk through the
+    `backfill_profile_stats` management command.
+
+    """
+
+    ROLES = [
+        ('newbie', 'newbie'),
+        ('funder', 'funder'),
+        ('coder', 'coder'),
+    ]
+
+    profile = models.OneToOneField(Profile, related_name='materialized_stats', on_delete=models.CASCADE)
+    role = models.CharField(max_length=10, choices=ROLES, default='newbie')
+    total_funded = models.DecimalField(default=0, decimal_places=2, max_digits=50)
+    total_fulfilled = models.DecimalField(default=0, decimal_places=2, max_digits=50)
+    num_bounties = models.IntegerField(default=0)
+    open_count = models.IntegerField(default=0)
+    success_rate = models.IntegerField(
+        default=0, null=True, blank=True, help_text=_('Percentage, or null if no eligible bounty left open status.'))
+    loyalty_rate = models.IntegerField(default=0)
+    stale = models.BooleanField(default=False, db_index=True)
+
+    class Meta:
+        """Define metadata associated with ProfileStats."""
+
+        verbose_name_plural = 'Profile Stats'
+
+    def __str__(self):
+        """Return the string representation of ProfileStats."""
+        return f"{self.profile} ({self.role}){' STALE' if self.stale else ''}"
+
+    @staticmethod
+    def compute(profile):
+        """Compute the statistics of the provided profile from its bounties.
+
+        Args:
+            profile (Profile): The profile to compute the statistics of.
+
+        Returns:
+            dict: The ProfileStats field values.
+
+        """
+        bounties = profile.bounties.stats_eligible()
+        total_funded = sum([bounty.value_in_usdt if bounty.value_in_usdt else 0 for bounty in bounties if bounty.is_funder(profile.handle)])
+        total_fulfilled = sum([bounty.value_in_usdt if bounty.value_in_usdt else 0 for bounty in bounties if bounty.is_hunter(profile.handle)])
+        role = 'newbie'
+        if total_funded > total_fulfilled:
+            role = 'funder'
+        elif total_funded < total_fulfilled:
+            role = 'coder'
+
+        success_rate = 0
+        if bounties.exists():
+            numer = bounties.filter(idx_status__in=['submitted', 'started', 'done']).count()
+            denom = bounties.exclude(idx_status__in=['open']).count()
+            success_rate = int(round(numer * 1.0 / denom, 2) * 100) if denom != 0 else None
+        return {
+            'role': role,
+            'total_funded': total_funded,
+            'total_fulfilled': total_fulfilled,
+            'num_bounties': bounties.count(),
+            'open_count': bounties.filter(idx_status='open').count(),
+            'success_rate': success_rate,
+            'loyalty_rate': profile.fulfilled.filter(accepted=True).count(),
+        }
+
+    @classmethod
+    def refresh(cls, profile):
+        """Recompute and store the statistics of the provided profile.
+
+        Args:
+            profile (Profile): The profile to refresh the statistics of.
+
+        Returns:
+            ProfileStats: The refreshed statistics.
+
+        """
+        stats, _ = cls.objects.update_or_create(profile=profile, defaults=dict(cls.compute(profile), stale=False))
+        return stats
+
+    @classmethod
+    def mark_stale(cls, handles=None, profile_ids=None):
+        """Flag the statistics of the provided profiles for a rebuild.
+
+        Handles are matched case insensitively through the index on the
+        lowercased Profile handle.
+
+        Args:
+            handles (iterable of str): The Github handles of the profiles, matched case insensitively.
+            profile_ids (iterable of int): The primary keys of the profiles.
+
+        Returns:
+            int: The number of ProfileStats flagged.
+
+        """
+        query = models.Q()
+        handles = set(ProfileBountyLink.normalize(handle) for handle in handles or []) - {''}
+        if handles:
+            profiles = Profile.objects.annotate(handle_lower=Lower('handle')).filter(handle_lower__in=handles)
+            query |= models.Q(profile_id__in=profiles.values('pk'))
+        profile_ids = [pk for pk in profile_ids or [] if pk]
+        if profile_ids:
+            query |= models.Q(profile_id__in=profile_ids)
+        if not query:
+            return 0
+        return cls.objects.filter(query).filter(stale=False).update(stale=True)
+
+    def as_list(self):
+        """Return the statistics in the (value, label) format shown on profiles.
+
+        Returns:
+            list of tuples: The statistics for the profile's primary role.
+
+        """
+        success_rate = 'N/A' if self.success_rate is None else self.success_rate
+        if success_rate == 0:
+            success_rate = 'N/A'
+            loyalty_rate = 'N/A'
+        else:
+            success_rate = f"{success_rate}%"
+            loyalty_rate = f"{self.loyalty_rate}x"
+        if self.role == 'newbie':
+            return [
+                (self.role, 'Status'),
+                (self.num_bounties, 'Total Funded Issues'),
+                (self.open_count, 'Open Funded Issues'),
+                (loyalty_rate, 'Loyalty Rate'),
+            ]
+        elif self.role == 'coder':
+            return [
+                (self.role, 'Primary Role'),
+                (self.num_bounties, 'Total Funded Issues'),
+                (success_rate, 'Success Rate'),
+                (loyalty_rate, 'Loyalty Rate'),
+            ]
+        # funder
+        return [
+            (self.role, 'Primary Role'),
+            (self.num_bounties, 'Total Funded Issues'),
+            (self.open_count, 'Open Funded Issues'),
+            (success_rate, 'Success Rate'),
+        ]
+
+
+@receiver(post_save, sender=Bounty, dispatch_uid="stale_profile_stats_bounty")
+def stale_profile_stats_bounty(sender, instance, **kwargs):
+    """Flag the statistics of every profile related to the saved Bounty."""
+    snapshot = getattr(instance, '_snapshot', None) or BountySnapshot(instance)
+    handles = [instance.bounty_owner_github_username, instance.github_org_name]
+    handles += [fulfillment.fulfiller_github_username for fulfillment in snapshot.fulfillments]
+    profile_ids = [fulfillment.profile_id for fulfillment in snapshot.fulfillments]
+    profile_ids += [interest.profile_id for interest in snapshot.interests]
+    ProfileStats.mark_stale(handles=handles, profile_ids=profile_ids)
+
+
+def stale_profile_stats_interested(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Flag the statistics of the profiles whose interest in a Bounty was added or removed."""
+    if action not in ['post_add', 'post_remove', 'pre_clear']:
+        return
+    if reverse:
+        profile_ids = [instance.profile_id]
+    elif action == 'pre_clear':
+        profile_ids = instance.interested.values_list('profile_id', flat=True)
+    else:
+        profile_ids = Interest.objects.filter(pk__in=pk_set or []).values_list('profile_id', flat=True)
+    ProfileStats.mark_stale(profile_ids=profile_ids)
+
+
+@receiver(pre_save, sender=Bounty, dispatch_uid="open_work_before_bounty")
+def open_work_before_bounty(sender, instance, raw=False, **kwargs):
+    """Remember what the stored revision of the Bounty added to the open work totals.
+
+    Bounties loaded from the database or saved before already know it; only the
+    ones built by hand with a primary key, or loaded without these fields, read it.
+
+    """
+    if raw or hasattr(instance, '_open_work_before'):
+        return
+    stored = None
+    if instance.pk:
+        stored = Bounty.objects.filter(pk=instance.pk).values_list(
+            'network', 'current_bounty', 'idx_status', 'value_in_usdt_now').first()
+    if stored:
+        instance._open_work_before = (stored[0], OpenWorkTotals.contribution(*stored[1:]))
+    else:
+        instance._open_work_before = (instance.network, (Decimal(0), 0))
+
+
+@receiver(post_save, sender=Bounty, dispatch_uid="open_work_after_bounty")
+@receiver(post_delete, sender=Bounty, dispatch_uid="open_work_del_bounty")
+def open_work_after_bounty(sender, instance, raw=False, **kwargs):
+    """Apply the change of the saved or deleted Bounty to the open work totals."""
+    if raw:
+        return
+    contribution = OpenWorkTotals.contribution(instance.current_bounty, instance.idx_status, instance.value_in_usdt_now)
+    if 'created' in kwargs:
+        network, before = getattr(instance, '_open_work_before', (instance.network, (Decimal(0), 0)))
+        after = contribution
+    else:
+        # deleted, so the instance holds what was stored
+        network, before = instance.network, contribution
+        after = (Decimal(0), 0)
+    if network != instance.network:
+        if before[1]:
+            OpenWorkTotals.adjust(network, -before[0], -before[1])
+        before = (Decimal(0), 0)
+    if after != before:
+        OpenWorkTotals.adjust(instance.network, after[0] - before[0], after[1] - before[1])
+    instance._open_work_before = (instance.network, after)
+
+
+@receiver(post_save, sender=BountyFulfillment, dispatch_uid="stale_profile_stats_fulfillment")
+def stale_profile_stats_fulfillment(sender, instance, **kwargs):
+    """Flag the statistics of the fulfiller and the funder of the saved BountyFulfillment."""
+    ProfileStats.mark_stale(
+        handles=[instance.fulfiller_github_username, instance.bounty.bounty_owner_github_username],
+        profile_ids=[instance.profile_id],
+    )
+
+
+@receiver(post_save, sender=Interest, dispatch_uid="stale_profile_stats_interest")
+def stale_profile_stats_interest(sender, instance, **kwargs):
+    """Flag the statistics of the profile expressing interest."""
+    ProfileStats.mark_stale(profile_ids=[instance.profile_id])
+
+
+@receiver(post_save, sender=Tip, dispatch_uid="stale_profile_stats_tip")
+def stale_profile_stats_tip(sender, instance, **kwargs):
+    """Flag the statistics of the profiles a Tip adds bounties to."""
+    try:
+        repo_owner = org_name(instance.github_url) if instance.github_url else None
+    except Exception:
+        repo_owner = None
+    ProfileStats.mark_stale(handles=[instance.username, repo_owner])
+
+
+class ProfileBountyLink(models.Model):
+    """Define the index of which bounties relate to which Github handle, and how.
+
+    Links are keyed on the lowercased handle so they exist before the user has
+    a Profile; the profile is filled in when it is already known.  They are
+    maintained from the Bounty, BountyFulfillment, Tip and interest signals, and
+    can be rebuilt with the `build_profile_bounty_links` management command.
+
+    """
+
+    RELATION_TYPES = [
+        ('funder', 'funder'),
+        ('org', 'org'),
+        ('fulfiller', 'fulfiller'),
+        ('interested', 'interested'),
+        ('tip', 'tip'),
+    ]
+
+    handle = models.CharField(max_length=255)
+    relation_type = models.CharField(max_length=10, choices=RELATION_TYPES)
+    bounty = models.ForeignKey(Bounty, related_name='profile_links', on_delete=models.CASCADE)
+    profile = models.ForeignKey(
+        'dashboard.Profile', related_name='bounty_links', on_delete=models.SET_NULL, null=True, blank=True)
+    fulfillment = models.ForeignKey(
+        BountyFulfillment, related_name='profile_links', on_delete=models.CASCADE, null=True, blank=True)
+    interest = models.ForeignKey(
+        'dashboard.Interest', related_name='profile_links', on_delete=models.CASCADE, null=True, blank=True)
+
+    class Meta:
+        """Define metadata associated with ProfileBountyLink."""
+
+        index_together = [
+            ["handle", "relation_type"],
+        ]
+
+    def __str__(self):
+        """Return the string representation of a ProfileBountyLink."""
+        return f"{self.handle} {self.relation_type} {self.bounty_id}"
+
+    @staticmethod
+    def normalize(handle):
+        """Normalize a Github handle to the form links are keyed on."""
+        return (handle or '').strip().lstrip('@').lower()
+
+    @classmethod
+    def bounty_ids(cls, handle, relation_type=None):
+        """Get a subquery of the bounty ids linked to the provided handle.
+
+        Args:
+            handle (str): The Github handle.
+            relation_type (str): Only include this relation. Defaults to: all relations.
+
+        Returns:
+            QuerySet: The bounty_id values, for use with `pk__in`.
+
+        """
+        links = cls.objects.filter(handle=cls.normalize(handle))
+        if relation_type:
+            links = links.filter(relation_type=relation_type)
+        return links.values('bounty_id')
+
+    @classmethod
+    def links_for_bounty(cls, bounty, tip_usernames=None):
+        """Build the funder, org and tip links of a newly created Bounty.
+
+        Args:
+            bounty (Bounty): The Bounty to link.
+            tip_usernames (list of str): The recipients of tips on the bounty's issue.
+                Defaults to: the recipients read from the database.
+
+        Returns:
+            list of ProfileBountyLink: The unsaved links.
+
+        """
+        links = [
+            cls(handle=cls.normalize(bounty.bounty_owner_github_username), relation_type='funder', bounty=bounty),
+        ]
+        if bounty.github_url.lower().startswith('https://github.com/'):
+            links.append(cls(handle=cls.normalize(bounty.github_org_name), relation_type='org', bounty=bounty))
+        if tip_usernames is None:
+            tip_usernames = Tip.objects.filter(github_url=bounty.github_url).values_list('username', flat=True)
+        for username in tip_usernames:
+            links.append(cls(handle=cls.normalize(username), relation_type='tip', bounty=bounty))
+        return [link for link in links if link.handle]
+
+    @classmethod
+    def links_for_fulfillment(cls, fulfillment):
+        """Build the fulfiller links of a BountyFulfillment."""
+        handles = {cls.normalize(fulfillment.fulfiller_github_username)}
+        if fulfillment.profile_id:
+            handles.add(cls.normalize(fulfillment.profile.handle))
+        return [
+            cls(handle=handle, relation_type='fulfiller', bounty_id=fulfillment.bounty_id,
+                profile_id=fulfillment.profile_id, fulfillment=fulfillment)
+            for handle in handles if handle
+        ]
+
+    @classmethod
+    def links_for_interests(cls, bounty, interests):
+        """Build the interested links of a Bounty for the provided interests."""
+        return [
+            cls(handle=cls.normalize(interest.profile.handle), relation_type='interested', bounty=bounty,
+                profile_id=interest.profile_id, interest=interest)
+            for interest in interests if interest.profile.handle
+        ]
+
+
+@receiver(post_save, sender=Bounty, dispatch_uid="link_profiles_bounty")
+def link_profiles_bounty(sender, instance, created, raw=False, **kwargs):
+    """Link a newly created Bounty to its funder, org and tippers."""
+    if created and not raw:
+        ProfileBountyLink.objects.bulk_create(ProfileBountyLink.links_for_bounty(instance))
+
+
+@receiver(post_save, sender=BountyFulfillment, dispatch_uid="link_profiles_fulfillment")
+def link_profiles_fulfillment(sender, instance, created, raw=False, **kwargs):
+    """Link a newly created BountyFulfillment's bounty to its fulfiller."""
+    if created and not raw:
+        ProfileBountyLink.objects.bulk_create(ProfileBountyLink.links_for_fulfillment(instance))
+
+
+@receiver(post_save, sender=Tip, dispatch_uid="link_profiles_tip")
+def link_profiles_tip(sender, instance, created, raw=False, **kwargs):
+    """Link the bounties on the tipped issue to the tip recipient."""
+    handle = ProfileBountyLink.normalize(instance.username)
+    if created and not raw and handle and instance.github_url:
+        ProfileBountyLink.objects.bulk_create([
+            ProfileBountyLink(handle=handle, relation_type='tip', bounty_id=bounty_id)
+            for bounty_id in Bounty.objects.filter(github_url=instance.github_url).values_list('pk', flat=True)
+        ])
+
+
+def link_profiles_interested(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """Keep the interested links in line with changes to Bounty interests."""
+    if reverse:
+        bounties = Bounty.objects.filter(pk__in=pk_set or [])
+        interests = [instance]
+    else:
+        bounties = [instance]
+        interests = Interest.objects.filter(pk__in=pk_set or []).select_related('profile')
+    if action == 'post_add':
+        links = []
+        for bounty in bounties:
+            links += ProfileBountyLink.links_for_interests(bounty, interests)
+        ProfileBountyLink.objects.bulk_create(links)
+    elif action == 'post_remove':
+        ProfileBountyLink.objects.filter(
+            relation_type='interested', bounty__in=bounties, interest__in=interests).delete()
+    elif action == 'pre_clear':
+        links = ProfileBountyLink.objects.filter(relation_type='interested')
+        if reverse:
+            links.filter(interest=instance).delete()
+        else:
+            links.filter(bounty=instance).delete()
+
+
 @receiver(user_logged_in)
 def post_login(sender, request, user, **kwargs):
     """Handle actions to take on user login."""
@@ -1249,7 +2313,17 @@ def normalize_tip_usernames(sender, instance, **kwargs):
 
 
 m2m_changed.connect(m2m_changed_interested, sender=Bounty.interested.through)
+m2m_changed.connect(link_profiles_interested, sender=Bounty.interested.through, dispatch_uid="link_profiles_interested")
 # m2m_changed.connect(changed_fulfillments, sender=Bounty.fulfillments)
+m2m_changed.connect(bump_bounty_data_version, sender=Bounty.interested.through, dispatch_uid="bump_version_interested")
+m2m_changed.connect(
+    stale_profile_stats_interested, sender=Bounty.interested.through, dispatch_uid="stale_profile_stats_interested")
+post_save.connect(bump_bounty_data_version, sender=Bounty, dispatch_uid="bump_version_bounty")
+post_delete.connect(bump_bounty_data_version, sender=Bounty, dispatch_uid="bump_version_del_bounty")
+post_save.connect(bump_bounty_data_version, sender=BountyFulfillment, dispatch_uid="bump_version_fulfillment")
+post_delete.connect(bump_bounty_data_version, sender=BountyFulfillment, dispatch_uid="bump_version_del_fulfillment")
+post_save.connect(bump_bounty_data_version, sender=Interest, dispatch_uid="bump_version_interest")
+post_delete.connect(bump_bounty_data_version, sender=Interest, dispatch_uid="bump_version_del_interest")
 
 
 class UserAction(SuperModel):
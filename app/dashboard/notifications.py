@@ -52,12 +52,14 @@ def github_org_to_twitter_tags(github_org):
     return twitter_tags
 
 
-def maybe_market_to_twitter(bounty, event_name):
+def maybe_market_to_twitter(bounty, event_name, raise_errors=False):
     """Tweet the specified Bounty event.
 
     Args:
         bounty (dashboard.models.Bounty): The Bounty to be marketed.
         event_name (str): The name of the event.
+        raise_errors (bool): Whether to raise the error of a failed post instead
+            of returning False. Defaults to: False.
 
     Returns:
         bool: Whether or not the twitter notification was sent successfully.
@@ -149,17 +151,21 @@ def maybe_market_to_twitter(bounty, event_name):
     try:
         api.PostUpdate(new_tweet)
     except Exception as e:
+        if raise_errors:
+            raise
         print(e)
         return False
     return True
 
 
-def maybe_market_to_slack(bounty, event_name):
+def maybe_market_to_slack(bounty, event_name, raise_errors=False):
     """Send a Slack message for the specified Bounty.
 
     Args:
         bounty (dashboard.models.Bounty): The Bounty to be marketed.
         event_name (str): The name of the event.
+        raise_errors (bool): Whether to raise the error of a failed post instead
+            of returning False. Defaults to: False.
 
     Returns:
         bool: Whether or not the Slack notification was sent successfully.
@@ -181,6 +187,8 @@ def maybe_market_to_slack(bounty, event_name):
         sc = SlackClient(settings.SLACK_TOKEN)
         sc.api_call("chat.postMessage", channel=channel, text=msg)
     except Exception as e:
+        if raise_errors:
+            raise
         print(e)
         return False
     return True
@@ -212,12 +220,14 @@ def build_message_for_slack(bounty, event_name):
     return msg
 
 
-def maybe_market_to_user_slack(bounty, event_name):
+def maybe_market_to_user_slack(bounty, event_name, raise_errors=False):
     """Send a Slack message to the user's slack channel for the specified Bounty.
 
     Args:
         bounty (dashboard.models.Bounty): The Bounty to be marketed.
         event_name (str): The name of the event.
+        raise_errors (bool): Whether to raise the last error when no subscriber
+            could be messaged, instead of returning False. Defaults to: False.
 
     Returns:
         bool: Whether or not the Slack notification was sent successfully.
@@ -235,6 +245,7 @@ def maybe_market_to_user_slack(bounty, event_name):
 
     url = bounty.github_url
     sent = False
+    error = None
     try:
         repo = org_name(url) + '/' + repo_name(url)
         subscribers = Profile.objects.filter(slack_repos__contains=[repo])
@@ -245,10 +256,14 @@ def maybe_market_to_user_slack(bounty, event_name):
                 sc.api_call("chat.postMessage", channel=subscriber.slack_channel, text=msg)
                 sent = True
             except Exception as e:
+                error = e
                 print(e)
     except Exception as e:
+        error = e
         print(e)
 
+    if raise_errors and error and not sent:
+        raise error
     return sent
 
 
@@ -435,7 +450,7 @@ def build_github_notification(bounty, event_name, profile_pairs=None):
     return msg
 
 
-def maybe_market_to_github(bounty, event_name, profile_pairs=None):
+def maybe_market_to_github(bounty, event_name, profile_pairs=None, raise_errors=False):
     """Post a Github comment for the specified Bounty.
 
     Args:
@@ -443,6 +458,8 @@ def maybe_market_to_github(bounty, event_name, profile_pairs=None):
         event_name (str): The name of the event.
         profile_pairs (list of tuples): The list of username and profile page
             URL tuple pairs.
+        raise_errors (bool): Whether to raise the error of a failed post instead
+            of returning False. Defaults to: False.
 
     Returns:
         bool: Whether or not the Github comment was posted successfully.
@@ -500,6 +517,8 @@ def maybe_market_to_github(bounty, event_name, profile_pairs=None):
     except IndexError:
         return False
     except Exception as e:
+        if raise_errors:
+            raise
         extra_data = {'github_url': url, 'bounty_id': bounty.pk, 'event_name': event_name}
         rollbar.report_exc_info(sys.exc_info(), extra_data=extra_data)
         print(e)
@@ -511,12 +530,11 @@ def amount_usdt_open_work():
     """Get the amount in USDT of all current open and submitted work.
 
     Returns:
-        float: The sum of all USDT values rounded to the nearest 2 decimals.
+        Decimal: The sum of all USDT values rounded to the nearest 2 decimals.
 
     """
-    from dashboard.models import Bounty
-    bounties = Bounty.objects.filter(network='mainnet', current_bounty=True, idx_status__in=['open', 'submitted'])
-    return round(sum([b.value_in_usdt_now for b in bounties if b.value_in_usdt_now]), 2)
+    from dashboard.models import OpenWorkTotals
+    return round(OpenWorkTotals.get_cached('mainnet')['amount_usdt'], 2)
 
 
 def maybe_market_tip_to_github(tip):
@@ -567,7 +585,7 @@ def maybe_market_tip_to_github(tip):
     return True
 
 
-def maybe_market_to_email(b, event_name):
+def maybe_market_to_email(b, event_name, raise_errors=False):
     from marketing.mails import new_work_submission, new_bounty_rejection, new_bounty_acceptance
     to_emails = []
     if b.network != settings.ENABLE_NOTIFICATIONS_ON_NETWORK:
@@ -581,6 +599,8 @@ def maybe_market_to_email(b, event_name):
             to_emails = [b.bounty_owner_email]
             new_work_submission(b, to_emails)
         except Exception as e:
+            if raise_errors:
+                raise
             logging.exception(e)
             print(e)
     elif event_name == 'work_done':
@@ -589,6 +609,8 @@ def maybe_market_to_email(b, event_name):
             to_emails = [b.bounty_owner_email, accepted_fulfillment.fulfiller_email]
             new_bounty_acceptance(b, to_emails)
         except Exception as e:
+            if raise_errors:
+                raise
             logging.exception(e)
             print(e)
     elif event_name == 'rejected_claim':
@@ -597,11 +619,46 @@ def maybe_market_to_email(b, event_name):
             to_emails = [b.bounty_owner_email, rejected_fulfillment.fulfiller_email]
             new_bounty_rejection(b, to_emails)
         except Exception as e:
+            if raise_errors:
+                raise
             logging.exception(e)
 
     return len(to_emails)
 
 
+def deliver_notification(notification, max_attempts=5, backoff=30):
+    """Post a queued bounty event notification to its channel.
+
+    Args:
+        notification (dashboard.models.NotificationOutbox): The running notification.
+        max_attempts (int): The number of failed attempts after which the
+            notification is dead-lettered. Defaults to: 5.
+        backoff (int): The seconds waited after the first failure, doubled after each one.
+            Defaults to: 30.
+
+    """
+    bounty = notification.bounty
+    event_name = notification.event_name
+    notification.attempts += 1
+    try:
+        if notification.channel == 'twitter':
+            sent = maybe_market_to_twitter(bounty, event_name, raise_errors=True)
+        elif notification.channel == 'slack':
+            sent = maybe_market_to_slack(bounty, event_name, raise_errors=True)
+        elif notification.channel == 'user_slack':
+            sent = maybe_market_to_user_slack(bounty, event_name, raise_errors=True)
+        elif notification.channel == 'github':
+            profile_pairs = [tuple(pair) for pair in notification.payload.get('profile_pairs') or []] or None
+            sent = maybe_market_to_github(bounty, event_name, profile_pairs, raise_errors=True)
+        else:
+            sent = maybe_market_to_email(bounty, event_name, raise_errors=True)
+    except Exception as e:
+        logging.error(f'{e} encountered posting notification {notification.pk} to {notification.channel}')
+        notification.retry(str(e), max_attempts, backoff)
+        return
+    notification.succeed(bool(sent))
+
+
 def maybe_post_on_craigslist(bounty):
     import time
     import mechanicalsoup
@@ -18,12 +18,27 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import base64
+import hashlib
+import json
+from collections import OrderedDict
 from datetime import datetime
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, urlencode
+
 import django_filters.rest_framework
-from rest_framework import routers, serializers, viewsets
+from rest_framework import pagination, routers, serializers, status, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PKOnlyObject
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-from .models import Bounty, BountyFulfillment, Interest, ProfileSerializer
+from .models import Bounty, BountyFulfillment, BountySnapshot, Interest, ProfileBountyLink, ProfileSerializer
+from .signals import get_bounty_data_version
 
 
 class BountyFulfillmentSerializer(serializers.ModelSerializer):
@@ -50,6 +65,137 @@ class InterestSerializer(serializers.ModelSerializer):
         fields = ('profile', 'created')
 
 
+class BountyListSerializer(serializers.ListSerializer):
+    """Handle serializing pages of Bounty rows for the list endpoint.
+
+    Given `values()` rows (or a queryset of them) a page is serialized with one
+    query per child relation and without instantiating a nested serializer per
+    row: model columns are read straight from the row, the detail URL is
+    reversed once per page, and the status is derived from the fetched children.
+    The output is identical to `BountySerializer(many=True)`, which is still
+    used as-is when handed model instances.
+
+    """
+
+    url_placeholder = 'bountypk'
+
+    def to_representation(self, data):
+        """Provide the serialized representation of the Bounty rows.
+
+        Args:
+            data (QuerySet or list of dict): The Bounty rows to be serialized.
+
+        Returns:
+            list: The serialized Bounties.
+
+        """
+        if isinstance(data, QuerySet):
+            data = data.prefetch_related(None).values()
+        rows = list(data)
+        if not rows or not isinstance(rows[0], dict):
+            return super().to_representation(rows)
+
+        db = Bounty.objects.db
+        bounty_ids = [row['id'] for row in rows]
+        fulfillments = {bounty_id: [] for bounty_id in bounty_ids}
+        for fulfillment in BountyFulfillment.objects.filter(bounty_id__in=bounty_ids).order_by('pk'):
+            fulfillments[fulfillment.bounty_id].append(fulfillment)
+        interests = {bounty_id: [] for bounty_id in bounty_ids}
+        links = Bounty.interested.through.objects.filter(bounty_id__in=bounty_ids) \
+            .select_related('interest__profile').order_by('interest_id')
+        for link in links:
+            interests[link.bounty_id].append(link.interest)
+
+        plan = self.get_field_plan()
+        field_names = list(rows[0])
+        url_template = self.get_url_template()
+        represent_fulfillments = self.get_child_representer(BountyFulfillmentSerializer)
+        represent_interests = self.get_interests_representer()
+
+        ret = []
+        for row in rows:
+            bounty = Bounty.from_db(db, field_names, list(row.values()))
+            snapshot = BountySnapshot(bounty, fulfillments[bounty.pk], interests[bounty.pk])
+            derived = {
+                'url': url_template.replace(self.url_placeholder, str(bounty.pk)) if url_template else None,
+                'fulfillments': represent_fulfillments(snapshot.fulfillments),
+                'interested': represent_interests(snapshot.interests),
+                'status': bounty.derive_status(snapshot),
+            }
+            item = OrderedDict()
+            for name, column, field in plan:
+                if name in derived:
+                    item[name] = derived[name]
+                    continue
+                value = row[column] if column else field.get_attribute(bounty)
+                item[name] = None if value is None else field.to_representation(value)
+            ret.append(item)
+        return ret
+
+    def get_field_plan(self):
+        """Get the (name, column, field) triples of the Bounty fields in output order.
+
+        `column` is the row key a field reads when it maps to a plain model
+        column, or None when the field has to be resolved against the instance.
+
+        """
+        columns = {
+            field.name: field.attname
+            for field in Bounty._meta.concrete_fields if not field.is_relation
+        }
+        columns['pk'] = Bounty._meta.pk.attname
+        return [
+            (name, columns.get(field.source), field)
+            for name, field in self.child.fields.items() if not field.write_only
+        ]
+
+    def get_url_template(self):
+        """Get the detail URL of a placeholder Bounty to format every row's URL from."""
+        try:
+            field = self.child.fields['url']
+            return str(field.to_representation(PKOnlyObject(pk=self.url_placeholder)))
+        except KeyError:
+            return None
+
+    def get_child_representer(self, serializer_class):
+        """Get a callable serializing a list of children with one bound set of fields."""
+        fields = [
+            field for field in serializer_class(context=self.context).fields.values() if not field.write_only
+        ]
+
+        def represent(children):
+            ret = []
+            for child in children:
+                item = OrderedDict()
+                for field in fields:
+                    attribute = field.get_attribute(child)
+                    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                    item[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+                ret.append(item)
+            return ret
+
+        return represent
+
+    def get_interests_representer(self):
+        """Get a callable serializing a list of interests, each profile serialized once."""
+        created = InterestSerializer(context=self.context).fields['created']
+        profile_serializer = ProfileSerializer(context=self.context)
+        profiles = {}
+
+        def represent(interests):
+            ret = []
+            for interest in interests:
+                if interest.profile_id not in profiles:
+                    profiles[interest.profile_id] = profile_serializer.to_representation(interest.profile)
+                ret.append(OrderedDict([
+                    ('profile', profiles[interest.profile_id]),
+                    ('created', None if interest.created is None else created.to_representation(interest.created)),
+                ]))
+            return ret
+
+        return represent
+
+
 # Serializers define the API representation.
 class BountySerializer(serializers.HyperlinkedModelSerializer):
     """Handle serializing the Bounty object."""
@@ -73,6 +219,7 @@ class BountySerializer(serializers.HyperlinkedModelSerializer):
         """Define the bounty serializer metadata."""
 
         model = Bounty
+        list_serializer_class = BountyListSerializer
         fields = (
             'url', 'created_on', 'modified_on', 'title', 'web3_created',
             'value_in_token', 'token_name', 'token_address',
@@ -107,6 +254,106 @@ class BountySerializer(serializers.HyperlinkedModelSerializer):
         return bounty
 
 
+class BountyKeysetPagination(pagination.BasePagination):
+    """Handle opt-in keyset (cursor) pagination for the Bounty API.
+
+    Requests carrying a `cursor` parameter (empty for the first page) are paged
+    by seeking past the last (order column, pk) pair of the previous page, so
+    every page costs the same regardless of depth.  Requests without one keep
+    the legacy offset/limit behavior.
+
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    page_size = 25
+    max_page_size = 100
+    default_ordering = '-web3_created'
+    ordering_whitelist = [
+        'web3_created', 'created_on', 'modified_on', 'expires_date', 'value_in_token', '_val_usd_db',
+        'standard_bounties_id',
+    ]
+
+    @classmethod
+    def is_requested(cls, request):
+        return cls.cursor_query_param in request.query_params
+
+    @classmethod
+    def get_ordering(cls, request):
+        """Get the whitelisted ordering requested, or the default one."""
+        ordering = request.query_params.get('order_by') or cls.default_ordering
+        if ordering.lstrip('-') not in cls.ordering_whitelist:
+            raise ValidationError({'order_by': f'cursor pagination supports ordering on: {cls.ordering_whitelist}'})
+        return ordering
+
+    @staticmethod
+    def encode_cursor(ordering, value, pk):
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps({'o': ordering, 'v': str(value), 'pk': pk})
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode_cursor(cursor, ordering, model):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+            if payload['o'] != ordering:
+                raise ValueError('ordering changed')
+            field = model._meta.get_field(ordering.lstrip('-'))
+            value = payload['v']
+            value = parse_datetime(value) if field.get_internal_type() == 'DateTimeField' else field.to_python(value)
+            return value, int(payload['pk'])
+        except Exception:
+            raise ValidationError({'cursor': 'invalid cursor'})
+
+    def get_page_size(self, request):
+        try:
+            return min(max(int(request.query_params[self.page_size_query_param]), 1), self.max_page_size)
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the page of the queryset following the requested cursor."""
+        if not self.is_requested(request):
+            return None
+
+        ordering = self.get_ordering(request)
+        column = ordering.lstrip('-')
+        descending = ordering.startswith('-')
+        queryset = queryset.order_by(ordering, '-pk' if descending else 'pk')
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            value, pk = self.decode_cursor(cursor, ordering, queryset.model)
+            seek = 'lt' if descending else 'gt'
+            queryset = queryset.filter(Q(**{f'{column}__{seek}': value}) | Q(**{column: value, f'pk__{seek}': pk}))
+
+        page_size = self.get_page_size(request)
+        page = list(queryset[:page_size + 1])
+        self.next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            last = page[-1]
+            if isinstance(last, dict):
+                self.next_cursor = self.encode_cursor(ordering, last[column], last['id'])
+            else:
+                self.next_cursor = self.encode_cursor(ordering, getattr(last, column), last.pk)
+        self.request = request
+        return page
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('next_cursor', self.next_cursor),
+            ('results', data),
+        ]))
+
+
 class BountyViewSet(viewsets.ModelViewSet):
     """Handle the Bounty view behavior."""
 
@@ -115,6 +362,61 @@ class BountyViewSet(viewsets.ModelViewSet):
         .all().order_by('-web3_created')
     serializer_class = BountySerializer
     filter_backends = (django_filters.rest_framework.DjangoFilterBackend,)
+    pagination_class = BountyKeysetPagination
+
+    cache_ignored_params = {'limit', 'offset', 'cursor', 'order_by', 'format'}
+
+    def get_cache_timeout(self, request):
+        """Get the number of seconds to cache the response for the filters requested, if any."""
+        if not settings.BOUNTIES_API_CACHE_ENABLED:
+            return 0
+        filters = '+'.join(sorted(set(request.query_params) - self.cache_ignored_params))
+        return settings.BOUNTIES_API_CACHE_TIMEOUTS.get(filters, settings.BOUNTIES_API_CACHE_TIMEOUT)
+
+    def get_cache_key(self, request, version):
+        """Get the cache key of the response for the normalized request, at the provided data version."""
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        fingerprint = f'{version}:{request.accepted_renderer.format}:{request.build_absolute_uri(request.path)}?{query}'
+        return 'bounties_api:' + hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+
+    def list(self, request, *args, **kwargs):
+        """List the Bounties, cached per normalized query until the bounty data changes.
+
+        Every response carries an ETag derived from the cache key, so clients
+        sending it back get a 304 until a bounty, fulfillment or interest changes.
+
+        """
+        timeout = self.get_cache_timeout(request)
+        version, modified = get_bounty_data_version() if timeout else (None, None)
+        if version is None:
+            return self.list_rows(request)
+
+        key = self.get_cache_key(request, version)
+        headers = {'ETag': f'"{key}"', 'Last-Modified': http_date(modified)}
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if headers['ETag'] in [etag.strip() for etag in if_none_match.split(',')]:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        data = cache.get(key)
+        if data is None:
+            response = self.list_rows(request)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            cache.set(key, data, timeout)
+        return Response(data, headers=headers)
+
+    def list_rows(self, request):
+        """List the Bounties as rows, serialized a page at a time by `BountyListSerializer`."""
+        rows = self.filter_queryset(self.get_queryset()).prefetch_related(None).values()
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(rows, many=True)
+        return Response(serializer.data)
 
     def get_queryset(self):
         """Get the queryset for Bounty.
@@ -151,7 +453,9 @@ class BountyViewSet(viewsets.ModelViewSet):
 
         # filter by who is interested
         if 'started' in param_keys:
-            queryset = queryset.filter(interested__profile__handle__in=[self.request.query_params.get('started')])
+            queryset = queryset.filter(
+                pk__in=ProfileBountyLink.bounty_ids(self.request.query_params.get('started'), 'interested')
+            )
 
         # filter by is open or not
         if 'is_open' in param_keys:
@@ -165,23 +469,25 @@ class BountyViewSet(viewsets.ModelViewSet):
 
         # Retrieve all fullfilled bounties by fulfiller_username
         if 'fulfiller_github_username' in param_keys:
-            queryset = queryset.filter(
-                fulfillments__fulfiller_github_username__iexact=self.request.query_params.get('fulfiller_github_username')
-            )
+            handle = self.request.query_params.get('fulfiller_github_username')
+            queryset = queryset.filter(pk__in=ProfileBountyLink.bounty_ids(handle, 'fulfiller'))
 
         # Retrieve all interested bounties by profile handle
         if 'interested_github_username' in param_keys:
-            queryset = queryset.filter(
-                interested__profile__handle__iexact=self.request.query_params.get('interested_github_username')
-            )
+            handle = self.request.query_params.get('interested_github_username')
+            queryset = queryset.filter(pk__in=ProfileBountyLink.bounty_ids(handle, 'interested'))
+
+        queryset = queryset.distinct()
+
+        # keyset pagination orders and pages the queryset itself
+        if BountyKeysetPagination.is_requested(self.request):
+            return queryset
 
         # order
         order_by = self.request.query_params.get('order_by')
         if order_by:
             queryset = queryset.order_by(order_by)
 
-        queryset = queryset.distinct()
-
         # offset / limit
         limit = self.request.query_params.get('limit', None)
         offset = self.request.query_params.get('offset', 0)
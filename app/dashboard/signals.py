@@ -18,11 +18,60 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 import logging
+import time
+
+from django.core.cache import cache
+from django.db import transaction
 
 from .notifications import maybe_market_to_github
 
 logger = logging.getLogger(__name__)
 
+BOUNTY_DATA_VERSION_KEY = 'dashboard:bounty_data_version'
+BOUNTY_DATA_MODIFIED_KEY = 'dashboard:bounty_data_modified'
+
+
+def get_bounty_data_version():
+    """Get the current version of the bounty data served by the API.
+
+    The counter starts from the clock, so that a counter evicted from the cache
+    never hands out a version that was already used.
+
+    Returns:
+        tuple: The version (int) and the time it was last bumped at (float), or
+            (None, None) if the cache backend cannot hold the counter.
+
+    """
+    versions = cache.get_many([BOUNTY_DATA_VERSION_KEY, BOUNTY_DATA_MODIFIED_KEY])
+    if BOUNTY_DATA_VERSION_KEY not in versions:
+        now = time.time()
+        cache.add(BOUNTY_DATA_VERSION_KEY, int(now * 1000), timeout=None)
+        cache.add(BOUNTY_DATA_MODIFIED_KEY, now, timeout=None)
+        versions = cache.get_many([BOUNTY_DATA_VERSION_KEY, BOUNTY_DATA_MODIFIED_KEY])
+    return versions.get(BOUNTY_DATA_VERSION_KEY), versions.get(BOUNTY_DATA_MODIFIED_KEY, time.time())
+
+
+def _bump_bounty_data_version():
+    try:
+        cache.incr(BOUNTY_DATA_VERSION_KEY)
+    except ValueError:
+        cache.add(BOUNTY_DATA_VERSION_KEY, int(time.time() * 1000), timeout=None)
+        cache.incr(BOUNTY_DATA_VERSION_KEY)
+    cache.set(BOUNTY_DATA_MODIFIED_KEY, time.time(), timeout=None)
+
+
+def bump_bounty_data_version(sender, **kwargs):
+    """Handle changes to bounty data by invalidating every cached API response.
+
+    The version is bumped right away and again once the transaction commits, so
+    a response cached from the pre-commit rows in between is never served.
+
+    """
+    if kwargs.get('raw'):
+        return
+    _bump_bounty_data_version()
+    transaction.on_commit(_bump_bounty_data_version)
+
 
 def m2m_changed_interested(sender, instance, action, reverse, model, **kwargs):
     """Handle changes to Bounty interests."""
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Handle batched StandardBounties reads related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from unittest.mock import patch
+
+from dashboard.utils import (
+    BountyNotFoundException, PooledHTTPProvider, Web3Registry, get_bounties, get_bounty, getBountyContract,
+)
+from eth_abi import decode_abi, encode_abi
+from eth_utils import to_checksum_address
+from test_plus.test import TestCase
+from web3 import Web3
+
+ISSUER = to_checksum_address('0x' + '11' * 20)
+FULFILLER = to_checksum_address('0x' + '22' * 20)
+ZERO = to_checksum_address('0x' + '00' * 20)
+
+# the StandardBounties functions read by get_bounty, with their argument and return types
+FUNCTIONS = {
+    'getBounty': (['uint256'], ['address', 'uint256', 'uint256', 'bool', 'uint256', 'uint256']),
+    'getBountyData': (['uint256'], ['string']),
+    'getBountyArbiter': (['uint256'], ['address']),
+    'getBountyToken': (['uint256'], ['address']),
+    'getNumFulfillments': (['uint256'], ['uint256']),
+    'getFulfillment': (['uint256', 'uint256'], ['bool', 'address', 'string']),
+}
+BOUNTIES = {
+    0: {
+        'getBounty': [ISSUER, 1530000000, 10 ** 18, False, 1, 10 ** 18],
+        'getBountyData': ['QmBounty0'],
+        'getBountyArbiter': [ZERO],
+        'getBountyToken': [ZERO],
+        'getNumFulfillments': [2],
+        'fulfillments': [[True, FULFILLER, 'QmFulfillment0'], [False, FULFILLER, 'QmFulfillment1']],
+    },
+    1: {
+        'getBounty': [ISSUER, 1540000000, 5, True, 0, 0],
+        'getBountyData': ['QmBounty1'],
+        'getBountyArbiter': [ISSUER],
+        'getBountyToken': [FULFILLER],
+        'getNumFulfillments': [0],
+        'fulfillments': [],
+    },
+}
+IPFS = {
+    'QmBounty0': '{"payload": {"title": "zero", "expire_date": 1535000000}}',
+    'QmBounty1': '{"payload": {"title": "one"}}',
+    'QmFulfillment0': '{"payload": {"fulfiller": {"githubUsername": "fred"}}}',
+    'QmFulfillment1': '{"payload": {"fulfiller": {"githubUsername": "barney"}}}',
+}
+
+
+class StubNodeHandler(BaseHTTPRequestHandler):
+    """Answer eth_call requests, batched or not, from the BOUNTIES above."""
+
+    selectors = {
+        Web3.sha3(text=f'{name}({",".join(types[0])})')[:4]: name for name, types in FUNCTIONS.items()
+    }
+
+    def eth_call(self, request):
+        data = Web3.toBytes(hexstr=request['params'][0]['data'])
+        name = self.selectors[data[:4]]
+        input_types, output_types = FUNCTIONS[name]
+        args = decode_abi(input_types, data[4:])
+        bounty = BOUNTIES.get(args[0])
+        if bounty is None:
+            # reads of unknown bounties revert, answering no data at all
+            return {'jsonrpc': '2.0', 'id': request['id'], 'result': '0x'}
+        values = bounty['fulfillments'][args[1]] if name == 'getFulfillment' else bounty[name]
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': Web3.toHex(encode_abi(output_types, values))}
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.requests.append(payload)
+        if isinstance(payload, list):
+            answer = [self.eth_call(request) for request in payload]
+        else:
+            answer = self.eth_call(payload)
+        body = json.dumps(answer).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class BatchedRPCTest(TestCase):
+    """Define tests for reading bounties off the chain in batches."""
+
+    def setUp(self):
+        """Start a stub node and point the mainnet web3 at it."""
+        self.server = HTTPServer(('127.0.0.1', 0), StubNodeHandler)
+        self.server.requests = []
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        registry = Web3Registry()
+        endpoint_uri = f'http://127.0.0.1:{self.server.server_port}'
+        registry.web3s['mainnet'] = Web3(PooledHTTPProvider(endpoint_uri, registry.build_session()))
+        self.patches = [
+            patch('dashboard.utils.web3_registry', registry),
+            patch('dashboard.utils.ipfs_cat', side_effect=IPFS.get),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        """Stop the stub node."""
+        for patcher in self.patches:
+            patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_bounty_batched(self):
+        """Test that a bounty and its fulfillments take two round trips and match the one by one reads."""
+        contract = getBountyContract('mainnet')
+        expected_fulfillments = [
+            contract.functions.getFulfillment(0, fulfill_enum).call() for fulfill_enum in range(2)
+        ]
+        expected_bounty = contract.functions.getBounty(0).call()
+        self.server.requests = []
+
+        bounty = get_bounty(0, 'mainnet')
+
+        assert len(self.server.requests) == 2
+        assert [len(batch) for batch in self.server.requests] == [5, 2]
+        assert bounty == {
+            'id': 0,
+            'issuer': expected_bounty[0],
+            'deadline': 1535000000,
+            'contract_deadline': expected_bounty[1],
+            'ipfs_deadline': 1535000000,
+            'fulfillmentAmount': expected_bounty[2],
+            'paysTokens': expected_bounty[3],
+            'bountyStage': expected_bounty[4],
+            'balance': expected_bounty[5],
+            'data': json.loads(IPFS['QmBounty0']),
+            'arbiter': contract.functions.getBountyArbiter(0).call(),
+            'token': contract.functions.getBountyToken(0).call(),
+            'fulfillments': [{
+                'id': fulfill_enum,
+                'accepted': accepted,
+                'fulfiller': fulfiller,
+                'data': json.loads(IPFS[data]),
+            } for fulfill_enum, (accepted, fulfiller, data) in enumerate(expected_fulfillments)],
+            'network': 'mainnet',
+        }
+
+    def test_get_bounties_batched(self):
+        """Test that several bounties share their round trips, and missing ones are reported as such."""
+        bounties = get_bounties([0, 1, 2], 'mainnet')
+
+        assert [len(batch) for batch in self.server.requests] == [15, 2]
+        assert bounties[0]['fulfillments'][1]['data']['payload']['fulfiller']['githubUsername'] == 'barney'
+        assert bounties[1]['fulfillments'] == []
+        assert bounties[1]['token'] == FULFILLER
+        assert isinstance(bounties[2], BountyNotFoundException)
+        with self.assertRaises(BountyNotFoundException):
+            get_bounty(2, 'mainnet')
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Handle dashboard export related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+from datetime import datetime, timedelta
+
+from django.test import override_settings
+
+import pytz
+from dashboard.models import Bounty, Tip
+from test_plus.test import TestCase
+
+
+@override_settings(EXPORT_API_KEYS=['secret'])
+class DashboardExportTest(TestCase):
+    """Define tests for the streaming exports."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        for idx in range(3):
+            Bounty.objects.create(
+                title=f'foo {idx}',
+                value_in_token=3,
+                token_name='ETH',
+                web3_created=datetime(2018, 5, 1, tzinfo=pytz.UTC),
+                github_url=f'https://github.com/gitcoinco/web/issues/{idx}',
+                token_address='0x0',
+                bounty_owner_github_username='flintstone',
+                bounty_owner_email='fred@bedrock.example',
+                is_open=True,
+                expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+                raw_data={},
+                current_bounty=True,
+                network='mainnet',
+            )
+        self.client.defaults['HTTP_AUTHORIZATION'] = 'Token secret'
+
+    def test_export_ndjson(self):
+        """Test that every bounty is streamed as one JSON line, without private columns."""
+        response = self.client.get('/api/v0.1/export/bounties/')
+        assert response.streaming
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        assert [row['title'] for row in rows] == ['foo 0', 'foo 1', 'foo 2']
+        assert 'bounty_owner_email' not in rows[0]
+
+    def test_export_csv_since(self):
+        """Test that `since` limits a CSV export to the rows modified from then on."""
+        Bounty.objects.filter(title='foo 0').update(modified_on=datetime(2018, 1, 1, tzinfo=pytz.UTC))
+        response = self.client.get('/api/v0.1/export/bounties/?format=csv&since=2018-02-01')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        assert lines[0].startswith('id,created_on,modified_on')
+        assert len(lines) == 3
+        assert self.client.get('/api/v0.1/export/bounties/?since=yesterday').status_code == 400
+
+    def test_export_requires_authentication(self):
+        """Test that exports are only served to staff or to requests with a valid API key."""
+        del self.client.defaults['HTTP_AUTHORIZATION']
+        assert self.client.get('/api/v0.1/export/bounties/').status_code == 401
+        assert self.client.get('/api/v0.1/export/bounties/', HTTP_AUTHORIZATION='Token wrong').status_code == 401
+
+        user = self.make_user('staff')
+        user.is_staff = True
+        user.save()
+        self.client.force_login(user)
+        assert self.client.get('/api/v0.1/export/bounties/').status_code == 200
+
+    def test_export_tips_leaves_out_secrets(self):
+        """Test that the tip export leaves out the receive url holding the private key, and the emails."""
+        Tip.objects.create(
+            emails=['fred@bedrock.example'],
+            url='https://gitcoin.co/tip/receive?key=0xprivate',
+            tokenName='ETH',
+            tokenAddress='0x0',
+            amount=1,
+            ip='127.0.0.1',
+            expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+            username='fred',
+            network='mainnet',
+        )
+        response = self.client.get('/api/v0.1/export/tips/')
+        content = b''.join(response.streaming_content).decode('utf-8')
+        row = json.loads(content)
+        assert row['username'] == 'fred'
+        assert 'url' not in row and 'emails' not in row
+        assert '0xprivate' not in content and 'bedrock' not in content
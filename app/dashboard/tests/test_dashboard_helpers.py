@@ -18,11 +18,16 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 import json
+from datetime import datetime
 
+from django.db import connection
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
+import pytz
 import requests_mock
-from dashboard.helpers import amount, issue_details, normalize_url
+from dashboard.helpers import amount, bounty_did_change, handle_bounty_fulfillments, issue_details, normalize_url
+from dashboard.models import Bounty, BountyFulfillment, Profile, ProfileBountyLink, hash_raw_data
 from economy.models import ConversionRate
 from test_plus.test import TestCase
 
@@ -70,3 +75,88 @@ class DashboardHelpersTest(TestCase):
     def test_normalize_url(self):
         """Test the dashboard helper normalize_url method."""
         assert normalize_url('https://gitcoin.co/') == 'https://gitcoin.co'
+
+    @staticmethod
+    def test_bounty_did_change():
+        """Test that bounty changes are detected from the raw data fingerprint of the current bounty."""
+        raw_data = {'id': 7, 'network': 'mainnet', 'data': {'payload': {'title': 'foo', 'tokenName': 'ETH'}}}
+        assert bounty_did_change(7, raw_data)[0]
+
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/11',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            raw_data=raw_data,
+            current_bounty=True,
+            network='mainnet',
+            standard_bounties_id=7,
+        )
+        assert bounty.raw_data_hash == hash_raw_data(raw_data)
+        reordered = {'data': {'payload': {'tokenName': 'ETH', 'title': 'foo'}}, 'network': 'mainnet', 'id': 7}
+        assert hash_raw_data(reordered) == bounty.raw_data_hash
+        assert not bounty_did_change(7, reordered)[0]
+        assert bounty_did_change(7, dict(raw_data, balance=1))[0]
+
+        # rows saved before the fingerprint existed still compare by value
+        Bounty.objects.filter(pk=bounty.pk).update(raw_data_hash='')
+        assert not bounty_did_change(7, raw_data)[0]
+        assert bounty_did_change(7, dict(raw_data, balance=1))[0]
+
+    @staticmethod
+    def test_handle_bounty_fulfillments():
+        """Test that fulfillments are written with a number of queries that does not grow with their count."""
+        def create_bounty(standard_bounties_id):
+            return Bounty.objects.create(
+                title='foo',
+                value_in_token=3,
+                token_name='ETH',
+                web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+                github_url='https://github.com/gitcoinco/web/issues/12',
+                token_address='0x0',
+                bounty_owner_github_username='flintstone',
+                is_open=True,
+                expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+                current_bounty=True,
+                network='mainnet',
+                standard_bounties_id=standard_bounties_id,
+            )
+
+        def fulfillment(fulfillment_id, handle):
+            return {
+                'id': fulfillment_id,
+                'accepted': False,
+                'fulfiller': '0x1',
+                'data': {'payload': {'fulfiller': {'githubUsername': handle, 'hoursWorked': '3'}}},
+            }
+
+        profile = Profile.objects.create(data={}, handle='fred', email='fred@bedrock.com')
+        old_bounty = create_bounty(8)
+        old_fulfillment = BountyFulfillment.objects.create(
+            bounty=old_bounty, fulfillment_id=0, fulfiller_address='0x1', profile=profile,
+            created_on=datetime(2008, 11, 1, tzinfo=pytz.UTC))
+
+        query_counts = []
+        for num_fulfillments in [1, 5]:
+            new_bounty = create_bounty(8)
+            with CaptureQueriesContext(connection) as queries:
+                handle_bounty_fulfillments(
+                    [fulfillment(i, 'fred' if i % 2 else 'barney') for i in range(num_fulfillments)],
+                    new_bounty,
+                    old_bounty,
+                )
+            query_counts.append(len(queries))
+            assert new_bounty.fulfillments.count() == num_fulfillments
+
+        assert query_counts[0] == query_counts[1]
+        carried = new_bounty.fulfillments.get(fulfillment_id=0)
+        assert carried.created_on == old_fulfillment.created_on
+        assert carried.fulfiller_hours_worked == 3
+        assert new_bounty.fulfillments.filter(profile=profile).count() == 2
+        assert ProfileBountyLink.objects.filter(
+            bounty=new_bounty, relation_type='fulfiller', handle='fred').count() == 2
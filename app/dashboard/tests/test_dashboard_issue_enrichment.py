@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Handle queued Github issue enrichment related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime
+
+from django.core.management import call_command
+from django.test import override_settings
+
+import pytz
+import requests_mock
+from dashboard.models import Bounty, IssueEnrichmentJob
+from test_plus.test import TestCase
+
+ISSUE_API_URL = 'https://api.github.com/repos/gitcoinco/web/issues/11'
+
+
+@override_settings(ISSUE_ENRICHMENT_MAX_ATTEMPTS=3, ISSUE_ENRICHMENT_BACKOFF=60)
+class IssueEnrichmentTest(TestCase):
+    """Define tests for the Github issue enrichment queue and its worker."""
+
+    def create_bounty(self, github_url='https://github.com/gitcoinco/web/issues/11', title='foo'):
+        return Bounty.objects.create(
+            title=title,
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url=github_url,
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            current_bounty=True,
+            network='mainnet',
+            standard_bounties_id=11,
+        )
+
+    def test_enrichment_fetches_each_issue_once(self):
+        """Test that every revision of an issue is written from a single request to Github."""
+        bounties = [self.create_bounty(), self.create_bounty(title='')]
+        other = self.create_bounty(github_url='https://gitlab.com/gitcoinco/web/issues/11')
+        IssueEnrichmentJob.enqueue([bounty.pk for bounty in bounties + [other]])
+
+        with requests_mock.Mocker() as m:
+            m.get(ISSUE_API_URL, json={'title': 'Increase Code Coverage', 'body': 'hello world'})
+            call_command('process_issue_enrichment', once=True)
+            assert m.call_count == 1
+
+        for bounty in bounties:
+            bounty.refresh_from_db()
+            assert bounty.issue_description == 'hello world'
+        assert [bounty.title for bounty in bounties] == ['foo', 'Increase Code Coverage']
+        assert IssueEnrichmentJob.objects.filter(status='done', attempts=1).count() == 3
+
+    def test_enrichment_retries_when_github_is_down(self):
+        """Test that a Github outage reschedules the jobs instead of failing them."""
+        bounty = self.create_bounty()
+        IssueEnrichmentJob.enqueue([bounty.pk])
+
+        with requests_mock.Mocker() as m:
+            m.get(ISSUE_API_URL, status_code=502)
+            call_command('process_issue_enrichment', once=True)
+
+        job = IssueEnrichmentJob.objects.get(bounty=bounty)
+        assert job.status == 'pending'
+        assert job.attempts == 1
+        assert job.next_attempt_on > job.created_on
+        bounty.refresh_from_db()
+        assert bounty.issue_description == ''
@@ -18,11 +18,20 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
 
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 import pytz
-from dashboard.models import Bounty, BountyFulfillment, Interest, Profile, Tip, Tool, ToolVote
+from dashboard.helpers import retire_bounties
+from dashboard.models import (
+    Bounty, BountyFulfillment, Interest, OpenWorkTotals, Profile, ProfileBountyLink, ProfileStats, Tip, Tool, ToolVote,
+    derive_bounty_fields, recompute_derived,
+)
+from dashboard.signals import _bump_bounty_data_version
 from economy.models import ConversionRate
 from test_plus.test import TestCase
 
@@ -226,3 +235,234 @@ class DashboardModelsTest(TestCase):
             raw_data={},
         )
         assert bounty.snooze_url(1) == f'{bounty.get_absolute_url()}?snooze=1'
+
+    def test_bounty_save_query_count(self):
+        """Test that saving a Bounty derives its fields with a constant number of queries."""
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/13',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+            raw_data={},
+        )
+        for idx in range(3):
+            BountyFulfillment.objects.create(fulfiller_address=f'0x{idx}', bounty=bounty)
+        bounty = Bounty.objects.get(pk=bounty.pk)
+        # bumping the bounty data version costs queries of its own when the cache is database backed
+        with CaptureQueriesContext(connection) as bump:
+            _bump_bounty_data_version()
+        # fulfillments, interests, the UPDATE itself and flagging related ProfileStats, plus the version bump
+        with self.assertNumQueries(4 + len(bump)):
+            bounty.save()
+        assert bounty.idx_status == 'open'
+        assert bounty.fulfillment_submitted_on is not None
+
+    def test_recompute_derived(self):
+        """Test that recompute_derived stores the same fields as a save would."""
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/14',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=False,
+            accepted=True,
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            project_length='Months',
+            experience_level='Intermediate',
+            raw_data={},
+        )
+        Bounty.objects.filter(pk=bounty.pk).update(idx_status='open', idx_project_length=0, idx_experience_level=0)
+        assert recompute_derived(Bounty.objects.filter(pk=bounty.pk)) == 1
+        bounty.refresh_from_db()
+        assert bounty.idx_status == 'done'
+        assert bounty.idx_project_length == 5
+        assert bounty.idx_experience_level == 3
+        assert derive_bounty_fields(bounty)['idx_status'] == 'done'
+
+    def test_recompute_derived_skips_failures(self):
+        """Test that recompute_derived skips a bounty it can't derive and updates the rest."""
+        bounties = [Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            github_url=f'https://github.com/gitcoinco/web/issues/{idx}',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=False,
+            accepted=True,
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            raw_data={},
+        ) for idx in range(14, 16)]
+        Bounty.objects.filter(pk__in=[bounty.pk for bounty in bounties]).update(idx_status='open')
+
+        def derive(bounty, *args):
+            if bounty.pk == bounties[0].pk:
+                raise ValueError('no rate')
+            return derive_bounty_fields(bounty, *args)
+
+        with patch('dashboard.models.derive_bounty_fields', side_effect=derive):
+            assert recompute_derived(Bounty.objects.filter(pk__in=[bounty.pk for bounty in bounties])) == 1
+        assert Bounty.objects.get(pk=bounties[0].pk).idx_status == 'open'
+        assert Bounty.objects.get(pk=bounties[1].pk).idx_status == 'done'
+
+    def test_profile_stats(self):
+        """Test that ProfileStats are materialized and flagged stale by bounty saves."""
+        profile = Profile.objects.create(handle='flintstone', data={})
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime.now(tz=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/15',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+            raw_data={},
+            current_bounty=True,
+        )
+        assert profile.stats[1] == (1, 'Total Funded Issues')
+        stats = ProfileStats.objects.get(profile=profile)
+        assert stats.stale is False
+        assert stats.num_bounties == 1
+
+        profile = Profile.objects.get(pk=profile.pk)
+        with self.assertNumQueries(1):
+            assert profile.desc == '@flintstone is a newbie who has participated in 1 funded issue on Gitcoin'
+            assert profile.stats[2] == (1, 'Open Funded Issues')
+
+        bounty.is_open = False
+        bounty.save()
+        stats.refresh_from_db()
+        assert stats.stale is True
+        profile = Profile.objects.get(pk=profile.pk)
+        assert profile.stats[2] == (0, 'Open Funded Issues')
+
+    def test_profile_stats_interest(self):
+        """Test that ProfileStats are flagged stale when an interest is added or removed."""
+        profile = Profile.objects.create(handle='Barney', data={})
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime.now(tz=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/15',
+            token_address='0x0',
+            bounty_owner_github_username='flintstone',
+            is_open=True,
+            expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+            raw_data={},
+            current_bounty=True,
+        )
+        stats = ProfileStats.refresh(profile)
+        interest = Interest.objects.create(profile=profile)
+        bounty.interested.add(interest)
+        stats.refresh_from_db()
+        assert stats.stale is True
+
+        ProfileStats.refresh(profile)
+        bounty.interested.remove(interest)
+        stats.refresh_from_db()
+        assert stats.stale is True
+
+        ProfileStats.refresh(profile)
+        assert ProfileStats.mark_stale(handles=['@BARNEY']) == 1
+
+    def test_profile_bounty_links(self):
+        """Test that ProfileBountyLinks follow the bounty, fulfillment and interest lifecycle."""
+        fred = Profile.objects.create(handle='fred', data={})
+        wilma = Profile.objects.create(handle='Wilma', data={})
+        bounty = Bounty.objects.create(
+            title='foo',
+            value_in_token=3,
+            token_name='ETH',
+            web3_created=datetime.now(tz=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/16',
+            token_address='0x0',
+            bounty_owner_github_username='@Flintstone',
+            is_open=True,
+            expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+            raw_data={},
+            current_bounty=True,
+        )
+        BountyFulfillment.objects.create(
+            fulfiller_address='0x0', fulfiller_github_username='fred', bounty=bounty, profile=fred)
+        interest = Interest.objects.create(profile=wilma)
+        bounty.interested.add(interest)
+
+        assert list(Bounty.objects.filter(pk__in=ProfileBountyLink.bounty_ids('flintstone', 'funder'))) == [bounty]
+        assert list(Bounty.objects.filter(pk__in=ProfileBountyLink.bounty_ids('GITCOINCO', 'org'))) == [bounty]
+        assert list(fred.bounties) == [bounty]
+        assert list(wilma.bounties) == [bounty]
+
+        bounty.interested.remove(interest)
+        assert not wilma.bounties.exists()
+
+    @staticmethod
+    def test_open_work_totals():
+        """Test that the open work totals follow every saved and deleted bounty, and match a full re-derivation."""
+        def create_bounty(idx, value_in_token):
+            return Bounty.objects.create(
+                title=f'foo {idx}',
+                value_in_token=value_in_token,
+                token_name='USDT',
+                web3_created=datetime.now(tz=pytz.UTC),
+                github_url=f'https://github.com/gitcoinco/web/issues/{idx}',
+                token_address='0x0',
+                bounty_owner_github_username='flintstone',
+                is_open=True,
+                expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+                raw_data={},
+                current_bounty=True,
+                network='mainnet',
+            )
+
+        def totals():
+            row = OpenWorkTotals.objects.get(network='mainnet')
+            return row.amount_usdt, row.num_bounties
+
+        first = create_bounty(1, 100)
+        assert totals() == (Decimal('100.00'), 1)
+        second = create_bounty(2, Decimal('20.25'))
+        assert totals() == (Decimal('120.25'), 2)
+
+        second.value_in_token = 30
+        second.save()
+        assert totals() == (Decimal('130.00'), 2)
+
+        first.current_bounty = False
+        first.save()
+        assert totals() == (Decimal('30.00'), 1)
+
+        second.network = 'rinkeby'
+        second.save()
+        assert totals() == (Decimal('0.00'), 0)
+        assert OpenWorkTotals.objects.get(network='rinkeby').num_bounties == 1
+
+        first.current_bounty = True
+        first.save()
+        second.delete()
+        assert totals() == (Decimal('100.00'), 1)
+        assert OpenWorkTotals.objects.get(network='rinkeby').num_bounties == 0
+
+        refreshed = OpenWorkTotals.refresh('mainnet')
+        assert (refreshed.amount_usdt, refreshed.num_bounties) == totals()
+        assert OpenWorkTotals.get_cached('mainnet') == {'amount_usdt': Decimal('100.00'), 'num_bounties': 1}
+        # pages only read the stored totals, leaving the re-derivation to refresh_open_work_totals
+        assert OpenWorkTotals.get_cached('kovan') == {'amount_usdt': Decimal(0), 'num_bounties': 0}
+        assert not OpenWorkTotals.objects.filter(network='kovan').exists()
+
+        # a retired revision saved afterwards is not taken off the totals twice
+        retire_bounties([first])
+        assert totals() == (Decimal('0.00'), 0)
+        first.save()
+        assert totals() == (Decimal('0.00'), 0)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Handle dashboard API router related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytz
+from dashboard.models import Bounty, BountyFulfillment, Interest, Profile
+from dashboard.router import BountySerializer
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from test_plus.test import TestCase
+
+
+class DashboardRouterTest(TestCase):
+    """Define tests for the dashboard API router."""
+
+    def setUp(self):
+        """Perform setup for the testcase."""
+        web3_created = datetime(2018, 5, 1, tzinfo=pytz.UTC)
+        for idx in range(5):
+            Bounty.objects.create(
+                title=f'foo {idx}',
+                value_in_token=3,
+                token_name='ETH',
+                # the last two bounties share a timestamp to exercise the pk tiebreaker
+                web3_created=web3_created + timedelta(days=min(idx, 3)),
+                github_url=f'https://github.com/gitcoinco/web/issues/{idx}',
+                token_address='0x0',
+                bounty_owner_github_username='flintstone',
+                is_open=True,
+                expires_date=datetime.now(tz=pytz.UTC) + timedelta(days=1),
+                raw_data={},
+                current_bounty=True,
+                network='mainnet',
+            )
+
+    def test_bounties_keyset_pagination(self):
+        """Test that following the next cursor visits every bounty exactly once, newest first."""
+        titles = []
+        url = '/api/v0.1/bounties/?cursor=&limit=2'
+        while url:
+            response = self.client.get(url).json()
+            titles += [bounty['title'] for bounty in response['results']]
+            url = response['next']
+        assert titles == ['foo 4', 'foo 3', 'foo 2', 'foo 1', 'foo 0']
+
+    def test_bounties_legacy_offset_limit(self):
+        """Test that requests without a cursor keep the plain list response."""
+        response = self.client.get('/api/v0.1/bounties/?offset=2&limit=4').json()
+        assert [bounty['title'] for bounty in response] == ['foo 2', 'foo 1']
+
+    def test_bounties_keyset_pagination_rejects_unknown_ordering(self):
+        """Test that cursor pagination only orders on whitelisted columns."""
+        response = self.client.get('/api/v0.1/bounties/?cursor=&order_by=title')
+        assert response.status_code == 400
+
+    def test_bounty_list_serializer_matches_bounty_serializer(self):
+        """Test that the row based list serializer renders exactly what BountySerializer does."""
+        bounty = Bounty.objects.get(title='foo 1')
+        bounty.privacy_preferences = {'show_email_publicly': '0'}
+        bounty.save()
+        profile = Profile.objects.create(data={}, handle='fred', email='fred@localhost')
+        BountyFulfillment.objects.create(
+            fulfiller_address='0x0000000000000000000000000000000000000000', bounty=bounty, profile=profile)
+        bounty.interested.add(Interest.objects.create(profile=profile))
+        context = {'request': Request(APIRequestFactory().get('/api/v0.1/bounties/'))}
+        queryset = Bounty.objects.order_by('pk')
+
+        with patch('django.utils.timezone.now', return_value=datetime(2018, 6, 1, tzinfo=pytz.UTC)):
+            expected = [BountySerializer(bounty, context=context).data for bounty in queryset]
+            with self.assertNumQueries(3):
+                rows = BountySerializer(queryset.values(), many=True, context=context).data
+
+        assert rows[1]['status'] == 'started'
+        assert rows[1]['fulfillments'][0]['profile'] == profile.pk
+        assert JSONRenderer().render(rows) == JSONRenderer().render(expected)
+
+    def test_bounties_response_cache(self):
+        """Test that cached responses revalidate with their ETag until the bounty data changes."""
+        url = '/api/v0.1/bounties/?network=mainnet&order_by=pk'
+        response = self.client.get(url)
+        etag = response['ETag']
+        assert response.has_header('Last-Modified')
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        bounty = Bounty.objects.get(title='foo 0')
+        bounty.title = 'bar 0'
+        bounty.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert response.json()[0]['title'] == 'bar 0'
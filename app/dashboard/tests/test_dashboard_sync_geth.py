@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Handle sync_geth management command related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import time
+from collections import OrderedDict
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from dashboard.models import ChainSyncCheckpoint
+from dashboard.utils import BountyNotFoundException
+from test_plus.test import TestCase
+
+NUM_BOUNTIES = 12
+LATENCY = 0.05
+
+
+def stub_get_bounties(bounty_enums, network):
+    """Mimic a node answering every batch of bounties after a fixed round trip."""
+    time.sleep(LATENCY)
+    return OrderedDict(
+        (bounty_enum, BountyNotFoundException() if bounty_enum >= NUM_BOUNTIES else {'id': bounty_enum})
+        for bounty_enum in bounty_enums
+    )
+
+
+class SyncGethTest(TestCase):
+    """Define tests for the sync_geth pipeline."""
+
+    def sync(self, workers, batch_size=1):
+        processed = []
+        with patch('dashboard.management.commands.sync_geth.get_bounties', side_effect=stub_get_bounties), \
+                patch('dashboard.management.commands.sync_geth.web3_process_bounty', side_effect=processed.append):
+            start = time.time()
+            call_command('sync_geth', 'mainnet', '0', '99999999999', workers=workers, batch_size=batch_size)
+            return processed, time.time() - start
+
+    def test_sync_geth_workers(self):
+        """Test that concurrent fetches keep the processing order and beat one by one fetches."""
+        sequential, sequential_time = self.sync(workers=1)
+        pipelined, pipelined_time = self.sync(workers=4)
+        batched, batched_time = self.sync(workers=2, batch_size=5)
+
+        assert [bounty['id'] for bounty in sequential] == list(range(NUM_BOUNTIES))
+        assert pipelined == sequential
+        assert batched == sequential
+        assert pipelined_time < sequential_time / 2
+        assert batched_time < sequential_time / 2
+
+    def sync_incremental(self, block_number, touched, failing=()):
+        processed = []
+
+        def process(bounty):
+            if bounty['id'] in failing:
+                raise ValueError('ipfs timeout')
+            processed.append(bounty)
+
+        with patch('dashboard.management.commands.sync_geth.get_bounties', side_effect=stub_get_bounties), \
+                patch('dashboard.management.commands.sync_geth.web3_process_bounty', side_effect=process), \
+                patch('dashboard.management.commands.sync_geth.get_block_number', return_value=block_number), \
+                patch('dashboard.management.commands.sync_geth.get_bounty_ids_from_events',
+                      return_value=touched) as get_bounty_ids_from_events:
+            call_command('sync_geth', 'mainnet', incremental=True, confirmations=12)
+        return [bounty['id'] for bounty in processed], get_bounty_ids_from_events
+
+    def test_sync_geth_incremental(self):
+        """Test that an incremental sync only processes the bounties touched since its checkpoint."""
+        processed, get_bounty_ids_from_events = self.sync_incremental(100, [])
+        assert processed == list(range(NUM_BOUNTIES))
+        assert not get_bounty_ids_from_events.called
+        assert ChainSyncCheckpoint.get_last_block('mainnet') == 88
+
+        processed, get_bounty_ids_from_events = self.sync_incremental(150, [3, 5, NUM_BOUNTIES, 1])
+        assert processed == [3, 5, 1]
+        assert get_bounty_ids_from_events.call_args[0][:3] == ('mainnet', 89, 138)
+        assert ChainSyncCheckpoint.get_last_block('mainnet') == 138
+
+        processed, get_bounty_ids_from_events = self.sync_incremental(140, [])
+        assert processed == []
+        assert not get_bounty_ids_from_events.called
+        assert ChainSyncCheckpoint.get_last_block('mainnet') == 138
+
+    def test_sync_geth_incremental_failures(self):
+        """Test that the bounties failing an incremental sync are kept and retried on the next run."""
+        ChainSyncCheckpoint.advance('mainnet', 88)
+
+        processed, _ = self.sync_incremental(150, [3, 5, 1], failing=[5])
+        assert processed == [3, 1]
+        assert ChainSyncCheckpoint.get_last_block('mainnet') == 138
+        assert ChainSyncCheckpoint.get_failed_bounty_ids('mainnet') == [5]
+
+        processed, _ = self.sync_incremental(140, [], failing=[5])
+        assert processed == []
+        assert ChainSyncCheckpoint.get_failed_bounty_ids('mainnet') == [5]
+
+        processed, _ = self.sync_incremental(160, [7])
+        assert processed == [7, 5]
+        assert ChainSyncCheckpoint.get_last_block('mainnet') == 148
+        assert ChainSyncCheckpoint.get_failed_bounty_ids('mainnet') == []
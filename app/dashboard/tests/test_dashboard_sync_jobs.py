@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Handle queued sync/web3 job related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from dashboard.models import BountySyncJob
+from economy.models import get_time
+from test_plus.test import TestCase
+
+SYNC_DATA = {
+    'url': 'https://github.com/gitcoinco/web/issues/11',
+    'txid': '0x' + 'ab' * 32,
+    'network': 'mainnet',
+}
+
+
+@override_settings(SYNC_WEB3_ASYNC=True, SYNC_WEB3_JOB_MAX_ATTEMPTS=3, SYNC_WEB3_JOB_BACKOFF=3)
+class SyncJobsTest(TestCase):
+    """Define tests for the sync/web3 job queue and its worker."""
+
+    def work(self, tx_mined=True, did_change=True):
+        new_bounty = MagicMock(url='https://gitcoin.co/issue/gitcoinco/web/11/5')
+        with patch('dashboard.utils.has_tx_mined', return_value=tx_mined), \
+                patch('dashboard.utils.get_bounty_id', return_value=5), \
+                patch('dashboard.utils.get_bounty', return_value={'id': 5}), \
+                patch('dashboard.utils.web3_process_bounty', return_value=(did_change, None, new_bounty)):
+            call_command('process_sync_jobs', once=True)
+
+    def make_due(self):
+        BountySyncJob.objects.update(next_attempt_on=get_time())
+
+    def test_sync_web3_queues_job(self):
+        """Test that the endpoint answers with a job right away and that the worker completes it."""
+        response = self.client.post('/sync/web3/', SYNC_DATA)
+        assert response.status_code == 202
+        job_url = response.json()['job_url']
+        assert self.client.get(job_url).json()['status'] == 'pending'
+
+        self.work(tx_mined=False)
+        status = self.client.get(job_url).json()
+        assert status['status'] == 'pending'
+        assert status['attempts'] == 1
+        assert status['error'] == 'tx has not mined yet'
+
+        # not due yet, so the backoff holds it back
+        self.work()
+        assert self.client.get(job_url).json()['attempts'] == 1
+
+        self.make_due()
+        self.work()
+        status = self.client.get(job_url).json()
+        assert status['status'] == 'done'
+        assert status['attempts'] == 2
+        assert status['did_change']
+        assert status['url'] == 'https://gitcoin.co/issue/gitcoinco/web/11/5'
+
+    def test_sync_job_backoff_and_failure(self):
+        """Test that attempts are spaced exponentially and that the job fails once out of attempts."""
+        job = BountySyncJob.objects.create(github_url=SYNC_DATA['url'], txid=SYNC_DATA['txid'], network='mainnet')
+        delays = []
+        for _ in range(3):
+            self.make_due()
+            before = get_time()
+            self.work(tx_mined=False)
+            job.refresh_from_db()
+            delays.append((job.next_attempt_on - before).total_seconds())
+
+        assert job.status == 'failed'
+        assert job.attempts == 3
+        assert 3 <= delays[0] < 4
+        assert 6 <= delays[1] < 7
+        assert self.client.get(f'/sync/web3/job/{job.pk}').json()['status'] == 'failed'
+
+    def test_sync_job_unchanged_bounty(self):
+        """Test that a bounty which never changes completes the job with did_change false on the last attempt."""
+        job = BountySyncJob.objects.create(github_url=SYNC_DATA['url'], txid=SYNC_DATA['txid'], network='mainnet')
+        for _ in range(3):
+            self.make_due()
+            self.work(did_change=False)
+        job.refresh_from_db()
+        assert job.status == 'done'
+        assert job.result['did_change'] is False
+
+    @override_settings(SYNC_WEB3_ASYNC=False)
+    def test_sync_web3_synchronous(self):
+        """Test that the synchronous sync stays available behind the flag."""
+        with patch('dashboard.views.has_tx_mined', return_value=False):
+            response = self.client.post('/sync/web3/', SYNC_DATA)
+        assert response.status_code == 400
+        assert response.json()['msg'] == 'tx has not mined yet'
+        assert not BountySyncJob.objects.exists()
@@ -17,7 +17,17 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
-from dashboard.utils import get_ordinal_repr, get_web3
+import os
+import tempfile
+from unittest.mock import patch
+
+from dashboard.models import BountyURLIndex
+from dashboard.utils import (
+    BountyNotFoundException, IPFSCache, get_bounty_id, get_bounty_ids_from_events, get_ordinal_repr, get_web3,
+    getBountyContract, ipfs_cat,
+)
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
 from test_plus.test import TestCase
 from web3.main import Web3
 from web3.providers.rpc import HTTPProvider
@@ -36,6 +46,15 @@ class DashboardUtilsTest(TestCase):
             assert len(web3_provider.providers) == 1
             assert isinstance(web3_provider.providers[0], HTTPProvider)
             assert web3_provider.providers[0].endpoint_uri == f'https://{network}.infura.io'
+            assert get_web3(network) is web3_provider
+
+    @staticmethod
+    def test_get_bounty_contract():
+        """Test that the StandardBounties contract is built once per network on the shared web3."""
+        contract = getBountyContract('mainnet')
+        assert getBountyContract('mainnet') is contract
+        assert contract.web3 is get_web3('mainnet')
+        assert getBountyContract('rinkeby') is not contract
 
     @staticmethod
     def test_get_ordinal_repr():
@@ -50,3 +69,93 @@ class DashboardUtilsTest(TestCase):
         assert get_ordinal_repr(22) == '22nd'
         assert get_ordinal_repr(23) == '23rd'
         assert get_ordinal_repr(24) == '24th'
+
+    @staticmethod
+    def test_ipfs_cat_cache():
+        """Test that IPFS payloads are fetched once, failures never cached and old payloads evicted."""
+        cache = IPFSCache(tempfile.mkdtemp(), max_bytes=100, hot_items=1)
+        bounty_hash = 'QmZMpRxkJGozhUzzfwjZMpAZeD5vxyr4jvWKJ5r2ybnLhE'
+        failed_hash = 'QmTfCejgo2wTwqnDJs8Lu1pCNeCrCDuE4GAwkna93zdd7d'
+        payloads = {bounty_hash: '{"payload": {}}', failed_hash: 'Failed to get block for ' + failed_hash}
+
+        with patch('dashboard.utils.ipfs_cache', cache), \
+                patch('dashboard.utils.ipfs_cat_requests', side_effect=payloads.get) as cat_requests:
+            assert ipfs_cat(bounty_hash) == payloads[bounty_hash]
+            assert ipfs_cat(bounty_hash) == payloads[bounty_hash]
+            assert cat_requests.call_count == 1
+            ipfs_cat(failed_hash)
+            ipfs_cat(failed_hash)
+            assert cat_requests.call_count == 3
+
+        # the hot tier only holds one payload, so this one is read back from disk
+        cache.set('Qm' + 'a' * 44, 'x' * 20)
+        assert cache.get(bounty_hash) == payloads[bounty_hash]
+        cache.set('Qm' + 'b' * 44, 'y' * 90)
+        assert cache.disk_bytes <= 90
+        assert os.path.exists(cache.path('Qm' + 'b' * 44))
+        assert not os.path.exists(cache.path('Qm' + 'a' * 44))
+
+    @staticmethod
+    def test_get_bounty_id_index():
+        """Test that bounty ids resolve from the URL index, scanning only past its high-water mark on a miss."""
+        urls = [f'https://github.com/gitcoinco/web/issues/{idx}' for idx in range(5)]
+
+        def stub_get_bounty(bounty_enum, network):
+            if bounty_enum >= len(urls):
+                raise BountyNotFoundException
+            return {'id': bounty_enum, 'network': network, 'data': {'payload': {'webReferenceURL': urls[bounty_enum]}}}
+
+        for bounty_enum in range(3):
+            BountyURLIndex.record(stub_get_bounty(bounty_enum, 'mainnet'))
+        BountyURLIndex.record({'id': 3, 'network': 'mainnet', 'data': {}})
+
+        with patch('dashboard.utils.get_bounty', side_effect=stub_get_bounty) as get_bounty:
+            assert get_bounty_id(urls[1] + '/', 'mainnet') == 1
+            assert get_bounty.call_count == 0
+            assert get_bounty_id(urls[4], 'mainnet') == 4
+            assert [call[0][0] for call in get_bounty.call_args_list] == [4]
+        assert BountyURLIndex.lookup(urls[4], 'mainnet') == 4
+        assert BountyURLIndex.high_water_mark('mainnet') == 4
+
+    @staticmethod
+    def test_get_bounty_id_index_gap():
+        """Test that a bounty in a gap below the high-water mark is found by reading only the unindexed ids."""
+        urls = [f'https://github.com/gitcoinco/web/issues/{idx}' for idx in range(5)]
+
+        def stub_get_bounty(bounty_enum, network):
+            if bounty_enum >= len(urls):
+                raise BountyNotFoundException
+            return {'id': bounty_enum, 'network': network, 'data': {'payload': {'webReferenceURL': urls[bounty_enum]}}}
+
+        for bounty_enum in [0, 2, 4]:
+            BountyURLIndex.record(stub_get_bounty(bounty_enum, 'mainnet'))
+
+        with patch('dashboard.utils.get_bounty', side_effect=stub_get_bounty) as get_bounty:
+            assert get_bounty_id(urls[1], 'mainnet') == 1
+            assert [call[0][0] for call in get_bounty.call_args_list] == [5, 3, 1]
+            assert get_bounty_id('https://github.com/gitcoinco/web/issues/9', 'mainnet') is None
+        assert BountyURLIndex.lookup(urls[3], 'mainnet') == 3
+
+    @staticmethod
+    def test_get_bounty_ids_from_events():
+        """Test that the bounties touched by StandardBounties events are read from the logs, a range at a time."""
+        contract = getBountyContract('mainnet')
+        event_abis = {event_abi['name']: event_abi for event_abi in contract.abi if event_abi['type'] == 'event'}
+
+        def log(name, *words, indexed=()):
+            topic = HexBytes(event_abi_to_log_topic(event_abis[name]))
+            return {
+                'topics': [topic] + [HexBytes(bytes(32)) for _ in indexed],
+                'data': '0x' + ''.join(f'{word:064x}' for word in words),
+            }
+
+        logs = {
+            0: [log('BountyIssued', 7), log('BountyFulfilled', 3, indexed=('fulfiller', '_fulfillmentId'))],
+            10: [{'topics': [HexBytes(bytes(32))], 'data': '0x'}, log('PayoutIncreased', 7, 10 ** 18)],
+            20: [log('ContributionAdded', 12, 10 ** 18, indexed=('contributor', ))],
+        }
+        with patch.object(contract.web3.eth, 'getLogs', side_effect=lambda params: logs[params['fromBlock']]) \
+                as get_logs:
+            assert get_bounty_ids_from_events('mainnet', 0, 24, blocks_per_request=10) == [3, 7, 12]
+        assert [(call[0][0]['fromBlock'], call[0][0]['toBlock']) for call in get_logs.call_args_list] == \
+            [(0, 9), (10, 19), (20, 24)]
@@ -18,9 +18,12 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
 from datetime import datetime
+from unittest.mock import patch
 
-from dashboard.models import Bounty
-from dashboard.notifications import amount_usdt_open_work, append_snooze_copy, build_github_notification
+from dashboard.models import Bounty, NotificationOutbox
+from dashboard.notifications import (
+    amount_usdt_open_work, append_snooze_copy, build_github_notification, deliver_notification,
+)
 from pytz import UTC
 from test_plus.test import TestCase
 
@@ -89,6 +92,42 @@ class DashboardNotificationsTest(TestCase):
                 copy = f'\nFunders only: Snooze warnings for {copy}'
             assert segments[i] == copy
 
+    def test_notification_outbox_enqueue(self):
+        """Test that an event is queued once per channel, however many times it is synced."""
+        notifications = NotificationOutbox.enqueue(self.bounty, 'work_submitted', [('fred', 'https://gitcoin.co/fred')])
+        assert sorted(notification.channel for notification in notifications) == sorted(NotificationOutbox.CHANNELS)
+        assert NotificationOutbox.enqueue(self.bounty, 'work_submitted') == []
+        assert len(NotificationOutbox.enqueue(self.bounty, 'work_done')) == len(NotificationOutbox.CHANNELS)
+        assert NotificationOutbox.claim('github')[0].payload == {'profile_pairs': [['fred', 'https://gitcoin.co/fred']]}
+
+    def test_deliver_notification(self):
+        """Test that delivered notifications are marked sent or skipped and failed ones retried then dead-lettered."""
+        NotificationOutbox.enqueue(self.bounty, 'work_submitted', [('fred', 'https://gitcoin.co/fred')])
+
+        github = NotificationOutbox.claim('github')[0]
+        with patch('dashboard.notifications.maybe_market_to_github', return_value=True) as maybe_market_to_github:
+            deliver_notification(github)
+        assert maybe_market_to_github.call_args[0][2] == [('fred', 'https://gitcoin.co/fred')]
+        assert github.status == 'sent'
+        assert github.sent_on
+
+        slack = NotificationOutbox.claim('slack')[0]
+        deliver_notification(slack)
+        assert slack.status == 'skipped'
+
+        twitter = NotificationOutbox.claim('twitter')[0]
+        with patch('dashboard.notifications.maybe_market_to_twitter', side_effect=Exception('rate limited')):
+            deliver_notification(twitter, max_attempts=2, backoff=30)
+            assert twitter.status == 'pending'
+            assert twitter.last_error == 'rate limited'
+            assert not NotificationOutbox.claim('twitter')
+
+            NotificationOutbox.objects.filter(pk=twitter.pk).update(next_attempt_on=twitter.created_on)
+            twitter = NotificationOutbox.claim('twitter')[0]
+            deliver_notification(twitter, max_attempts=2, backoff=30)
+        assert twitter.status == 'dead'
+        assert twitter.attempts == 2
+
     def tearDown(self):
         """Perform cleanup for the testcase."""
         self.bounty.delete()
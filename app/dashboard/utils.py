@@ -19,19 +19,33 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import json
 import logging
+import os
+import re
 import subprocess
 import time
+from collections import OrderedDict
+from threading import Lock, get_ident
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 
 import ipfsapi
 import requests
 import rollbar
 from dashboard.helpers import UnsupportedSchemaException, normalize_url, process_bounty_changes, process_bounty_details
-from dashboard.models import Bounty, UserAction
-from eth_utils import to_checksum_address
+from dashboard.models import Bounty, BountyURLIndex, UserAction
+from eth_abi import decode_abi
+from eth_abi.exceptions import DecodingError
+from eth_utils import event_abi_to_log_topic, to_checksum_address
 from hexbytes import HexBytes
 from ipfsapi.exceptions import CommunicationError
 from web3 import HTTPProvider, Web3
 from web3.exceptions import BadFunctionCallOutput
+from web3.utils.abi import filter_by_type, get_abi_output_types, map_abi_data
+from web3.utils.contracts import find_matching_fn_abi
+from web3.utils.events import get_event_data
+from web3.utils.normalizers import BASE_RETURN_NORMALIZERS
 
 logger = logging.getLogger(__name__)
 
@@ -124,16 +138,136 @@ def getIPFS():
         raise IPFSCantConnectException("IPFS is not running.  try running it with `ipfs daemon` before this script")
 
 
+class IPFSCache(object):
+    """Cache IPFS payloads by their hash.
+
+    Content behind an IPFS hash never changes, so payloads are kept forever in
+    a directory bounded to `max_bytes` by evicting the least recently read
+    files first, fronted by an in-process tier of the `hot_items` most
+    recently read payloads.
+
+    """
+
+    key_re = re.compile(r'^[A-Za-z0-9]{32,128}$')
+
+    def __init__(self, directory, max_bytes, hot_items):
+        """Initialize the cache."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hot_items = hot_items
+        self.hot = OrderedDict()
+        self.disk_bytes = None
+        self.lock = Lock()
+
+    def cacheable(self, key):
+        return bool(self.key_re.match(key or ''))
+
+    def path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """Get the cached payload of the provided hash.
+
+        Returns:
+            str: The payload, or None if it is not cached.
+
+        """
+        if not self.cacheable(key):
+            return None
+        with self.lock:
+            if key in self.hot:
+                self.hot.move_to_end(key)
+                return self.hot[key]
+        try:
+            with open(self.path(key), 'rb') as cached:
+                content = cached.read().decode('utf-8')
+            # the modification time orders the files for eviction
+            os.utime(self.path(key))
+        except (OSError, UnicodeDecodeError):
+            return None
+        self.remember(key, content)
+        return content
+
+    def set(self, key, content):
+        """Store the payload of the provided hash."""
+        if not self.cacheable(key) or not content:
+            return
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        self.remember(key, content)
+        data = content.encode('utf-8')
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f'{self.path(key)}.{os.getpid()}.{get_ident()}.tmp'
+            with open(temp_path, 'wb') as temp:
+                temp.write(data)
+            os.replace(temp_path, self.path(key))
+        except OSError as e:
+            logger.warning(f'could not cache IPFS payload {key}: {e}')
+            return
+        with self.lock:
+            if self.disk_bytes is not None:
+                self.disk_bytes += len(data)
+        self.evict()
+
+    def remember(self, key, content):
+        with self.lock:
+            self.hot[key] = content
+            self.hot.move_to_end(key)
+            while len(self.hot) > self.hot_items:
+                self.hot.popitem(last=False)
+
+    def evict(self):
+        """Remove the least recently read payloads until the directory fits `max_bytes` again."""
+        with self.lock:
+            if self.disk_bytes is not None and self.disk_bytes <= self.max_bytes:
+                return
+            entries = []
+            for entry in os.scandir(self.directory):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            self.disk_bytes = sum(size for _, size, _ in entries)
+            # evict down to 90% of the bound, so that every write does not trigger a scan
+            for _, size, path in sorted(entries):
+                if self.disk_bytes <= self.max_bytes * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self.disk_bytes -= size
+
+    def clear(self):
+        """Drop every cached payload."""
+        with self.lock:
+            self.hot.clear()
+            self.disk_bytes = None
+            if os.path.isdir(self.directory):
+                for entry in os.scandir(self.directory):
+                    os.remove(entry.path)
+
+
+ipfs_cache = IPFSCache(settings.IPFS_CACHE_DIR, settings.IPFS_CACHE_MAX_BYTES, settings.IPFS_CACHE_HOT_ITEMS)
+
+
 def ipfs_cat(key):
-    response = ipfs_cat_requests(key)
-    if response:
-        return response
+    if settings.IPFS_CACHE_ENABLED:
+        response = ipfs_cache.get(key)
+        if response is not None:
+            return response
 
-    response = ipfs_cat_ipfsapi(key)
-    if response:
-        return response
+    response = ipfs_cat_requests(key) or ipfs_cat_ipfsapi(key)
+    if not response:
+        raise Exception("could not connect to IPFS")
 
-    raise Exception("could not connect to IPFS")
+    # failures are answered as content, and must never be cached
+    failed = b'Failed to get block' if isinstance(response, bytes) else 'Failed to get block'
+    if settings.IPFS_CACHE_ENABLED and failed not in response:
+        ipfs_cache.set(key, response)
+    return response
 
 
 def ipfs_cat_ipfsapi(key):
@@ -144,9 +278,89 @@ def ipfs_cat_ipfsapi(key):
 def ipfs_cat_requests(key):
     url = f'https://ipfs.infura.io:5001/api/v0/cat/{key}'
     response = requests.get(url)
+    if not response.ok:
+        return None
     return response.text
 
 
+# http://web3py.readthedocs.io/en/latest/contracts.html
+STANDARD_BOUNTIES_ABI = '[{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"killBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyToken","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_data","type":"string"}],"name":"fulfillBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"extendDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"getNumBounties","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"},{"name":"_data","type":"string"}],"name":"updateFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"increasePayout","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"}],"name":"changeBountyFulfillmentAmount","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newIssuer","type":"address"}],"name":"transferIssuer","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"activateBounty","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"}],"name":"issueBounty","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"},{"name":"_value","type":"uint256"}],"name":"issueAndActivateBounty","outputs":[{"name":"","type":"uint256"}],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyArbiter","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"contribute","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[],"name":"owner","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newPaysTokens","type":"bool"},{"name":"_newTokenContract","type":"address"}],"name":"changeBountyPaysTokens","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyData","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"getFulfillment","outputs":[{"name":"","type":"bool"},{"name":"","type":"address"},{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newArbiter","type":"address"}],"name":"changeBountyArbiter","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"changeBountyDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"acceptFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"","type":"uint256"}],"name":"bounties","outputs":[{"name":"issuer","type":"address"},{"name":"deadline","type":"uint256"},{"name":"data","type":"string"},{"name":"fulfillmentAmount","type":"uint256"},{"name":"arbiter","type":"address"},{"name":"paysTokens","type":"bool"},{"name":"bountyStage","type":"uint8"},{"name":"balance","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBounty","outputs":[{"name":"","type":"address"},{"name":"","type":"uint256"},{"name":"","type":"uint256"},{"name":"","type":"bool"},{"name":"","type":"uint256"},{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newData","type":"string"}],"name":"changeBountyData","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getNumFulfillments","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"inputs":[{"name":"_owner","type":"address"}],"payable":false,"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyIssued","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"issuer","type":"address"}],"name":"BountyActivated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"BountyFulfilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentUpdated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentAccepted","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"issuer","type":"address"}],"name":"BountyKilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"contributor","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"ContributionAdded","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"newDeadline","type":"uint256"}],"name":"DeadlineExtended","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyChanged","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":true,"name":"_newIssuer","type":"address"}],"name":"IssuerTransferred","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_newFulfillmentAmount","type":"uint256"}],"name":"PayoutIncreased","type":"event"}]'
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """Send JSON-RPC requests over a keep-alive session shared by every thread."""
+
+    def __init__(self, endpoint_uri, session):
+        """Initialize the provider for the endpoint, posting through the provided session."""
+        super().__init__(endpoint_uri)
+        self.session = session
+
+    def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault('timeout', 10)
+        response = self.session.post(self.endpoint_uri, data=request_data, **request_kwargs)
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+class Web3Registry(object):
+    """Hold one Web3 instance and one StandardBounties contract per network.
+
+    Both are built on first use and then shared by every caller and thread:
+    the ABI is parsed once, and every request to a network reuses the
+    connections pooled by its session.
+
+    """
+
+    def __init__(self, pool_size=16):
+        """Initialize the empty registry."""
+        self.pool_size = pool_size
+        self.web3s = {}
+        self.contracts = {}
+        self.lock = Lock()
+
+    def build_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get_web3(self, network):
+        if network not in ['mainnet', 'rinkeby', 'ropsten']:
+            raise UnsupportedNetworkException(network)
+        web3 = self.web3s.get(network)
+        if web3 is None:
+            with self.lock:
+                web3 = self.web3s.get(network)
+                if web3 is None:
+                    web3 = Web3(PooledHTTPProvider(f'https://{network}.infura.io', self.build_session()))
+                    self.web3s[network] = web3
+        return web3
+
+    def get_contract(self, network):
+        contract = self.contracts.get(network)
+        if contract is None:
+            address = getStandardBountiesContractAddresss(network)
+            web3 = self.get_web3(network)
+            with self.lock:
+                contract = self.contracts.get(network)
+                if contract is None:
+                    contract = web3.eth.contract(address, abi=json.loads(STANDARD_BOUNTIES_ABI))
+                    self.contracts[network] = contract
+        return contract
+
+    def reset(self):
+        """Drop every Web3 instance and contract, eg: after a fork."""
+        with self.lock:
+            self.web3s = {}
+            self.contracts = {}
+
+
+web3_registry = Web3Registry()
+
+
 def get_web3(network):
     """Get a Web3 session for the provided network.
 
@@ -158,12 +372,10 @@ def get_web3(network):
             is passed an invalid network.
 
     Returns:
-        web3.main.Web3: A web3 instance for the provided network.
+        web3.main.Web3: The shared web3 instance for the provided network.
 
     """
-    if network in ['mainnet', 'rinkeby', 'ropsten']:
-        return Web3(HTTPProvider(f'https://{network}.infura.io'))
-    raise UnsupportedNetworkException(network)
+    return web3_registry.get_web3(network)
 
 
 def getStandardBountiesContractAddresss(network):
@@ -174,38 +386,131 @@ def getStandardBountiesContractAddresss(network):
     raise UnsupportedNetworkException(network)
 
 
-# http://web3py.readthedocs.io/en/latest/contracts.html
 def getBountyContract(network):
-    web3 = get_web3(network)
-    standardbounties_abi = '[{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"killBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyToken","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_data","type":"string"}],"name":"fulfillBounty","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"extendDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"getNumBounties","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"},{"name":"_data","type":"string"}],"name":"updateFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"increasePayout","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newFulfillmentAmount","type":"uint256"}],"name":"changeBountyFulfillmentAmount","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newIssuer","type":"address"}],"name":"transferIssuer","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"activateBounty","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"}],"name":"issueBounty","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_issuer","type":"address"},{"name":"_deadline","type":"uint256"},{"name":"_data","type":"string"},{"name":"_fulfillmentAmount","type":"uint256"},{"name":"_arbiter","type":"address"},{"name":"_paysTokens","type":"bool"},{"name":"_tokenContract","type":"address"},{"name":"_value","type":"uint256"}],"name":"issueAndActivateBounty","outputs":[{"name":"","type":"uint256"}],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyArbiter","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_value","type":"uint256"}],"name":"contribute","outputs":[],"payable":true,"stateMutability":"payable","type":"function"},{"constant":true,"inputs":[],"name":"owner","outputs":[{"name":"","type":"address"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newPaysTokens","type":"bool"},{"name":"_newTokenContract","type":"address"}],"name":"changeBountyPaysTokens","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBountyData","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"getFulfillment","outputs":[{"name":"","type":"bool"},{"name":"","type":"address"},{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newArbiter","type":"address"}],"name":"changeBountyArbiter","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newDeadline","type":"uint256"}],"name":"changeBountyDeadline","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_fulfillmentId","type":"uint256"}],"name":"acceptFulfillment","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"","type":"uint256"}],"name":"bounties","outputs":[{"name":"issuer","type":"address"},{"name":"deadline","type":"uint256"},{"name":"data","type":"string"},{"name":"fulfillmentAmount","type":"uint256"},{"name":"arbiter","type":"address"},{"name":"paysTokens","type":"bool"},{"name":"bountyStage","type":"uint8"},{"name":"balance","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getBounty","outputs":[{"name":"","type":"address"},{"name":"","type":"uint256"},{"name":"","type":"uint256"},{"name":"","type":"bool"},{"name":"","type":"uint256"},{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_bountyId","type":"uint256"},{"name":"_newData","type":"string"}],"name":"changeBountyData","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_bountyId","type":"uint256"}],"name":"getNumFulfillments","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"inputs":[{"name":"_owner","type":"address"}],"payable":false,"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyIssued","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"issuer","type":"address"}],"name":"BountyActivated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"BountyFulfilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentUpdated","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"fulfiller","type":"address"},{"indexed":true,"name":"_fulfillmentId","type":"uint256"}],"name":"FulfillmentAccepted","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"issuer","type":"address"}],"name":"BountyKilled","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":true,"name":"contributor","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"ContributionAdded","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"},{"indexed":false,"name":"newDeadline","type":"uint256"}],"name":"DeadlineExtended","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"bountyId","type":"uint256"}],"name":"BountyChanged","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":true,"name":"_newIssuer","type":"address"}],"name":"IssuerTransferred","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"name":"_bountyId","type":"uint256"},{"indexed":false,"name":"_newFulfillmentAmount","type":"uint256"}],"name":"PayoutIncreased","type":"event"}]'
-    standardbounties_addr = getStandardBountiesContractAddresss(network)
-    bounty_abi = json.loads(standardbounties_abi)
-    getBountyContract = web3.eth.contract(standardbounties_addr, abi=bounty_abi)
-    return getBountyContract
+    return web3_registry.get_contract(network)
 
 
-def get_bounty(bounty_enum, network):
-    standard_bounties = getBountyContract(network)
+STANDARD_BOUNTIES_READS = ['getBounty', 'getBountyData', 'getBountyArbiter', 'getBountyToken', 'getNumFulfillments']
 
-    try:
-        issuer, contract_deadline, fulfillmentAmount, paysTokens, bountyStage, balance = standard_bounties.functions.getBounty(bounty_enum).call()
-    except BadFunctionCallOutput:
+
+def batch_call(network, calls):
+    """Send several StandardBounties reads to the network in one JSON-RPC batch request.
+
+    Args:
+        network (str): The network to read from.
+        calls (list of tuple): The function name and arguments of each read.
+
+    Raises:
+        ValueError: If the node rejected the batch as a whole.
+
+    Returns:
+        list: The decoded result of each read, in order, as `.call()` would have
+            returned it, or the exception `.call()` would have raised instead.
+
+    """
+    if not calls:
+        return []
+    contract = getBountyContract(network)
+    provider = contract.web3.providers[0]
+    payload = [{
+        'jsonrpc': '2.0',
+        'id': idx,
+        'method': 'eth_call',
+        'params': [{'to': contract.address, 'data': contract.encodeABI(fn_name=fn_name, args=args)}, 'latest'],
+    } for idx, (fn_name, args) in enumerate(calls)]
+    request_kwargs = provider.get_request_kwargs()
+    request_kwargs.setdefault('timeout', 10)
+    response = getattr(provider, 'session', requests).post(
+        provider.endpoint_uri, data=json.dumps(payload), **request_kwargs)
+    response.raise_for_status()
+    answers = response.json()
+    if not isinstance(answers, list):
+        raise ValueError(answers.get('error', answers))
+    answers = {answer['id']: answer for answer in answers}
+
+    results = []
+    for idx, (fn_name, args) in enumerate(calls):
+        answer = answers.get(idx, {'error': 'missing from the batch response'})
+        if 'error' in answer:
+            results.append(ValueError(answer['error']))
+            continue
+        output_types = get_abi_output_types(find_matching_fn_abi(contract.abi, fn_name, args))
+        try:
+            output_data = decode_abi(output_types, HexBytes(answer['result']))
+        except DecodingError as e:
+            results.append(BadFunctionCallOutput(f'Could not decode {fn_name}{tuple(args)} return data: {e}'))
+            continue
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        results.append(normalized_data[0] if len(normalized_data) == 1 else normalized_data)
+    return results
+
+
+def _result(value):
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+def get_bounties(bounty_enums, network):
+    """Get several bounties, reading them from the chain in two batched requests.
+
+    The first request reads the bounties themselves, the second every one of
+    their fulfillments.
+
+    Args:
+        bounty_enums (list of int): The standard bounties ids to get.
+        network (str): The network to read from.
+
+    Returns:
+        OrderedDict: The bounty as returned by `get_bounty`, or the exception
+            getting it raised, keyed by standard bounties id.
+
+    """
+    reads = batch_call(network, [(fn_name, [bounty_enum]) for bounty_enum in bounty_enums
+                                 for fn_name in STANDARD_BOUNTIES_READS])
+    chain_data = {
+        bounty_enum: dict(zip(STANDARD_BOUNTIES_READS, reads[idx * len(STANDARD_BOUNTIES_READS):]))
+        for idx, bounty_enum in enumerate(bounty_enums)
+    }
+
+    fulfillment_ids = [
+        (bounty_enum, fulfill_enum)
+        for bounty_enum in bounty_enums if not isinstance(chain_data[bounty_enum]['getNumFulfillments'], Exception)
+        for fulfill_enum in range(int(chain_data[bounty_enum]['getNumFulfillments']))
+    ]
+    fulfillment_reads = batch_call(network, [('getFulfillment', list(ids)) for ids in fulfillment_ids])
+    for (bounty_enum, fulfill_enum), fulfillment in zip(fulfillment_ids, fulfillment_reads):
+        chain_data[bounty_enum].setdefault('getFulfillment', []).append(fulfillment)
+
+    bounties = OrderedDict()
+    for bounty_enum in bounty_enums:
+        try:
+            bounties[bounty_enum] = assemble_bounty(bounty_enum, network, chain_data[bounty_enum])
+        except Exception as e:
+            bounties[bounty_enum] = e
+    return bounties
+
+
+def assemble_bounty(bounty_enum, network, chain_data):
+    """Assemble a bounty from its reads off the chain and its IPFS payloads."""
+    if isinstance(chain_data['getBounty'], BadFunctionCallOutput):
         raise BountyNotFoundException
+    issuer, contract_deadline, fulfillmentAmount, paysTokens, bountyStage, balance = _result(chain_data['getBounty'])
 
     # pull from blockchain
-    bountydata = standard_bounties.functions.getBountyData(bounty_enum).call()
-    arbiter = standard_bounties.functions.getBountyArbiter(bounty_enum).call()
-    token = standard_bounties.functions.getBountyToken(bounty_enum).call()
+    bountydata = _result(chain_data['getBountyData'])
+    arbiter = _result(chain_data['getBountyArbiter'])
+    token = _result(chain_data['getBountyToken'])
     bounty_data_str = ipfs_cat(bountydata)
     bounty_data = json.loads(bounty_data_str)
 
     # fulfillments
-    num_fulfillments = int(standard_bounties.functions.getNumFulfillments(bounty_enum).call())
+    num_fulfillments = int(_result(chain_data['getNumFulfillments']))
     fulfillments = []
     for fulfill_enum in range(0, num_fulfillments):
 
         # pull from blockchain
-        accepted, fulfiller, data = standard_bounties.functions.getFulfillment(bounty_enum, fulfill_enum).call()
+        accepted, fulfiller, data = _result(chain_data['getFulfillment'][fulfill_enum])
         data_str = ipfs_cat(data)
         data = json.loads(data_str)
 
@@ -250,14 +555,70 @@ def get_bounty(bounty_enum, network):
     return bounty
 
 
+def get_bounty(bounty_enum, network):
+    return _result(get_bounties([bounty_enum], network)[bounty_enum])
+
+
+def get_block_number(network):
+    """Get the number of the latest block of the network."""
+    return get_web3(network).eth.blockNumber
+
+
+def get_bounty_ids_from_events(network, from_block, to_block, blocks_per_request=5000):
+    """Get the ids of the bounties touched by a StandardBounties event in a range of blocks.
+
+    Every StandardBounties event (BountyIssued, BountyFulfilled,
+    FulfillmentAccepted, ContributionAdded, DeadlineExtended, BountyChanged,
+    BountyKilled...) carries the id of the bounty it changed.
+
+    Args:
+        network (str): The network to read the event logs of.
+        from_block (int): The first block of the range.
+        to_block (int): The last block of the range, included.
+        blocks_per_request (int): The number of blocks whose logs are read in one request.
+            Defaults to: 5000.
+
+    Returns:
+        list of int: The standard bounties ids touched, in ascending order.
+
+    """
+    contract = getBountyContract(network)
+    event_abis = {event_abi_to_log_topic(event_abi): event_abi for event_abi in filter_by_type('event', contract.abi)}
+    bounty_enums = set()
+    for start_block in range(from_block, to_block + 1, blocks_per_request):
+        logs = contract.web3.eth.getLogs({
+            'fromBlock': start_block,
+            'toBlock': min(start_block + blocks_per_request - 1, to_block),
+            'address': contract.address,
+        })
+        for log in logs:
+            event_abi = event_abis.get(bytes(log['topics'][0])) if log['topics'] else None
+            if event_abi is None or log.get('removed'):
+                continue
+            args = get_event_data(event_abi, log)['args']
+            bounty_enums.add(args['bountyId'] if 'bountyId' in args else args['_bountyId'])
+    return sorted(bounty_enums)
+
+
 # processes a bounty returned by get_bounty
 def web3_process_bounty(bounty_data):
-    did_change, old_bounty, new_bounty = process_bounty_details(bounty_data)
-
-    if did_change and new_bounty:
-        _from = old_bounty.pk if old_bounty else None
-        print(f"- processing changes, {_from} => {new_bounty.pk}")
-        process_bounty_changes(old_bounty, new_bounty)
+    BountyURLIndex.record(bounty_data)
+    # the new bounty and the notifications it raises are committed together, while an error
+    # processing the changes only rolls back to the savepoint and is raised once committed
+    error = None
+    with transaction.atomic():
+        did_change, old_bounty, new_bounty = process_bounty_details(bounty_data)
+
+        if did_change and new_bounty:
+            _from = old_bounty.pk if old_bounty else None
+            print(f"- processing changes, {_from} => {new_bounty.pk}")
+            try:
+                with transaction.atomic():
+                    process_bounty_changes(old_bounty, new_bounty)
+            except Exception as e:
+                error = e
+    if error:
+        raise error
 
     return did_change, old_bounty, new_bounty
 
@@ -277,6 +638,19 @@ def get_bounty_id(issue_url, network):
     if bounty_id:
         return bounty_id
 
+    bounty_id = BountyURLIndex.lookup(issue_url, network)
+    if bounty_id is not None:
+        return bounty_id
+
+    # the index only holds the bounties read so far, so scan past its high-water mark first,
+    # then back through the ids below it that were never read
+    high_water_mark = BountyURLIndex.high_water_mark(network)
+    if high_water_mark is not None:
+        bounty_id = get_bounty_id_from_web3(issue_url, network, high_water_mark + 1, direction='up')
+        if bounty_id is None:
+            bounty_id = get_unindexed_bounty_id_from_web3(issue_url, network, high_water_mark)
+        return bounty_id
+
     all_known_stdbounties = Bounty.objects.filter(web3_type='bounties_network', network=network).order_by('-standard_bounties_id')
 
     methodology = 'start_from_web3_latest'
@@ -322,6 +696,7 @@ def get_bounty_id_from_web3(issue_url, network, start_bounty_id, direction='up')
             # pull and process each bounty
             print(f'** get_bounty_id_from_web3; looking at {bounty_enum}')
             bounty = get_bounty(bounty_enum, network)
+            BountyURLIndex.record(bounty)
             url = bounty.get('data', {}).get('payload', {}).get('webReferenceURL', False)
             if url == issue_url:
                 return bounty['id']
@@ -340,6 +715,133 @@ def get_bounty_id_from_web3(issue_url, network, start_bounty_id, direction='up')
     return None
 
 
+def get_unindexed_bounty_id_from_web3(issue_url, network, high_water_mark):
+    """Scan down from the high-water mark through the bounties missing from the URL index.
+
+    Args:
+        issue_url (str): The URL of the issue to look for.
+        network (str): The network to read the bounties of.
+        high_water_mark (int): The highest standard bounties id to look at.
+
+    Returns:
+        int: The standard bounties id of the bounty, or None.
+
+    """
+    issue_url = normalize_url(issue_url)
+    indexed_ids = set(BountyURLIndex.objects.filter(network=network, standard_bounties_id__lte=high_water_mark)
+                      .values_list('standard_bounties_id', flat=True))
+    for bounty_enum in range(high_water_mark, -1, -1):
+        if bounty_enum in indexed_ids:
+            continue
+        print(f'** get_unindexed_bounty_id_from_web3; looking at {bounty_enum}')
+        try:
+            bounty = get_bounty(bounty_enum, network)
+        except (BountyNotFoundException, UnsupportedSchemaException):
+            continue
+        BountyURLIndex.record(bounty)
+        url = bounty.get('data', {}).get('payload', {}).get('webReferenceURL', False)
+        if url == issue_url:
+            return bounty['id']
+
+    return None
+
+
+def run_sync_job(job, max_attempts=6, backoff=3):
+    """Run one attempt of a queued sync of a bounty with web3.
+
+    This is one pass of the synchronous `dashboard.views.sync_web3`: instead of
+    sleeping between tries, an attempt that the chain, the node or IPFS is not
+    ready for yet is rescheduled with an exponential backoff.
+
+    Args:
+        job (dashboard.models.BountySyncJob): The running job.
+        max_attempts (int): The number of attempts after which the job fails.
+            Defaults to: 6.
+        backoff (int): The seconds waited after the first attempt, doubled after each one.
+            Defaults to: 3.
+
+    """
+    job.attempts += 1
+    try:
+        if not has_tx_mined(job.txid, job.network):
+            return job.retry('tx has not mined yet', max_attempts, backoff)
+        bounty_id = get_bounty_id(job.github_url, job.network)
+        if not bounty_id:
+            return job.retry('could not find bounty id', max_attempts, backoff)
+        did_change, _, new_bounty = web3_process_bounty(get_bounty(bounty_id, job.network))
+        if not did_change and job.attempts < max_attempts:
+            return job.retry('bounty did not change yet', max_attempts, backoff)
+        job.succeed({'did_change': did_change, 'url': new_bounty.url if new_bounty else None})
+    except Exception as e:
+        logger.error(f'* Exception in sync job {job.pk} => {e}')
+        job.retry(str(e), max_attempts, backoff)
+
+
+def run_enrichment_jobs(jobs, max_attempts=5, backoff=60, timeout=10):
+    """Fetch the Github issues of the claimed bounties and store their bodies.
+
+    Each issue is requested once however many revisions of its bounty are
+    queued, and the fetched values are written with one targeted UPDATE per
+    issue, without the save signals of `Bounty.fetch_issue_item`.
+
+    Args:
+        jobs (list of dashboard.models.IssueEnrichmentJob): The running jobs.
+        max_attempts (int): The number of attempts after which a job fails.
+            Defaults to: 5.
+        backoff (int): The seconds waited after the first attempt, doubled after each one.
+            Defaults to: 60.
+        timeout (int): The seconds to wait for the Github API.
+            Defaults to: 10.
+
+    Returns:
+        int: The number of bounty rows written to.
+
+    """
+    from dashboard.models import IssueEnrichmentJob
+    from dashboard.signals import bump_bounty_data_version
+    from economy.models import get_time
+    from github.utils import _AUTH
+
+    jobs_by_url = OrderedDict()
+    for job in jobs:
+        job.attempts += 1
+        api_url = job.bounty.get_github_api_url() if job.bounty else ''
+        jobs_by_url.setdefault(api_url, []).append(job)
+
+    updated = 0
+    done = jobs_by_url.pop('', [])
+    session = requests.Session()
+    for api_url, url_jobs in jobs_by_url.items():
+        try:
+            response = session.get(api_url, auth=_AUTH, timeout=timeout)
+            if response.status_code in [404, 410]:
+                done += url_jobs
+                continue
+            response.raise_for_status()
+            issue = response.json()
+        except Exception as e:
+            logger.error(f'* Exception while fetching {api_url} => {e}')
+            for job in url_jobs:
+                job.retry(str(e), max_attempts, backoff)
+            continue
+
+        bounties = Bounty.objects.filter(pk__in=[job.bounty_id for job in url_jobs])
+        if issue.get('body'):
+            updated += bounties.update(issue_description=issue['body'], modified_on=get_time())
+        if issue.get('title'):
+            # the title from the chain wins, the issue's only fills in a missing one
+            updated += bounties.filter(title='').update(title=issue['title'], modified_on=get_time())
+        done += url_jobs
+
+    IssueEnrichmentJob.objects.filter(pk__in=[job.pk for job in done]).update(
+        status='done', attempts=F('attempts') + 1, error='', modified_on=get_time())
+    for job in done:
+        job.status = 'done'
+    if updated:
+        bump_bounty_data_version(sender=Bounty)
+    return updated
+
+
 def build_profile_pairs(bounty):
     """Build the profile pairs list of tuples for ingestion by notifications.
 
@@ -30,6 +30,7 @@ from django.contrib.staticfiles.templatetags.staticfiles import static
 from django.http import Http404, JsonResponse
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
@@ -38,8 +39,8 @@ from django.views.decorators.http import require_POST
 
 from app.utils import ellipses, sync_profile
 from dashboard.models import (
-    Bounty, CoinRedemption, CoinRedemptionRequest, Interest, Profile, ProfileSerializer, Subscription, Tip, Tool,
-    ToolVote, UserAction,
+    Bounty, BountySyncJob, CoinRedemption, CoinRedemptionRequest, Interest, Profile, ProfileSerializer, Subscription,
+    Tip, Tool, ToolVote, UserAction,
 )
 from dashboard.notifications import (
     maybe_market_tip_to_email, maybe_market_tip_to_github, maybe_market_tip_to_slack, maybe_market_to_slack,
@@ -882,7 +883,16 @@ def sync_web3(request):
     txid = request.POST.get('txid')
     network = request.POST.get('network')
 
-    if issue_url and txid and network:
+    if issue_url and txid and network and settings.SYNC_WEB3_ASYNC:
+        # hand the sync to the process_sync_jobs worker, the client polls the job until it is done
+        job = BountySyncJob.objects.create(github_url=issue_url, txid=txid, network=network)
+        result = {
+            'status': '202',
+            'msg': 'queued',
+            'job_id': job.pk,
+            'job_url': reverse('sync_web3_job', args=[job.pk]),
+        }
+    elif issue_url and txid and network:
         # confirm txid has mined
         print('* confirming tx has mined')
         if not has_tx_mined(txid, network):
@@ -928,6 +938,22 @@ def sync_web3(request):
     return JsonResponse(result, status=result['status'])
 
 
+@ratelimit(key='ip', rate='5/s', block=True)
+def sync_web3_job(request, job_id):
+    """Get the progress of a sync queued by `sync_web3`.
+
+    Returns:
+        JsonResponse: The status of the job (pending, running, done or failed),
+            and once done whether the bounty changed and its url.
+
+    """
+    try:
+        job = BountySyncJob.objects.get(pk=job_id)
+    except BountySyncJob.DoesNotExist:
+        raise Http404
+    return JsonResponse(job.to_dict())
+
+
 # LEGAL
 
 def terms(request):
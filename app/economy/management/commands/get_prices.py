@@ -23,8 +23,9 @@ from django.core.management.base import BaseCommand
 
 import ccxt
 import cryptocompare as cc
-from dashboard.models import Bounty, Tip
+from dashboard.models import Bounty, OpenWorkTotals, Tip, recompute_derived
 from economy.models import ConversionRate
+from economy.utils import conversion_rate_index
 from websocket import create_connection
 
 
@@ -110,17 +111,14 @@ def polo():
 
 
 def refresh_bounties():
-    for bounty in Bounty.objects.all():
-        print(f'refreshed {bounty.pk}')
-        try:
-            bounty._val_usd_db = bounty.value_in_usdt
-            bounty._val_usd_db_now = bounty.value_in_usdt_now
-            bounty.save()
-        except Exception as e:
-            print(e)
-            bounty._val_usd_db = 0
-            bounty._val_usd_db_now = 0
-            bounty.save()
+    # pull the rates stored above into the index once instead of per bounty
+    conversion_rate_index.refresh()
+    updated = recompute_derived(Bounty.objects.all())
+    print(f'refreshed {updated} bounties')
+    # the bulk recompute bypasses the save signals that maintain the totals
+    for totals in OpenWorkTotals.refresh_all():
+        print(f'open work totals: {totals}')
+    print(f'conversion rate index: {conversion_rate_index.stats()}')
 
 
 def refresh_conv_rate(when, token_name):
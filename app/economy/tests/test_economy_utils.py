@@ -22,7 +22,7 @@ from datetime import datetime
 from django.test.client import RequestFactory
 
 from economy.models import ConversionRate
-from economy.utils import convert_amount, etherscan_link
+from economy.utils import ConversionRateNotFoundError, conversion_rate_index, convert_amount, etherscan_link
 from test_plus.test import TestCase
 
 
@@ -65,6 +65,35 @@ class EconomyUtilsTest(TestCase):
         result = convert_amount(2, 'ETH', 'USDT', datetime(2018, 1, 1))
         assert round(result, 1) == 10
 
+    def test_convert_amount_missing_rate(self):
+        """Test the economy util convert_amount method raises for unknown pairs."""
+        with self.assertRaises(ConversionRateNotFoundError):
+            convert_amount(2, 'ETH', 'DAI')
+        with self.assertRaises(ConversionRateNotFoundError):
+            convert_amount(2, 'ETH', 'USDT', datetime(2099, 1, 1))
+
+    def test_conversion_rate_index_hits(self):
+        """Test the conversion rate index serves warm lookups without querying."""
+        convert_amount(2, 'ETH', 'USDT')
+        with self.assertNumQueries(0):
+            assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 6
+            assert round(convert_amount(2, 'ETH', 'USDT', datetime(2018, 1, 1)), 1) == 10
+        stats = conversion_rate_index.stats()
+        assert stats['hits'] >= 2
+        assert stats['pairs'] == 1
+
+    def test_conversion_rate_index_incremental_reload(self):
+        """Test the conversion rate index picks up newly stored rates."""
+        convert_amount(2, 'ETH', 'USDT')
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=4,
+            source='etherdelta',
+            from_currency='ETH',
+            to_currency='USDT',
+        )
+        assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 8
+
     def test_etherscan_link(self):
         """Test the economy util etherscan_link method."""
         txid = '0xcb39900d98fa00de2936d2770ef3bfef2cc289328b068e580dc68b7ac1e2055b'
@@ -17,6 +17,17 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
 from economy.models import ConversionRate
 
 
@@ -33,6 +44,158 @@ class ConversionRateNotFoundError(Exception):
     pass
 
 
+class ConversionRateIndex(object):
+    """Define a process-local, time-indexed cache of ConversionRates.
+
+    Rates are held per (from_currency, to_currency) pair as a timestamp sorted
+    list, so both the latest rate and the first rate at or after a given time
+    are answered with a binary search.  A pair is loaded from the database the
+    first time it is requested and then kept current by pulling only the rows
+    created after the highest loaded id (the high-water mark).
+
+    Attributes:
+        hits (int): The number of lookups served without a database query.
+        misses (int): The number of lookups that required a database query.
+
+    """
+
+    def __init__(self, ttl=60):
+        """Initialize the index.
+
+        Args:
+            ttl (int): The number of seconds between incremental refreshes.
+
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """Drop every loaded pair and start over."""
+        with self._lock:
+            self._series = {}
+            self._high_water = 0
+            self._refreshed_at = time.time()
+            self._stale = False
+
+    def mark_stale(self):
+        """Force an incremental refresh on the next lookup."""
+        self._stale = True
+
+    def stats(self):
+        """Return the lookup counters and the size of the index."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'pairs': len(self._series),
+            'rates': sum(len(series['timestamps']) for series in self._series.values()),
+            'high_water': self._high_water,
+        }
+
+    def _insert(self, row):
+        """Insert a (id, from_currency, to_currency, timestamp, from_amount, to_amount) row."""
+        pk, from_currency, to_currency, timestamp, from_amount, to_amount = row
+        series = self._series.get((from_currency, to_currency))
+        if series is None or pk <= series['high_water']:
+            return
+        series['high_water'] = pk
+        if not from_amount:
+            return
+        timestamps = series['timestamps']
+        position = bisect_left(timestamps, timestamp)
+        # keep insertion order stable for rows sharing a timestamp
+        while position < len(timestamps) and timestamps[position] == timestamp:
+            position += 1
+        timestamps.insert(position, timestamp)
+        series['rates'].insert(position, float(to_amount) / float(from_amount))
+
+    def _rows(self, **filters):
+        return ConversionRate.objects.filter(**filters).order_by('id') \
+            .values_list('id', 'from_currency', 'to_currency', 'timestamp', 'from_amount', 'to_amount')
+
+    def _load_pair(self, pair):
+        """Load every ConversionRate for the provided pair from the database."""
+        if not self._series:
+            # later pairs are kept from double counting by their own high-water mark
+            self._high_water = ConversionRate.objects.aggregate(Max('id'))['id__max'] or 0
+        self._series[pair] = {'timestamps': [], 'rates': [], 'high_water': 0}
+        for row in self._rows(from_currency=pair[0], to_currency=pair[1]):
+            self._insert(row)
+
+    def refresh(self):
+        """Pull ConversionRates created since the high-water mark into the loaded pairs."""
+        with self._lock:
+            if self._series:
+                for row in self._rows(id__gt=self._high_water):
+                    self._high_water = max(self._high_water, row[0])
+                    self._insert(row)
+            self._refreshed_at = time.time()
+            self._stale = False
+
+    def _series_for(self, from_currency, to_currency):
+        pair = (from_currency, to_currency)
+        with self._lock:
+            queried = False
+            if self._stale or time.time() - self._refreshed_at > self.ttl:
+                self.refresh()
+                queried = True
+            if pair not in self._series:
+                self._load_pair(pair)
+                queried = True
+            if queried:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return self._series[pair]
+
+    def get_rate(self, from_currency, to_currency, timestamp=None):
+        """Get the conversion rate between two currencies.
+
+        Args:
+            from_currency (str): The currency identifier to convert from.
+            to_currency (str): The currency identifier to convert to.
+            timestamp (datetime): First available conversion rate after timestamp. Latest if None.
+
+        Raises:
+            ConversionRateNotFoundError: No matching ConversionRate exists.
+
+        Returns:
+            float: The amount of to_currency received for one unit of from_currency.
+
+        """
+        series = self._series_for(from_currency, to_currency)
+        with self._lock:
+            timestamps, rates = series['timestamps'], series['rates']
+            if timestamp:
+                if not isinstance(timestamp, datetime):
+                    timestamp = datetime(timestamp.year, timestamp.month, timestamp.day)
+                if timezone.is_naive(timestamp):
+                    timestamp = timezone.make_aware(timestamp, timezone.get_default_timezone())
+                position = bisect_left(timestamps, timestamp)
+                if position < len(rates):
+                    return rates[position]
+            elif rates:
+                return rates[-1]
+        raise ConversionRateNotFoundError(f"ConversionRate {from_currency}/{to_currency} @ {timestamp} not found")
+
+
+conversion_rate_index = ConversionRateIndex(ttl=settings.CONVERSION_RATE_INDEX_TTL)
+
+
+@receiver(post_save, sender=ConversionRate, dispatch_uid="conversion_rate_index_save")
+def conversion_rate_index_save(sender, instance, **kwargs):
+    """Mark the ConversionRate index stale whenever a new rate is stored."""
+    conversion_rate_index.mark_stale()
+
+
+@receiver(post_delete, sender=ConversionRate, dispatch_uid="conversion_rate_index_delete")
+def conversion_rate_index_delete(sender, instance, **kwargs):
+    """Drop the ConversionRate index whenever a rate is removed."""
+    conversion_rate_index.reset()
+
+
 def convert_amount(from_amount, from_currency, to_currency, timestamp=None):
     """Convert the provided amount to another current.
 
@@ -42,10 +205,17 @@ def convert_amount(from_amount, from_currency, to_currency, timestamp=None):
         to_currency (str): The currency identifier to convert to.
         timestamp (datetime): First available conversion rate after timestamp. Latest if None.
 
+    Raises:
+        ConversionRateNotFoundError: No matching ConversionRate exists.
+
     Returns:
         float: The amount in to_currency.
 
     """
+    if settings.CONVERSION_RATE_INDEX_ENABLED:
+        rate = conversion_rate_index.get_rate(from_currency, to_currency, timestamp)
+        return rate * float(from_amount)
+
     if timestamp:
         conversion_rate = ConversionRate.objects.filter(
             from_currency=from_currency,
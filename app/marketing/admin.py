@@ -22,8 +22,8 @@ from django.contrib import admin
 from django.utils.safestring import mark_safe
 
 from .models import (
-    Alumni, EmailEvent, EmailSubscriber, GithubEvent, GithubOrgToTwitterHandleMapping, LeaderboardRank, Match,
-    SlackPresence, SlackUser, Stat,
+    Alumni, BulkEmailCheckpoint, EmailEvent, EmailSubscriber, GithubEvent, GithubOrgToTwitterHandleMapping,
+    LeaderboardRank, Match, SlackPresence, SlackUser, Stat, SyncWatermark,
 )
 
 
@@ -94,3 +94,5 @@ admin.site.register(LeaderboardRank, GeneralAdmin)
 admin.site.register(SlackUser, SlackUserAdmin)
 admin.site.register(SlackPresence, GeneralAdmin)
 admin.site.register(GithubOrgToTwitterHandleMapping, GeneralAdmin)
+admin.site.register(BulkEmailCheckpoint, GeneralAdmin)
+admin.site.register(SyncWatermark, GeneralAdmin)
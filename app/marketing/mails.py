@@ -15,6 +15,7 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
+import copy
 
 from django.conf import settings
 from django.utils import timezone, translation
@@ -23,15 +24,28 @@ from django.utils.translation import gettext_lazy as _
 
 import sendgrid
 from economy.utils import convert_token_to_usdt
-from marketing.utils import get_or_save_email_subscriber, should_suppress_notification_email
+from marketing.utils import get_or_save_email_subscriber, get_suppressed_emails, should_suppress_notification_email
 from python_http_client.exceptions import HTTPError, UnauthorizedError
 from retail.emails import (
-    render_bounty_expire_warning, render_bounty_feedback, render_bounty_startwork_expire_warning,
+    EmailRenderCache, render_bounty_expire_warning, render_bounty_feedback, render_bounty_startwork_expire_warning,
     render_bounty_unintersted, render_faucet_rejected, render_faucet_request, render_match_email, render_new_bounty,
     render_new_bounty_acceptance, render_new_bounty_rejection, render_new_bounty_roundup, render_new_work_submission,
     render_tip_email,
 )
-from sendgrid.helpers.mail import Content, Email, Mail, Personalization
+from sendgrid.helpers.mail import Content, Email, Mail, Personalization, Substitution
+
+# Stands in for the subscriber's private key in emails sent in bulk, and is substituted per recipient by SendGrid
+EMAIL_KEY_SUBSTITUTION = '-email_key-'
+
+_sendgrid_client = None
+
+
+def get_sendgrid_client():
+    """Get the SendGrid client shared by every send, instead of setting up one per email."""
+    global _sendgrid_client
+    if _sendgrid_client is None:
+        _sendgrid_client = sendgrid.SendGridAPIClient(apikey=settings.SENDGRID_API_KEY)
+    return _sendgrid_client
 
 
 def send_mail(from_email, _to_email, subject, body, html=False,
@@ -47,7 +61,7 @@ def send_mail(from_email, _to_email, subject, body, html=False,
     # setup
     from_name = str(from_name)
     subject = str(subject)
-    sg = sendgrid.SendGridAPIClient(apikey=settings.SENDGRID_API_KEY)
+    sg = get_sendgrid_client()
     from_email = Email(from_email, from_name)
     to_email = Email(to_email)
     contenttype = "text/plain" if not html else "text/html"
@@ -86,6 +100,180 @@ def send_mail(from_email, _to_email, subject, body, html=False,
     return response
 
 
+def send_bulk_mail(from_email, recipients, subject, body, html=False, from_name="Gitcoin.co", rate_limiter=None,
+                   on_sent=None):
+    """Send the same email to many recipients via SendGrid, up to SENDGRID_BATCH_SIZE of them per request.
+
+    Each recipient gets a personalization of their own, so nobody sees the
+    other recipients and per recipient values are substituted by SendGrid.
+
+    Args:
+        from_email (str): The sender address.
+        recipients (list of tuple): The (to_email, substitutions) of each recipient, where
+            substitutions maps the placeholders in the body to the recipient's values.
+        subject (str): The subject of the email.
+        body (str): The text body, sent when there is no html body.
+        html (str): The html body.
+            Defaults to: False, sending the text body.
+        from_name (str): The name of the sender.
+        rate_limiter (marketing.utils.TokenBucket): Limits the rate of requests to SendGrid.
+            Defaults to: None, sending without a limit.
+        on_sent (callable): Called with the addresses of each request as soon as SendGrid accepts it.
+            Defaults to: None.
+
+    Raises:
+        HTTPError: The exception is raised if SendGrid rejects a request. The
+            recipients of the earlier requests have been sent the email, and
+            were reported to `on_sent`.
+
+    Returns:
+        int: The number of recipients the email was sent to.
+
+    """
+    if not settings.SENDGRID_API_KEY:
+        print('No SendGrid API Key set. Not attempting to send email.')
+        return 0
+
+    from_name = str(from_name)
+    subject = str(subject)
+    to_emails = [to_email for to_email, _ in recipients]
+    if settings.IS_DEBUG_ENV:
+        # just to be double secret sure of what were doing in dev
+        recipients = [(settings.CONTACT_EMAIL, substitutions) for _, substitutions in recipients[:1]]
+        subject = _("[DEBUG] ") + subject
+    contenttype = "text/plain" if not html else "text/html"
+
+    sent = 0
+    batch_size = min(settings.SENDGRID_BATCH_SIZE, 1000)
+    for start in range(0, len(recipients), batch_size):
+        batch = recipients[start:start + batch_size]
+        mail = Mail()
+        mail.from_email = Email(from_email, from_name)
+        mail.subject = subject
+        mail.add_content(Content(contenttype, html) if html else Content(contenttype, body))
+        for to_email, substitutions in batch:
+            p = Personalization()
+            p.add_to(Email(to_email))
+            for key, value in substitutions.items():
+                p.add_substitution(Substitution(key, value))
+            mail.add_personalization(p)
+
+        if rate_limiter:
+            rate_limiter.take()
+        print(f"-- Sending Mail '{subject}' to {len(batch)} recipients, from {batch[0][0]}")
+        try:
+            get_sendgrid_client().client.mail.send.post(request_body=mail.get())
+        except UnauthorizedError:
+            print(f'-- Sendgrid Mail failure - Unauthorized - Check sendgrid credentials')
+            raise
+        except HTTPError as e:
+            print(f'-- Sendgrid Mail failure - {e}')
+            raise
+        sent += len(batch)
+        if on_sent:
+            # in debug only the contact email is sent to, on behalf of every recipient
+            on_sent(to_emails if settings.IS_DEBUG_ENV else [to_email for to_email, _ in batch])
+    return sent
+
+
+def get_subscribers(emails):
+    """Get the EmailSubscriber of each address, saving those who are not subscribed yet.
+
+    Args:
+        emails (list of str): The email addresses.
+
+    Returns:
+        dict: The EmailSubscribers keyed by the provided addresses.
+
+    """
+    from marketing.models import EmailSubscriber
+
+    subscribers = {}
+    # the newest subscriber wins, as it does in get_or_save_email_subscriber
+    for es in EmailSubscriber.objects.filter(email__in=emails).order_by('created_on'):
+        subscribers[es.email] = es
+    for email in emails:
+        if email not in subscribers or not subscribers[email].priv:
+            subscribers[email] = get_or_save_email_subscriber(email, 'internal')
+    return {email: es for email, es in subscribers.items() if es}
+
+
+def get_preferred_languages(emails):
+    """Get the preferred language of the users with the provided email addresses, as setup_lang does.
+
+    Args:
+        emails (list of str): The email addresses.
+
+    Returns:
+        dict: The language codes keyed by email address, for the addresses of users with a profile.
+
+    """
+    from django.contrib.auth.models import User
+
+    languages = {}
+    for user in User.objects.select_related('profile').filter(email__in=emails).order_by('pk'):
+        if user.email not in languages and hasattr(user, 'profile'):
+            languages[user.email] = user.profile.get_profile_preferred_language()
+    return languages
+
+
+def send_bulk_rendered_mail(to_emails, _type, render, from_email, from_name="Gitcoin.co", variant=None,
+                            rate_limiter=None, on_sent=None):
+    """Render an email once per language and variant, and send it in bulk.
+
+    The email is rendered for a copy of one recipient's subscriber whose
+    private key is replaced by EMAIL_KEY_SUBSTITUTION, which SendGrid then
+    swaps for the key of each recipient.
+
+    Args:
+        to_emails (list of str): The email addresses to send to.
+        _type (str): The type of email, as passed to should_suppress_notification_email.
+        render (callable): Renders the email for an EmailSubscriber, returning its html, text and subject.
+        from_email (str): The sender address.
+        from_name (str): The name of the sender.
+        variant (callable): Groups together the subscribers who get the same email. The email
+            may only depend on the subscriber through the returned value and the private key.
+            Defaults to: None, sending the same email to every subscriber of a language.
+        rate_limiter (marketing.utils.TokenBucket): Limits the rate of requests to SendGrid.
+        on_sent (callable): Called with the addresses of each request as soon as SendGrid accepts it.
+
+    Raises:
+        HTTPError: The exception is raised if SendGrid rejects a request. The
+            groups sent before were reported to `on_sent`.
+
+    Returns:
+        int: The number of recipients the email was sent to.
+
+    """
+    suppressed = get_suppressed_emails(to_emails, _type)
+    to_emails = [to_email for to_email in to_emails if to_email not in suppressed]
+    subscribers = get_subscribers(to_emails)
+    languages = get_preferred_languages(to_emails)
+    cur_language = translation.get_language()
+    groups = {}
+    for to_email in to_emails:
+        if to_email in subscribers:
+            es = subscribers[to_email]
+            key = (languages.get(to_email, cur_language), variant(es) if variant else None)
+            groups.setdefault(key, []).append((to_email, es))
+
+    sent = 0
+    try:
+        for (language, variant_key), recipients in groups.items():
+            translation.activate(language)
+            placeholder = copy.copy(recipients[0][1])
+            placeholder.priv = EMAIL_KEY_SUBSTITUTION
+            html, text, subject = render(placeholder)
+            sent += send_bulk_mail(
+                from_email,
+                [(to_email, {EMAIL_KEY_SUBSTITUTION: es.priv}) for to_email, es in recipients],
+                subject, text, html, from_name=from_name, rate_limiter=rate_limiter, on_sent=on_sent,
+            )
+    finally:
+        translation.activate(cur_language)
+    return sent
+
+
 def bounty_feedback(bounty, persona='fulfiller', previous_bounties=[]):
     from_email = settings.PERSONAL_CONTACT_EMAIL
     to_email = None
@@ -198,9 +386,9 @@ def reject_faucet_request(fr):
         translation.activate(cur_language)
 
 
-def new_bounty_daily(bounties, old_bounties, to_emails=None):
+def new_bounty_daily(bounties, old_bounties, to_emails=None, rate_limiter=None, render_cache=None):
     if not bounties:
-        return
+        return 0
     max_bounties = 10
     if len(bounties) > max_bounties:
         bounties = bounties[0:max_bounties]
@@ -210,35 +398,31 @@ def new_bounty_daily(bounties, old_bounties, to_emails=None):
     worth = round(sum([bounty.value_in_usdt for bounty in bounties if bounty.value_in_usdt]), 2)
     worth = f" worth ${worth}" if worth else ""
     subject = _(f"⚡️  {len(bounties)} New Open Funded Issue{plural}{worth} matching your profile")
+    render_cache = render_cache or EmailRenderCache()
 
-    for to_email in to_emails:
-        cur_language = translation.get_language()
-        try:
-            setup_lang(to_email)
-            from_email = settings.CONTACT_EMAIL
-            html, text = render_new_bounty(to_email, bounties, old_bounties)
+    def render(subscriber):
+        html, text = render_new_bounty(
+            subscriber.email, bounties, old_bounties, subscriber=subscriber, cache=render_cache)
+        return html, text, subject
 
-            if not should_suppress_notification_email(to_email, 'transactional'):
-                send_mail(from_email, to_email, subject, text, html)
-        finally:
-            translation.activate(cur_language)
+    return send_bulk_rendered_mail(
+        to_emails, 'transactional', render, settings.CONTACT_EMAIL,
+        variant=lambda subscriber: tuple(subscriber.keywords), rate_limiter=rate_limiter,
+    )
 
 
-def weekly_roundup(to_emails=None):
+def weekly_roundup(to_emails=None, rate_limiter=None, render_cache=None, on_sent=None):
     if to_emails is None:
         to_emails = []
+    render_cache = render_cache or EmailRenderCache()
 
-    for to_email in to_emails:
-        cur_language = translation.get_language()
-        try:
-            setup_lang(to_email)
-            html, text, subject = render_new_bounty_roundup(to_email)
-            from_email = settings.PERSONAL_CONTACT_EMAIL
+    def render(subscriber):
+        return render_new_bounty_roundup(subscriber.email, subscriber=subscriber, cache=render_cache)
 
-            if not should_suppress_notification_email(to_email, 'roundup'):
-                send_mail(from_email, to_email, subject, text, html, from_name="Kevin Owocki (Gitcoin.co)")
-        finally:
-            translation.activate(cur_language)
+    return send_bulk_rendered_mail(
+        to_emails, 'roundup', render, settings.PERSONAL_CONTACT_EMAIL, from_name="Kevin Owocki (Gitcoin.co)",
+        rate_limiter=rate_limiter, on_sent=on_sent,
+    )
 
 
 def new_work_submission(bounty, to_emails=None):
@@ -20,6 +20,7 @@ from django.utils import timezone
 
 from dashboard.models import Bounty
 from marketing.mails import bounty_expire_warning
+from marketing.utils import get_email_preferences
 
 
 class Command(BaseCommand):
@@ -37,7 +38,8 @@ class Command(BaseCommand):
                 expires_date__gte=(timezone.now() + timezone.timedelta(days=day)),
             ).all()
             print('day {} got {} bounties'.format(day, bounties.count()))
-            for b in bounties:
+            email_lists = []
+            for b in bounties.prefetch_related('fulfillments__profile'):
                 email_list = []
                 if b.bounty_owner_email:
                     email_list.append(b.bounty_owner_email)
@@ -46,4 +48,8 @@ class Command(BaseCommand):
                         email_list.append(fulfiller.fulfiller_email)
                     elif fulfiller.profile and fulfiller.profile.email:
                         email_list.append(fulfiller.profile.email)
+                email_lists.append((b, email_list))
+            # one query loads the preferences of every recipient, so each suppression check hits the cache
+            get_email_preferences([email for _, email_list in email_lists for email in email_list])
+            for b, email_list in email_lists:
                 bounty_expire_warning(b, email_list)
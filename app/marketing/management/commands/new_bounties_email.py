@@ -24,6 +24,8 @@ from django.utils import timezone
 from dashboard.models import Bounty
 from marketing.mails import new_bounty_daily
 from marketing.models import EmailSubscriber
+from marketing.utils import TokenBucket
+from retail.emails import EmailRenderCache
 
 
 def get_bounties_for_keywords(keywords, hours_back):
@@ -56,17 +58,25 @@ class Command(BaseCommand):
         hours_back = 24
         eses = EmailSubscriber.objects.filter(active=True)
         print("got {} emails".format(eses.count()))
-        for es in eses:
+
+        # subscribers with the same keywords get the same bounties, which are looked up and sent once for all of them
+        emails_by_keywords = {}
+        for to_email, keywords in eses.order_by('email').values_list('email', 'keywords'):
+            if keywords:
+                emails_by_keywords.setdefault(tuple(sorted(set(keywords))), []).append(to_email)
+
+        rate_limiter = TokenBucket(settings.SENDGRID_REQUESTS_PER_SECOND)
+        render_cache = EmailRenderCache()
+        for keywords, to_emails in emails_by_keywords.items():
             try:
-                keywords = es.keywords
-                if not keywords:
-                    continue
-                to_email = es.email
                 new_bounties, all_bounties = get_bounties_for_keywords(keywords, hours_back)
-                print("{}/{}: got {} new bounties & {} all bounties".format(to_email, keywords, new_bounties.count(), all_bounties.count()))
+                print("{} subscribers/{}: got {} new bounties & {} all bounties".format(
+                    len(to_emails), keywords, new_bounties.count(), all_bounties.count()))
                 if new_bounties.count():
-                    print(f"sent to {to_email}")
-                    new_bounty_daily(new_bounties, all_bounties, [to_email])
+                    sent = new_bounty_daily(
+                        new_bounties, all_bounties, to_emails, rate_limiter=rate_limiter, render_cache=render_cache)
+                    print(f"sent to {sent} subscribers")
             except Exception as e:
                 logging.exception(e)
                 print(e)
+        print(f"render cache: {render_cache}")
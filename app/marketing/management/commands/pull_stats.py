@@ -400,6 +400,15 @@ def bounties_open():
         )
 
 
+def bounties_open_usdt():
+    from dashboard.models import OpenWorkTotals
+
+    Stat.objects.create(
+        key='bounties_open_usdt',
+        val=int(OpenWorkTotals.get_cached('mainnet')['amount_usdt']),
+        )
+
+
 def bounties_fulfilled():
     from dashboard.models import Bounty
 
@@ -547,6 +556,7 @@ class Command(BaseCommand):
             tips_received,
             bounties_fulfilled,
             bounties_open,
+            bounties_open_usdt,
             bounties_by_status,
             subs_active,
             subs_newsletter,
@@ -18,10 +18,14 @@
 import time
 import warnings
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 from marketing.mails import weekly_roundup
-from marketing.models import EmailSubscriber
+from marketing.models import BulkEmailCheckpoint, EmailSubscriber
+from marketing.utils import TokenBucket
+from retail.emails import EmailRenderCache
 
 warnings.filterwarnings("ignore", category=DeprecationWarning) 
 
@@ -52,6 +56,34 @@ class Command(BaseCommand):
             default=None,
             help="filter_startswith (optional)",
         )
+        parser.add_argument(
+            '--run',
+            dest='run',
+            type=str,
+            default=None,
+            help="the name of the run to resume, defaults to the roundup of this week (optional)",
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            dest='restart',
+            default=False,
+            help='Send to every subscriber again, even when the run already got further'
+        )
+        parser.add_argument(
+            '--batch_size',
+            dest='batch_size',
+            type=int,
+            default=settings.SENDGRID_BATCH_SIZE,
+            help="the number of subscribers sent to per SendGrid request (optional)",
+        )
+        parser.add_argument(
+            '--retries',
+            dest='retries',
+            type=int,
+            default=3,
+            help="the number of times a failed batch is retried before the run stops (optional)",
+        )
 
     def handle(self, *args, **options):
 
@@ -63,19 +95,61 @@ class Command(BaseCommand):
             queryset = queryset.exclude(email__startswith=exclude_startswith)
         if filter_startswith:
             queryset = queryset.filter(email__startswith=filter_startswith)
-        queryset = queryset.order_by('email')
-        email_list = set(queryset.values_list('email', flat=True))
-
-        print("got {} emails".format(len(email_list)))
-
-        counter = 0
-        for to_email in email_list:
-            counter += 1
-            print("-sending {} / {}".format(counter, to_email))
-            if options['live']:
+        queryset = queryset.exclude(email='').order_by('email')
+
+        print("got {} emails".format(queryset.values('email').distinct().count()))
+        if not options['live']:
+            return
+
+        # progress is saved after each batch, so running the command again resumes a crashed run
+        year, week, _ = timezone.now().isocalendar()
+        run = options['run'] or f'roundup-{year}-{week:02d}'
+        checkpoint, _ = BulkEmailCheckpoint.objects.get_or_create(name=run)
+        if options['restart']:
+            checkpoint.last_email = ''
+            checkpoint.batch_sent = []
+            checkpoint.num_sent = 0
+            checkpoint.completed_on = None
+            checkpoint.save()
+        if checkpoint.completed_on:
+            print(f"{run} was completed on {checkpoint.completed_on}, use --restart to send it again")
+            return
+        if checkpoint.last_email:
+            print(f"resuming {run} after {checkpoint.last_email} ({checkpoint.num_sent} sent)")
+
+        def record_sent(emails):
+            # saved as soon as each SendGrid request goes through, so a retry only sends to the rest
+            checkpoint.batch_sent += emails
+            checkpoint.num_sent += len(emails)
+            checkpoint.save()
+
+        rate_limiter = TokenBucket(settings.SENDGRID_REQUESTS_PER_SECOND)
+        render_cache = EmailRenderCache()
+        batch_size = max(options['batch_size'], 1)
+        while True:
+            to_emails = list(
+                queryset.filter(email__gt=checkpoint.last_email).values_list('email', flat=True).distinct()[:batch_size]
+            )
+            if not to_emails:
+                break
+            num_sent = checkpoint.num_sent
+            for attempt in range(options['retries'] + 1):
+                batch_sent = set(checkpoint.batch_sent)
+                unsent = [to_email for to_email in to_emails if to_email not in batch_sent]
                 try:
-                    weekly_roundup([to_email])
-                    time.sleep(1)
+                    weekly_roundup(unsent, rate_limiter=rate_limiter, render_cache=render_cache, on_sent=record_sent)
+                    break
                 except Exception as e:
                     print(e)
-                    time.sleep(5)
+                    if attempt == options['retries']:
+                        print(f"stopping {run} after {checkpoint.last_email}, run the command again to resume")
+                        return
+                    time.sleep(5 * 2 ** attempt)
+            checkpoint.last_email = to_emails[-1]
+            checkpoint.batch_sent = []
+            checkpoint.save()
+            print("-sent {} / {} ({} total)".format(checkpoint.num_sent - num_sent, to_emails[-1], checkpoint.num_sent))
+
+        checkpoint.completed_on = timezone.now()
+        checkpoint.save()
+        print(f"render cache: {render_cache}")
@@ -15,109 +15,178 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from mailchimp3 import MailChimp
-from marketing.models import EmailSubscriber
-from marketing.utils import get_or_save_email_subscriber as process_email
+from marketing.models import EmailSubscriber, SyncWatermark
+from marketing.utils import bulk_invite_to_slack, bulk_save_email_subscribers
 
+PULL_WATERMARK = 'sync_mail_pull'
+PUSH_WATERMARK = 'sync_mail_push'
+# records changed shortly before a watermark are read again, to cover clock skew and transactions in flight
+WATERMARK_OVERLAP = timezone.timedelta(minutes=10)
 
-def pull_to_db():
-    print('- pull_to_db')
+
+def get_mailchimp_client():
+    """Get a MailChimp client, talking to MAILCHIMP_API_URL when it is set."""
+    client = MailChimp(settings.MAILCHIMP_USER, settings.MAILCHIMP_API_KEY)
+    if settings.MAILCHIMP_API_URL:
+        client.base_url = settings.MAILCHIMP_API_URL
+    return client
+
+
+def changed_since(queryset, since):
+    """Narrow the queryset to the rows modified since `since`, or leave it whole if None."""
+    return queryset.filter(modified_on__gte=since) if since else queryset
+
+
+def get_local_emails(since=None):
+    """Iterate over the (email, source) of every address known to the local tables."""
     print("- profile")
     from dashboard.models import Profile
     # right now, we only take profiles that've given us an access token
-    profiles = Profile.objects.exclude(email='').all()
-    # in the future, though, we could take ALL github profiles in the system and use those
-    # profiles = Profile.objects.exclude(email='').all()
-    for profile in profiles:
-        process_email(profile.email, 'profile_email')
+    for email in changed_since(Profile.objects.exclude(email=''), since).values_list('email', flat=True).iterator():
+        yield email, 'profile_email'
 
     print("- match")
     from marketing.models import Match
-    for match in Match.objects.all():
-        process_email(match.email, 'match')
+    for email in changed_since(Match.objects, since).values_list('email', flat=True).iterator():
+        yield email, 'match'
 
-    get_size = 50
-    client = MailChimp(settings.MAILCHIMP_USER, settings.MAILCHIMP_API_KEY)
+
+def get_mailchimp_emails(since=None):
+    """Iterate over the (email, source) of every member of the MailChimp list changed since `since`.
+
+    The first page tells how many members there are; the other pages are then fetched
+    concurrently, at most MAILCHIMP_CONCURRENCY at a time.
+
+    """
+    client = get_mailchimp_client()
+    page_size = settings.MAILCHIMP_PAGE_SIZE
+    params = {'count': page_size, 'fields': 'members.email_address,total_items'}
+    if since:
+        params['since_last_changed'] = since.isoformat(timespec='seconds')
+
+    def get_page(offset):
+        return client.lists.members.all(settings.MAILCHIMP_LIST_ID, offset=offset, **params)['members']
 
     print('mailchimp')
-    for i in range(0, 90000):
-        members = client.lists.members.all(settings.MAILCHIMP_LIST_ID, count=get_size, offset=(i*get_size), fields="members.email_address")
-        members = members['members']
-        if not len(members):
-            break
-        print(i)
-        for member in members:
-            email = member['email_address']
-            process_email(email, 'mailchimp')
+    first_page = client.lists.members.all(settings.MAILCHIMP_LIST_ID, offset=0, **params)
+    total_items = first_page['total_items']
+    print(f"- {total_items} members")
+    with ThreadPoolExecutor(max_workers=settings.MAILCHIMP_CONCURRENCY) as pool:
+        pages = pool.map(get_page, range(page_size, total_items, page_size))
+        for members in chain([first_page['members']], pages):
+            for member in members:
+                yield member['email_address'], 'mailchimp'
     print('/mailchimp')
 
+
+def get_usage_emails(since=None):
+    """Iterate over the (email, source) of every address used on subscriptions, tips, bounties and the tdi."""
     print('local')
     print("- dashboard_sub")
-    from dashboard.models import Subscription
-    for sub in Subscription.objects.all():
-        email = sub.email
-        process_email(email, 'dashboard_subscription')
+    from dashboard.models import BountyFulfillment, Subscription, Tip
+    for email in changed_since(Subscription.objects, since).values_list('email', flat=True).iterator():
+        yield email, 'dashboard_subscription'
 
     print("- tip")
-    from dashboard.models import Tip
-    for tip in Tip.objects.all():
-        for email in tip.emails:
-            process_email(email, 'tip_usage')
-        if tip.from_email:
-            process_email(tip.from_email, 'tip_usage')
+    for emails, from_email in changed_since(Tip.objects, since).values_list('emails', 'from_email').iterator():
+        for email in emails or []:
+            yield email, 'tip_usage'
+        if from_email:
+            yield from_email, 'tip_usage'
 
     print("- bounty")
     from dashboard.models import Bounty
-    for b in Bounty.objects.prefetch_related('fulfillments').all():
-        email_list = []
-        if b.bounty_owner_email:
-            email_list.append(b.bounty_owner_email)
-        for fulfiller in b.fulfillments.all():
-            if fulfiller.fulfiller_email:
-                email_list.append(fulfiller.fulfiller_email)
-        for email in email_list:
-            process_email(email, 'bounty_usage')
+    bounties = changed_since(Bounty.objects.exclude(bounty_owner_email=''), since)
+    for email in bounties.values_list('bounty_owner_email', flat=True).iterator():
+        yield email, 'bounty_usage'
+    fulfillments = changed_since(BountyFulfillment.objects.exclude(fulfiller_email=''), since)
+    for email in fulfillments.values_list('fulfiller_email', flat=True).iterator():
+        yield email, 'bounty_usage'
 
     print("- tdi")
     from tdi.models import WhitepaperAccess, WhitepaperAccessRequest
-    for wa in WhitepaperAccess.objects.all():
-        process_email(wa.email, 'whitepaperaccess')
+    for email in changed_since(WhitepaperAccess.objects, since).values_list('email', flat=True).iterator():
+        yield email, 'whitepaperaccess'
+
+    for email in changed_since(WhitepaperAccessRequest.objects, since).values_list('email', flat=True).iterator():
+        yield email, 'whitepaperaccessrequest'
+
+
+def get_since(name, full=False):
+    """Get from when a sync should read changes, or None to read everything."""
+    synced_until = None if full else SyncWatermark.get(name)
+    return synced_until - WATERMARK_OVERLAP if synced_until else None
 
-    for wa in WhitepaperAccessRequest.objects.all():
-        process_email(wa.email, 'whitepaperaccessrequest')
 
+def pull_to_db(full=False):
+    print('- pull_to_db')
+    started_on = timezone.now()
+    since = get_since(PULL_WATERMARK, full)
+    print(f"- reading changes since {since}" if since else "- reading everything")
+    # the addresses are collected first and saved with a few bulk upserts, the latest source of each winning
+    entries = []
+    for emails in [get_local_emails(since), get_mailchimp_emails(since), get_usage_emails(since)]:
+        entries += [(email, source, None) for email, source in emails if email]
+    created = bulk_save_email_subscribers(entries)
+
+    print(f"- inviting {len(created)} new subscribers to slack")
+    bulk_invite_to_slack(created)
+    SyncWatermark.advance(PULL_WATERMARK, started_on)
     print('/pull_to_db')
 
 
+def get_member_operation(email):
+    """Build the batch operation adding an email to the list, leaving the status of existing members alone."""
+    subscriber_hash = hashlib.md5(email.lower().encode('utf-8')).hexdigest()
+    return {
+        'method': 'PUT',
+        'path': f'lists/{settings.MAILCHIMP_LIST_ID}/members/{subscriber_hash}',
+        'body': json.dumps({'email_address': email, 'status_if_new': 'subscribed'}),
+    }
+
+
 def push_to_mailchimp():
     print('- push_to_mailchimp')
-    client = MailChimp(settings.MAILCHIMP_USER, settings.MAILCHIMP_API_KEY)
-    created_after = timezone.now() - timezone.timedelta(hours=2)
-    eses = EmailSubscriber.objects.filter(active=True, created_on__gt=created_after).order_by('-pk')
-    print("- {} emails".format(eses.count()))
-    for es in eses:
-        email = es.email
-        print(email)
-        try:
-            client.lists.members.create(settings.MAILCHIMP_LIST_ID, {
-                'email_address': email,
-                'status': 'subscribed'
-            })
-            print('pushed_to_list')
-        except Exception:
-            # print("already on the list")
-            pass
+    client = get_mailchimp_client()
+    started_on = timezone.now()
+    created_after = SyncWatermark.get(PUSH_WATERMARK)
+    created_after = created_after - WATERMARK_OVERLAP if created_after else started_on - timezone.timedelta(hours=2)
+    # the members pulled from mailchimp are on the list already
+    emails = list(EmailSubscriber.objects.filter(active=True, created_on__gt=created_after)
+                  .exclude(source='mailchimp').order_by('pk').values_list('email', flat=True))
+    print("- {} emails".format(len(emails)))
+    batch_size = settings.MAILCHIMP_BATCH_SIZE
+    for i in range(0, len(emails), batch_size):
+        batch = client.batches.create(data={
+            'operations': [get_member_operation(email) for email in emails[i:i + batch_size]],
+        })
+        print(f"- batch {batch.get('id')} of {len(emails[i:i + batch_size])} emails")
+    SyncWatermark.advance(PUSH_WATERMARK, started_on)
     print('/push_to_mailchimp')
 
 
 class Command(BaseCommand):
 
-    help = 'pulls mailchimp emails'
+    help = 'syncs the email subscribers changed since the last run between the db and mailchimp'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            dest='full',
+            help='pull every email instead of only the ones changed since the last run',
+        )
 
     def handle(self, *args, **options):
-        pull_to_db()
+        pull_to_db(full=options['full'])
         push_to_mailchimp()
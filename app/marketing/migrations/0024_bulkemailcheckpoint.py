@@ -0,0 +1,27 @@
+# Generated by Django 2.0.5 on 2018-05-22 14:12
+
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0023_auto_20180515_1510'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkEmailCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('last_email', models.EmailField(blank=True, default='', max_length=255)),
+                ('num_sent', models.IntegerField(default=0)),
+                ('completed_on', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
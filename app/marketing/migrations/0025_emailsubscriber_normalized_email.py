@@ -0,0 +1,27 @@
+# Generated by Django 2.0.5 on 2018-05-23 10:05
+
+from django.db import migrations, models
+from django.db.models import Func
+from django.db.models.functions import Lower
+
+
+def normalize_emails(apps, schema_editor):
+    EmailSubscriber = apps.get_model('marketing', 'EmailSubscriber')
+    # Django 2.0 has no Trim function, so call the database's TRIM directly.
+    EmailSubscriber.objects.update(normalized_email=Lower(Func('email', function='TRIM')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0024_bulkemailcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailsubscriber',
+            name='normalized_email',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=255),
+        ),
+        migrations.RunPython(normalize_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 2.0.5 on 2018-05-23 16:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_subscribers(apps, schema_editor):
+    """Keep the newest subscriber of each email, as get_or_save_email_subscriber did on finding duplicates."""
+    EmailSubscriber = apps.get_model('marketing', 'EmailSubscriber')
+    duplicates = EmailSubscriber.objects.values('normalized_email').annotate(num=Count('pk')).filter(num__gt=1)
+    for duplicate in duplicates.iterator():
+        pks = EmailSubscriber.objects.filter(normalized_email=duplicate['normalized_email']) \
+            .order_by('-created_on').values_list('pk', flat=True)[1:]
+        EmailSubscriber.objects.filter(pk__in=list(pks)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0025_emailsubscriber_normalized_email'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_subscribers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='emailsubscriber',
+            name='normalized_email',
+            field=models.CharField(blank=True, default='', max_length=255, unique=True),
+        ),
+    ]
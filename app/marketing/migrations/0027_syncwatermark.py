@@ -0,0 +1,25 @@
+# Generated by Django 2.0.5 on 2018-05-24 10:05
+
+from django.db import migrations, models
+
+import economy.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0026_unique_normalized_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncWatermark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_on', models.DateTimeField(db_index=True, default=economy.models.get_time)),
+                ('modified_on', models.DateTimeField(default=economy.models.get_time)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('synced_until', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.0.5 on 2018-05-24 17:05
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0027_syncwatermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bulkemailcheckpoint',
+            name='batch_sent',
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.EmailField(max_length=255), blank=True, default=list, size=None),
+        ),
+    ]
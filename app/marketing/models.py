@@ -18,9 +18,11 @@
 '''
 from __future__ import unicode_literals
 
+import hashlib
 from secrets import token_hex
 
 from django.contrib.postgres.fields import ArrayField, JSONField
+from django.core.cache import cache
 from django.db import models
 
 from economy.models import SuperModel
@@ -44,6 +46,8 @@ class Alumni(SuperModel):
 class EmailSubscriber(SuperModel):
 
     email = models.EmailField(max_length=255)
+    # the lowercased email, which identifies the subscriber and is looked up instead of email__iexact
+    normalized_email = models.CharField(max_length=255, unique=True, blank=True, default='')
     source = models.CharField(max_length=50)
     active = models.BooleanField(default=True)
     newsletter = models.BooleanField(default=True)
@@ -61,6 +65,20 @@ class EmailSubscriber(SuperModel):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        """Keep the normalized email in line with the email, and drop the cached preferences."""
+        self.normalized_email = self.normalize_email(self.email)
+        super().save(*args, **kwargs)
+        cache.delete(self.preferences_cache_key(self.normalized_email))
+
+    @staticmethod
+    def normalize_email(email):
+        return (email or '').strip().lower()
+
+    @staticmethod
+    def preferences_cache_key(normalized_email):
+        return f'marketing:email_preferences:{hashlib.md5(normalized_email.encode("utf-8")).hexdigest()}'
+
     def set_priv(self):
         self.priv = token_hex(16)[:29]
 
@@ -184,3 +202,41 @@ class EmailEvent(SuperModel):
 
     def __str__(self):
         return f"{self.email} - {self.event} - {self.created_on}"
+
+
+class BulkEmailCheckpoint(SuperModel):
+    """Record how far a bulk email run got, so that a crashed run resumes where it stopped.
+
+    Every address up to `last_email` is done with, as are the addresses of the
+    batch after it that are listed in `batch_sent`.
+
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    last_email = models.EmailField(max_length=255, blank=True, default='')
+    batch_sent = ArrayField(models.EmailField(max_length=255), blank=True, default=list)
+    num_sent = models.IntegerField(default=0)
+    completed_on = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} - {self.num_sent} sent up to {self.last_email}"
+
+
+class SyncWatermark(SuperModel):
+    """Record up to when a periodic sync has moved records, so that the next run only moves later changes."""
+
+    name = models.CharField(max_length=255, unique=True)
+    synced_until = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} - synced until {self.synced_until}"
+
+    @staticmethod
+    def get(name):
+        """Get when the named sync last completed, or None if it never did."""
+        return SyncWatermark.objects.filter(name=name).values_list('synced_until', flat=True).first()
+
+    @staticmethod
+    def advance(name, synced_until):
+        """Record that the named sync has moved every record changed before `synced_until`."""
+        SyncWatermark.objects.update_or_create(name=name, defaults={'synced_until': synced_until})
@@ -19,8 +19,9 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 from unittest.mock import patch
 
-from marketing.management.commands.roundup import Command
-from marketing.models import EmailSubscriber
+from django.core.management import call_command
+
+from marketing.models import BulkEmailCheckpoint, EmailSubscriber
 from test_plus.test import TestCase
 
 
@@ -53,16 +54,66 @@ class TestRoundup(TestCase):
     @patch('marketing.management.commands.roundup.weekly_roundup')
     def test_handle_no_options(self, mock_weekly_roundup, *args):
         """Test command roundup when live option is False."""
-        Command().handle(exclude_startswith=None, filter_startswith=None, live=False)
+        call_command('roundup')
 
         assert mock_weekly_roundup.call_count == 0
 
     @patch('time.sleep')
-    @patch('marketing.management.commands.roundup.weekly_roundup')
+    @patch('marketing.management.commands.roundup.weekly_roundup', return_value=1)
     def test_handle_with_options(self, mock_weekly_roundup, *args):
         """Test command roundup which various options."""
-        Command().handle(exclude_startswith='f', filter_startswith='jack', live=True)
+        call_command('roundup', exclude_startswith='f', filter_startswith='jack', live=True)
 
         assert mock_weekly_roundup.call_count == 1
+        assert mock_weekly_roundup.call_args[0][0] == ['jackson@bar.com']
+
+    @patch('time.sleep')
+    @patch('marketing.management.commands.roundup.weekly_roundup')
+    def test_handle_resumes_from_checkpoint(self, mock_weekly_roundup, *args):
+        """Test that a run which stopped on a failed batch resumes after the last batch sent."""
+        def send(to_emails, on_sent=None, **kwargs):
+            if to_emails == ['jackson@bar.com'] and mock_weekly_roundup.call_count == 2:
+                raise Exception('SendGrid is down')
+            on_sent(to_emails)
+            return len(to_emails)
+
+        mock_weekly_roundup.side_effect = send
+        call_command('roundup', live=True, run='test', batch_size=1, retries=0)
+        checkpoint = BulkEmailCheckpoint.objects.get(name='test')
+        assert checkpoint.last_email == 'fred@bar.com'
+        assert checkpoint.num_sent == 1
+        assert checkpoint.completed_on is None
+
+        mock_weekly_roundup.reset_mock()
+        call_command('roundup', live=True, run='test', batch_size=2)
+        mock_weekly_roundup.assert_called_once()
+        assert mock_weekly_roundup.call_args[0][0] == ['jackson@bar.com', 'john@bar.com']
+        checkpoint.refresh_from_db()
+        assert checkpoint.num_sent == 3
+        assert checkpoint.completed_on
+
+        # a completed run is not sent again
+        call_command('roundup', live=True, run='test')
+        mock_weekly_roundup.assert_called_once()
+
+    @patch('time.sleep')
+    @patch('marketing.management.commands.roundup.weekly_roundup')
+    def test_handle_retries_unsent_only(self, mock_weekly_roundup, *args):
+        """Test that a batch failing after some of its SendGrid requests is only retried for the rest."""
+        attempts = []
+
+        def send(to_emails, on_sent=None, **kwargs):
+            attempts.append(list(to_emails))
+            on_sent(to_emails[:1])
+            if len(attempts) == 1:
+                raise Exception('SendGrid is down')
+            on_sent(to_emails[1:])
+            return len(to_emails)
 
-        mock_weekly_roundup.assert_called_once_with(['jackson@bar.com'])
+        mock_weekly_roundup.side_effect = send
+        call_command('roundup', live=True, run='test', batch_size=3, retries=1)
+        assert attempts == [['fred@bar.com', 'jackson@bar.com', 'john@bar.com'], ['jackson@bar.com', 'john@bar.com']]
+        checkpoint = BulkEmailCheckpoint.objects.get(name='test')
+        assert checkpoint.num_sent == 3
+        assert checkpoint.batch_sent == []
+        assert checkpoint.completed_on
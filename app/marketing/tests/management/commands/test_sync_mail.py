@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Handle marketing commands related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from marketing.models import EmailSubscriber, SyncWatermark
+from test_plus.test import TestCase
+
+LIST_ID = 'list1'
+
+
+class FakeMailChimp(BaseHTTPRequestHandler):
+    """Serve the list members and batch endpoints of the MailChimp API from memory."""
+
+    members = []
+    requests = []
+    batches = []
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.requests.append((url.path, query))
+        members = self.members
+        if 'since_last_changed' in query:
+            since = parse_datetime(query['since_last_changed'])
+            members = [member for member in members if member['last_changed'] >= since]
+        offset, count = int(query.get('offset', 0)), int(query.get('count', 10))
+        self.respond({
+            'members': [{'email_address': member['email_address']} for member in members[offset:offset + count]],
+            'total_items': len(members),
+        })
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.batches.append(json.loads(body.decode('utf-8')))
+        self.respond({'id': f'batch{len(self.batches)}', 'status': 'pending'})
+
+
+class TestSyncMail(TestCase):
+    """Define tests for sync_mail."""
+
+    def setUp(self):
+        """Start a fake MailChimp server holding five list members."""
+        FakeMailChimp.members = [{
+            'email_address': f'member{i}@bar.com',
+            'last_changed': datetime(2018, 5, 20 + i, tzinfo=timezone.utc),
+        } for i in range(5)]
+        FakeMailChimp.requests = []
+        FakeMailChimp.batches = []
+        self.server = HTTPServer(('127.0.0.1', 0), FakeMailChimp)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.settings_override = override_settings(
+            MAILCHIMP_API_URL=f'http://127.0.0.1:{self.server.server_port}/3.0/',
+            MAILCHIMP_USER='user',
+            MAILCHIMP_API_KEY='0123456789abcdef0123456789abcdef-us1',
+            MAILCHIMP_LIST_ID=LIST_ID,
+            MAILCHIMP_PAGE_SIZE=2,
+            MAILCHIMP_CONCURRENCY=2,
+            MAILCHIMP_BATCH_SIZE=2,
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.server.shutdown()
+        self.server.server_close()
+
+    @patch('marketing.management.commands.sync_mail.bulk_invite_to_slack')
+    def test_full_pull_reads_every_page(self, mock_invite):
+        """Test the first run reads the whole list, a page per request, and records a watermark."""
+        call_command('sync_mail')
+
+        pages = [query for path, query in FakeMailChimp.requests if path == f'/3.0/lists/{LIST_ID}/members']
+        assert sorted(int(query['offset']) for query in pages) == [0, 2, 4]
+        assert not any('since_last_changed' in query for query in pages)
+        assert set(EmailSubscriber.objects.values_list('email', flat=True)) == {
+            f'member{i}@bar.com' for i in range(5)
+        }
+        assert SyncWatermark.get('sync_mail_pull') is not None
+
+    @patch('marketing.management.commands.sync_mail.bulk_invite_to_slack')
+    def test_incremental_pull_reads_changes(self, mock_invite):
+        """Test a run after a previous one only reads the members changed since."""
+        SyncWatermark.advance('sync_mail_pull', datetime(2018, 5, 23, tzinfo=timezone.utc))
+        SyncWatermark.advance('sync_mail_push', timezone.now())
+
+        call_command('sync_mail')
+
+        pages = [query for path, query in FakeMailChimp.requests if path == f'/3.0/lists/{LIST_ID}/members']
+        assert len(pages) == 1
+        assert parse_datetime(pages[0]['since_last_changed']) < datetime(2018, 5, 23, tzinfo=timezone.utc)
+        assert set(EmailSubscriber.objects.values_list('email', flat=True)) == {'member3@bar.com', 'member4@bar.com'}
+        assert SyncWatermark.get('sync_mail_pull') > datetime(2018, 5, 23, tzinfo=timezone.utc)
+
+    @patch('marketing.management.commands.sync_mail.bulk_invite_to_slack')
+    def test_push_uses_batch_operations(self, mock_invite):
+        """Test the new local subscribers are pushed in batch operations, without those pulled from mailchimp."""
+        FakeMailChimp.members = []
+        for i in range(3):
+            EmailSubscriber.objects.create(email=f'local{i}@bar.com', source='mysource')
+        EmailSubscriber.objects.create(email='pulled@bar.com', source='mailchimp')
+
+        call_command('sync_mail')
+
+        assert [len(batch['operations']) for batch in FakeMailChimp.batches] == [2, 1]
+        operations = [operation for batch in FakeMailChimp.batches for operation in batch['operations']]
+        assert {json.loads(operation['body'])['email_address'] for operation in operations} == {
+            f'local{i}@bar.com' for i in range(3)
+        }
+        assert all(operation['method'] == 'PUT' for operation in operations)
+        assert all(operation['path'].startswith(f'lists/{LIST_ID}/members/') for operation in operations)
+        assert SyncWatermark.get('sync_mail_push') is not None
@@ -19,10 +19,13 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 from unittest.mock import patch
 
-from django.utils import timezone
+from django.test import override_settings
+from django.utils import timezone, translation
 
 from dashboard.models import Profile
-from marketing.mails import setup_lang
+from marketing.mails import EMAIL_KEY_SUBSTITUTION, send_bulk_mail, setup_lang, weekly_roundup
+from marketing.models import EmailSubscriber
+from retail.emails import EmailRenderCache
 from test_plus.test import TestCase
 
 
@@ -55,3 +58,60 @@ class MarketingMailsTest(TestCase):
         """Test the marketing mails setup_lang method."""
         setup_lang('bademail@gitcoin.co')
         assert mock_translation_activate.call_count == 0
+
+    @override_settings(SENDGRID_API_KEY='key', SENDGRID_BATCH_SIZE=2, IS_DEBUG_ENV=False)
+    @patch('marketing.mails.get_sendgrid_client')
+    def test_send_bulk_mail(self, mock_get_sendgrid_client):
+        """Test that recipients are sent to in batches, each with their own substitutions."""
+        recipients = [(f'user{i}@gitcoin.co', {EMAIL_KEY_SUBSTITUTION: f'key{i}'}) for i in range(3)]
+        sent = []
+        assert send_bulk_mail('team@gitcoin.co', recipients, 'subject', 'body', on_sent=sent.append) == 3
+        assert sent == [['user0@gitcoin.co', 'user1@gitcoin.co'], ['user2@gitcoin.co']]
+
+        post = mock_get_sendgrid_client.return_value.client.mail.send.post
+        assert post.call_count == 2
+        personalizations = [
+            personalization
+            for call in post.call_args_list for personalization in call[1]['request_body']['personalizations']
+        ]
+        assert [p['to'][0]['email'] for p in personalizations] == [email for email, _ in recipients]
+        assert [p['substitutions'] for p in personalizations] == [substitutions for _, substitutions in recipients]
+
+    @override_settings(SENDGRID_API_KEY='key', IS_DEBUG_ENV=False)
+    @patch('marketing.mails.get_sendgrid_client')
+    @patch('marketing.mails.render_new_bounty_roundup')
+    def test_weekly_roundup_renders_once(self, mock_render, mock_get_sendgrid_client):
+        """Test that the roundup is rendered once and sent to every subscriber in a single request."""
+        mock_render.return_value = (f'<a href="/settings/email/{EMAIL_KEY_SUBSTITUTION}">', 'text', 'subject')
+        to_emails = ['john@bar.com', 'fred@bar.com', self.email]
+        for to_email in to_emails:
+            es = EmailSubscriber.objects.create(email=to_email, source='mysource')
+            es.set_priv()
+            es.save()
+
+        assert weekly_roundup(to_emails) == 3
+        assert mock_render.call_count == 1
+        assert mock_render.call_args[1]['subscriber'].priv == EMAIL_KEY_SUBSTITUTION
+        post = mock_get_sendgrid_client.return_value.client.mail.send.post
+        post.assert_called_once()
+        personalizations = post.call_args[1]['request_body']['personalizations']
+        keys = [p['substitutions'][EMAIL_KEY_SUBSTITUTION] for p in personalizations]
+        assert keys == [EmailSubscriber.objects.get(email=to_email).priv for to_email in to_emails]
+
+    @patch('retail.emails.render_to_string', side_effect=lambda template, params: template)
+    @patch('retail.emails.premailer_transform', side_effect=lambda html: html)
+    def test_email_render_cache(self, mock_premailer_transform, mock_render_to_string):
+        """Test that each variant of an email is rendered and CSS inlined only once."""
+        cache = EmailRenderCache()
+        placeholders = [EmailSubscriber(email=email, priv=EMAIL_KEY_SUBSTITUTION) for email in ['a@b.co', 'c@d.co']]
+        for placeholder in placeholders:
+            params = {'subscriber': placeholder, 'keywords': 'python'}
+            assert cache.render('new_bounty', params) == ('emails/new_bounty.html', 'emails/new_bounty.txt')
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert mock_premailer_transform.call_count == 1
+
+        cache.render('new_bounty', {'subscriber': placeholders[0], 'keywords': 'rust'})
+        with translation.override('es'):
+            cache.render('new_bounty', {'subscriber': placeholders[0], 'keywords': 'python'})
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert mock_premailer_transform.call_count == 3
@@ -17,8 +17,15 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
+from unittest.mock import patch
+
+from django.test import override_settings
+
 from marketing.models import EmailSubscriber, Stat
-from marketing.utils import get_or_save_email_subscriber, get_stat, should_suppress_notification_email
+from marketing.utils import (
+    TokenBucket, bulk_save_email_subscribers, get_or_save_email_subscriber, get_stat, get_suppressed_emails,
+    should_suppress_notification_email,
+)
 from test_plus.test import TestCase
 
 
@@ -72,6 +79,23 @@ class MarketingEmailUtilsTest(TestCase):
         assert not should_suppress_notification_email('emailSubscriber2@gitcoin.co')
         assert should_suppress_notification_email('emailSubscriber3@gitcoin.co')
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_get_suppressed_emails(self):
+        """Test that the preferences of a list of addresses are loaded with one query and then served from the cache."""
+        emails = ['EMAILSUBSCRIBER1@gitcoin.co', 'emailsubscriber3@Gitcoin.co', 'nobody@gitcoin.co']
+        with self.assertNumQueries(1):
+            assert get_suppressed_emails(emails) == {'emailsubscriber3@Gitcoin.co'}
+        with self.assertNumQueries(0):
+            assert should_suppress_notification_email('emailSubscriber3@gitcoin.co')
+            assert not should_suppress_notification_email('nobody@gitcoin.co', 'roundup')
+            assert get_suppressed_emails(emails, 'urgent') == set()
+
+        # saving a subscriber drops its cached preferences
+        es = EmailSubscriber.objects.get(email='emailSubscriber3@gitcoin.co')
+        es.preferences = {}
+        es.save()
+        assert not should_suppress_notification_email('emailSubscriber3@gitcoin.co')
+
     def test_get_of_get_or_save_email_subscriber(self):
         """Test the marketing util get_or_save_email_subscriber method."""
         es = get_or_save_email_subscriber('emailSubscriber1@gitcoin.co', 'mysource')
@@ -87,3 +111,52 @@ class MarketingEmailUtilsTest(TestCase):
             get_or_save_email_subscriber('newemail@gitcoin.co', 'mysource', send_slack_invite=False))
 
         assert EmailSubscriber.objects.filter().count() == 4
+
+    def test_bulk_save_email_subscribers(self):
+        """Test that subscribers are deduplicated case insensitively and upserted in one query."""
+        entries = [
+            ('new@gitcoin.co', 'profile_email', None),
+            ('EMAILSUBSCRIBER1@gitcoin.co', 'mailchimp', None),
+            ('New@Gitcoin.co', 'tip_usage', None),
+            ('', 'tip_usage', None),
+        ]
+        with self.assertNumQueries(1):
+            created = bulk_save_email_subscribers(entries)
+
+        assert created == ['New@Gitcoin.co']
+        assert EmailSubscriber.objects.count() == 4
+        existing = EmailSubscriber.objects.get(normalized_email='emailsubscriber1@gitcoin.co')
+        assert (existing.email, existing.source, existing.priv) == ('EMAILSUBSCRIBER1@gitcoin.co', 'mailchimp', 'priv1')
+        new = EmailSubscriber.objects.get(normalized_email='new@gitcoin.co')
+        assert (new.email, new.source) == ('New@Gitcoin.co', 'tip_usage')
+        assert new.priv and new.active and new.newsletter
+
+        assert bulk_save_email_subscribers([('new@gitcoin.co', 'match', None)]) == []
+        assert EmailSubscriber.objects.get(normalized_email='new@gitcoin.co').priv == new.priv
+
+    def test_surrounding_whitespace_shares_subscriber(self):
+        """Test that the bulk and single saves key a padded email to the same subscriber."""
+        bulk_save_email_subscribers([(' Padded@gitcoin.co ', 'mailchimp', None)])
+        es = get_or_save_email_subscriber('padded@gitcoin.co', 'settings', send_slack_invite=False)
+
+        assert es.normalized_email == 'padded@gitcoin.co'
+        assert EmailSubscriber.objects.filter(normalized_email='padded@gitcoin.co').count() == 1
+        assert EmailSubscriber.objects.count() == 4
+
+
+class TokenBucketTest(TestCase):
+    """Define tests for the marketing TokenBucket rate limiter."""
+
+    @patch('marketing.utils.time')
+    def test_token_bucket(self, mock_time):
+        """Test that bursts up to the capacity pass and that later calls wait for the bucket to refill."""
+        mock_time.monotonic.return_value = 100
+        bucket = TokenBucket(2, capacity=2)
+        assert bucket.take() == 0
+        assert bucket.take() == 0
+        assert bucket.take() == 0.5
+        assert bucket.take() == 1
+        mock_time.sleep.assert_called_with(1)
+
+        mock_time.monotonic.return_value = 110
+        assert bucket.take() == 0
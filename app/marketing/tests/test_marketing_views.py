@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Handle marketing view related tests.
+
+Copyright (C) 2018 Gitcoin Core
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from dashboard.models import Profile
+from marketing.models import EmailSubscriber
+from test_plus.test import TestCase
+
+
+class MarketingSettingsViewsTest(TestCase):
+    """Define tests for the marketing settings views."""
+
+    def test_email_settings_bad_key_reuses_subscriber(self):
+        """Test that a bad key falls back to the user's existing subscription instead of adding another."""
+        user = self.make_user('fred')
+        user.email = 'Fred@Bedrock.example'
+        user.save()
+        Profile.objects.create(handle='fred', data={}, email='fred@bedrock.example', user=user)
+        subscriber = EmailSubscriber.objects.create(email='fred@bedrock.example', source='mailchimp', priv='priv1')
+        self.client.force_login(user)
+
+        response = self.client.get('/settings/email/badkey')
+
+        assert response.status_code == 200
+        assert EmailSubscriber.objects.count() == 1
+        assert response.context['es'].pk == subscriber.pk
@@ -17,11 +17,18 @@
 
 '''
 import logging
+import time
+from collections import OrderedDict
+from secrets import token_hex
+from threading import Lock
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
+from economy.models import get_time
 from marketing.models import EmailSubscriber, Stat
 from slackclient import SlackClient
 from slackclient.exceptions import SlackClientError
@@ -29,6 +36,43 @@ from slackclient.exceptions import SlackClientError
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket(object):
+    """Limit the rate of calls to an external service, allowing short bursts.
+
+    Tokens refill continuously at `rate` per second, up to `capacity`. A call
+    taking a token from an empty bucket waits for it instead of failing.
+
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(self.rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = Lock()
+
+    def take(self, tokens=1):
+        """Take tokens from the bucket, waiting until they are available.
+
+        Args:
+            tokens (int): The number of tokens to take.
+
+        Returns:
+            float: The seconds waited.
+
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # the tokens are reserved right away, so concurrent callers queue up behind each other
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
 def get_stat(key):
     return Stat.objects.filter(key=key).order_by('-created_on').first().val
 
@@ -99,21 +143,80 @@ def validate_slack_integration(token, channel, message=None, icon_url=''):
     return result
 
 
-def should_suppress_notification_email(email, _type='transactional'):
-    queryset = EmailSubscriber.objects.filter(email__iexact=email)
-    if queryset.exists():
-        level = queryset.first().preferences.get('level', '')
-        if _type in ['urgent', 'admin']:
-            return False # these email types are always sent
-        if level == 'nothing':
-            return True
-        if level == 'lite1' and _type == 'transactional':
-            return True
-        if level == 'lite' and _type == 'roundup':
-            return True
+def get_email_preferences(emails):
+    """Get the notification preferences of many email addresses at once.
+
+    Preferences are served from the cache for EMAIL_PREFERENCES_CACHE_TIMEOUT
+    seconds, and the rest are read with a single query on the normalized email.
+
+    Args:
+        emails (iterable of str): The email addresses, matched case insensitively.
+
+    Returns:
+        dict: The preferences keyed by normalized email, which are empty for
+            addresses without a subscriber.
+
+    """
+    normalized_emails = set(EmailSubscriber.normalize_email(email) for email in emails)
+    keys = {EmailSubscriber.preferences_cache_key(normalized_email): normalized_email
+            for normalized_email in normalized_emails}
+    preferences = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+    missing = normalized_emails - set(preferences)
+    if missing:
+        loaded = {normalized_email: {} for normalized_email in missing}
+        # the oldest subscriber wins, as the first() of an email__iexact lookup did
+        subscribers = EmailSubscriber.objects.filter(normalized_email__in=missing).order_by('-pk')
+        for normalized_email, subscriber_preferences in subscribers.values_list('normalized_email', 'preferences'):
+            loaded[normalized_email] = subscriber_preferences or {}
+        cache.set_many({
+            EmailSubscriber.preferences_cache_key(normalized_email): subscriber_preferences
+            for normalized_email, subscriber_preferences in loaded.items()
+        }, timeout=settings.EMAIL_PREFERENCES_CACHE_TIMEOUT)
+        preferences.update(loaded)
+    return preferences
+
+
+def is_suppressed_by_preferences(preferences, _type='transactional'):
+    if _type in ['urgent', 'admin']:
+        return False # these email types are always sent
+    level = preferences.get('level', '')
+    if level == 'nothing':
+        return True
+    if level == 'lite1' and _type == 'transactional':
+        return True
+    if level == 'lite' and _type == 'roundup':
+        return True
     return False
 
 
+def should_suppress_notification_email(email, _type='transactional'):
+    if _type in ['urgent', 'admin']:
+        return False # these email types are always sent
+    preferences = get_email_preferences([email]).get(EmailSubscriber.normalize_email(email), {})
+    return is_suppressed_by_preferences(preferences, _type)
+
+
+def get_suppressed_emails(emails, _type='transactional'):
+    """Get which of the provided addresses should not be sent emails of the type, with one query at most.
+
+    Args:
+        emails (list of str): The email addresses.
+        _type (str): The type of email, as passed to should_suppress_notification_email.
+
+    Returns:
+        set of str: The suppressed addresses, as provided.
+
+    """
+    if _type in ['urgent', 'admin']:
+        return set()
+    preferences = get_email_preferences(emails)
+    return set(
+        email for email in emails
+        if is_suppressed_by_preferences(preferences.get(EmailSubscriber.normalize_email(email), {}), _type)
+    )
+
+
 def get_or_save_email_subscriber(email, source, send_slack_invite=True, profile=None):
     defaults = {'source': source, 'email': email}
 
@@ -121,15 +224,9 @@ def get_or_save_email_subscriber(email, source, send_slack_invite=True, profile=
         defaults['profile'] = profile
 
     try:
-        es, created = EmailSubscriber.objects.update_or_create(email__iexact=email, defaults=defaults)
+        es, created = EmailSubscriber.objects.update_or_create(
+            normalized_email=EmailSubscriber.normalize_email(email), defaults=defaults)
         print("EmailSubscriber:", es, "- created" if created else "- updated")
-    except EmailSubscriber.MultipleObjectsReturned:
-        email_subscriber_ids = EmailSubscriber.objects.filter(email__iexact=email) \
-            .values_list('id', flat=True) \
-            .order_by('-created_on')[1:]
-        EmailSubscriber.objects.filter(pk__in=list(email_subscriber_ids)).delete()
-        es = EmailSubscriber.objects.get(email__iexact=email)
-        created = False
     except Exception as e:
         print(f'Failed to update or create email subscriber: ({email}) - {e}')
         return ''
@@ -141,3 +238,87 @@ def get_or_save_email_subscriber(email, source, send_slack_invite=True, profile=
             invite_to_slack(email)
 
     return es
+
+
+def bulk_save_email_subscribers(entries, chunk_size=1000):
+    """Save many email subscribers at once, as get_or_save_email_subscriber does one at a time.
+
+    Entries are deduplicated case insensitively, the last of each email
+    winning as it would if saved in turn, and upserted with one
+    `INSERT ... ON CONFLICT` on the normalized email per chunk. Only new
+    subscribers and those without one are given a private key.
+
+    Args:
+        entries (iterable of tuple): The (email, source, profile) of each subscriber, where
+            profile is a dashboard.models.Profile or None to keep the current one.
+        chunk_size (int): The number of subscribers upserted per query.
+
+    Returns:
+        list of str: The email of each subscriber created.
+
+    """
+    subscribers = OrderedDict()
+    for email, source, profile in entries:
+        normalized_email = EmailSubscriber.normalize_email(email)
+        if not normalized_email:
+            continue
+        profile_id = getattr(profile, 'pk', profile)
+        if not profile_id and normalized_email in subscribers:
+            profile_id = subscribers[normalized_email][3]
+        subscribers.pop(normalized_email, None)
+        subscribers[normalized_email] = (email.strip()[:255], normalized_email[:255], source[:50], profile_id)
+
+    table = EmailSubscriber._meta.db_table
+    sql = """
+        INSERT INTO {table} (
+            created_on, modified_on, email, normalized_email, source, profile_id, priv,
+            active, newsletter, preferences, metadata, github, keywords
+        )
+        VALUES {values}
+        ON CONFLICT (normalized_email) DO UPDATE SET
+            modified_on = EXCLUDED.modified_on,
+            email = EXCLUDED.email,
+            source = EXCLUDED.source,
+            profile_id = COALESCE(EXCLUDED.profile_id, {table}.profile_id),
+            priv = CASE WHEN {table}.priv = '' THEN EXCLUDED.priv ELSE {table}.priv END
+        RETURNING email, xmax = 0
+    """
+    row = "(%s, %s, %s, %s, %s, %s, %s, true, true, '{}'::jsonb, '{}'::jsonb, '', '{}'::varchar(200)[])"
+
+    created = []
+    rows = list(subscribers.values())
+    now = get_time()
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        params = []
+        for email, normalized_email, source, profile_id in chunk:
+            params += [now, now, email, normalized_email, source, profile_id, token_hex(16)[:29]]
+        with connection.cursor() as cursor:
+            cursor.execute(sql.format(table=table, values=', '.join([row] * len(chunk))), params)
+            created += [email for email, inserted in cursor.fetchall() if inserted]
+    print(f"EmailSubscriber: {len(rows)} saved, {len(created)} created")
+    return created
+
+
+def bulk_invite_to_slack(emails, rate_limiter=None):
+    """Invite the provided email addresses to the Gitcoin Slack, one request each.
+
+    Args:
+        emails (list of str): The email addresses to invite.
+        rate_limiter (TokenBucket): Limits the rate of requests to Slack.
+            Defaults to: one request a second.
+
+    Returns:
+        int: The number of invites sent.
+
+    """
+    rate_limiter = rate_limiter or TokenBucket(1)
+    invited = 0
+    for email in emails:
+        rate_limiter.take()
+        try:
+            response = invite_to_slack(email)
+            invited += 1 if response.get('ok') else 0
+        except Exception as e:
+            logger.error(f'Failed to invite {email} to slack - {e}')
+    return invited
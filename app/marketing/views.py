@@ -101,12 +101,7 @@ def settings_helper_get_auth(request, key=None):
     # lazily create email settings if needed
     if not es:
         if request.user.is_authenticated and request.user.email:
-            es = EmailSubscriber.objects.create(
-                email=request.user.email,
-                source='settings_page',
-            )
-            es.set_priv()
-            es.save()
+            es = get_or_save_email_subscriber(request.user.email, 'settings_page', send_slack_invite=False)
 
     return profile, es, request.user, is_logged_in
 
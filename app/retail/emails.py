@@ -16,22 +16,28 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 '''
+import hashlib
+import json
 import logging
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
 from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.template.loader import render_to_string
 from django.template.response import TemplateResponse
-from django.utils import timezone
+from django.utils import timezone, translation
 
 import cssutils
 import premailer
 from marketing.utils import get_or_save_email_subscriber
 from retail.utils import strip_double_chars, strip_html
 
+logger = logging.getLogger(__name__)
+
 # RENDERERS
 
 
@@ -40,6 +46,106 @@ def premailer_transform(html):
     return premailer.transform(html)
 
 
+class ContextEncoder(DjangoJSONEncoder):
+    """Serialize the context of an email, standing in model instances and querysets by their primary keys."""
+
+    def default(self, o):
+        if isinstance(o, models.Model):
+            return [o._meta.label, o.pk]
+        if isinstance(o, models.QuerySet):
+            # evaluates the queryset, whose cached rows are then reused by the template
+            return [o.model._meta.label] + [obj.pk for obj in o]
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def hash_context(params):
+    """Hash the context an email is rendered from.
+
+    The subscriber only counts through the private key the templates link to,
+    so emails rendered for a placeholder subscriber hash the same.
+
+    Args:
+        params (dict): The template context.
+
+    Returns:
+        str: The hex SHA-256 digest of the context.
+
+    """
+    if 'subscriber' in params:
+        params = dict(params, subscriber=getattr(params['subscriber'], 'priv', None))
+    serialized = json.dumps(params, sort_keys=True, cls=ContextEncoder)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class EmailRenderCache(object):
+    """Render each variant of an email sent in bulk only once.
+
+    Variants are keyed by template, active language and context hash. An
+    email rendered for a placeholder subscriber is the same for every
+    recipient, who then only differ by the substitutions SendGrid makes.
+
+    """
+
+    def __init__(self):
+        self.renders = {}
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        return f"{len(self.renders)} variants rendered, {self.hits} hits, {self.misses} misses"
+
+    def memoize(self, name, build):
+        """Get a value shared by every variant, such as the result of a query, building it on first use."""
+        if name not in self.values:
+            self.values[name] = build()
+        return self.values[name]
+
+    def render(self, template, params):
+        """Render the html, with its CSS inlined, and the text of an email, unless this variant was rendered already.
+
+        Args:
+            template (str): The name of the template in `emails/`, without extension.
+            params (dict): The template context.
+
+        Returns:
+            tuple: The html and text of the email.
+
+        """
+        key = (template, translation.get_language(), hash_context(params))
+        if key in self.renders:
+            self.hits += 1
+            logger.debug(f'email render cache hit for {key}')
+            return self.renders[key]
+        self.misses += 1
+        logger.debug(f'email render cache miss for {key}')
+        self.renders[key] = render_email(template, params)
+        return self.renders[key]
+
+
+def render_email(template, params, cache=None):
+    """Render the html, with its CSS inlined, and the text of an email.
+
+    Args:
+        template (str): The name of the template in `emails/`, without extension.
+        params (dict): The template context.
+        cache (EmailRenderCache): Serves the variants rendered already.
+            Defaults to: None, rendering every time.
+
+    Returns:
+        tuple: The html and text of the email.
+
+    """
+    if cache:
+        return cache.render(template, params)
+    response_html = premailer_transform(render_to_string(f"emails/{template}.html", params))
+    response_txt = render_to_string(f"emails/{template}.txt", params)
+    return response_html, response_txt
+
+
 def render_tip_email(to_email, tip, is_new):
     warning = tip.network if tip.network != 'mainnet' else ""
     params = {
@@ -153,8 +259,8 @@ kevin
     return response_html, response_txt
 
 
-def render_new_bounty(to_email, bounties, old_bounties):
-    sub = get_or_save_email_subscriber(to_email, 'internal')
+def render_new_bounty(to_email, bounties, old_bounties, subscriber=None, cache=None):
+    sub = subscriber or get_or_save_email_subscriber(to_email, 'internal')
     params = {
         'old_bounties': old_bounties,
         'bounties': bounties,
@@ -162,10 +268,7 @@ def render_new_bounty(to_email, bounties, old_bounties):
         'keywords': ",".join(sub.keywords),
     }
 
-    response_html = premailer_transform(render_to_string("emails/new_bounty.html", params))
-    response_txt = render_to_string("emails/new_bounty.txt", params)
-
-    return response_html, response_txt
+    return render_email('new_bounty', params, cache=cache)
 
 
 def render_new_work_submission(to_email, bounty):
@@ -298,9 +401,33 @@ def render_bounty_startwork_expired(to_email, bounty, interest, time_delta_days)
 
 
 # ROUNDUP_EMAIL
-def render_new_bounty_roundup(to_email):
+def get_roundup_featured_bounties():
+    """Get the bounties featured in the weekly roundup, and a random pick of this week's ecosystem bounties."""
     from dashboard.models import Bounty
     from external_bounties.models import ExternalBounty
+
+    bounties = [
+        {
+            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/ethereum/casper/issues/66'),
+            'primer': 'Casper FFG is a priority of the Ethereum Ecosystem! Help contribute directly to development here.',
+        },
+        {
+            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/uport-project/buidlbox/issues/3'),
+            'primer': 'Wyvern is looking to build out a web design for their smart contract marketplace. ',
+        },
+        {
+            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/ProjectWyvern/frontends/issues/1'),
+            'primer': 'uPort is searching for ideas for applications which can be built on top of their platform! ',
+        },
+    ]
+
+    ecosystem_bounties = list(
+        ExternalBounty.objects.filter(created_on__gt=timezone.now() - timezone.timedelta(weeks=1)).order_by('?')[0:5]
+    )
+    return bounties, ecosystem_bounties
+
+
+def render_new_bounty_roundup(to_email, subscriber=None, cache=None):
     subject = "Hiring is Broken | Web3 Hiring Can Fix That! "
 
     intro = '''
@@ -358,22 +485,11 @@ ConsenSys Academy’s 2018 Developer Program is here. <a href="https://consensys
         },
     ]
 
-    bounties = [
-        {
-            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/ethereum/casper/issues/66'),
-            'primer': 'Casper FFG is a priority of the Ethereum Ecosystem! Help contribute directly to development here.',
-        },
-        {
-            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/uport-project/buidlbox/issues/3'),
-            'primer': 'Wyvern is looking to build out a web design for their smart contract marketplace. ',
-        },
-        {
-            'obj': Bounty.objects.get(current_bounty=True, github_url__iexact='https://github.com/ProjectWyvern/frontends/issues/1'),
-            'primer': 'uPort is searching for ideas for applications which can be built on top of their platform! ',
-        },
-    ]
-
-    ecosystem_bounties = ExternalBounty.objects.filter(created_on__gt=timezone.now() - timezone.timedelta(weeks=1)).order_by('?')[0:5]
+    # queried once per bulk send, so that every recipient gets the same picks
+    if cache:
+        bounties, ecosystem_bounties = cache.memoize('roundup_featured_bounties', get_roundup_featured_bounties)
+    else:
+        bounties, ecosystem_bounties = get_roundup_featured_bounties()
 
     params = {
         'intro': intro,
@@ -383,11 +499,10 @@ ConsenSys Academy’s 2018 Developer Program is here. <a href="https://consensys
         'invert_footer': False,
         'hide_header': False,
         'highlights': highlights,
-        'subscriber': get_or_save_email_subscriber(to_email, 'internal'),
+        'subscriber': subscriber or get_or_save_email_subscriber(to_email, 'internal'),
     }
 
-    response_html = premailer_transform(render_to_string("emails/bounty_roundup.html", params))
-    response_txt = render_to_string("emails/bounty_roundup.txt", params)
+    response_html, response_txt = render_email('bounty_roundup', params, cache=cache)
 
     return response_html, response_txt, subject
 